@@ -7,6 +7,7 @@
 """
 
 from app import create_app
+from app.services.warmup_service import start_warmup
 
 # 애플리케이션 팩토리를 사용하여 앱 생성
 # 모든 설정, 로깅, 에러 핸들러, 라우트는 app/__init__.py에서 처리됩니다.
@@ -15,10 +16,15 @@ from app import create_app
 if __name__ == "__main__":
     # 애플리케이션 생성 (모든 초기화는 app/__init__.py에서 처리)
     app = create_app()
+    use_reloader = app.config["DEBUG"]
+    
+    # 캐시 예열은 서버를 실행하는 프로세스에서만 시작
+    start_warmup(app, use_reloader=use_reloader)
     
     # 개발 서버 실행
     app.run(
         host=app.config["HOST"],
         port=app.config["PORT"],
-        debug=app.config["DEBUG"]
+        debug=app.config["DEBUG"],
+        use_reloader=use_reloader
     )
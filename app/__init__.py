@@ -6,7 +6,9 @@ from config import get_config
 from app.utils.logger import setup_logging
 from app.utils.error_handlers import register_error_handlers
 from app.utils.cache import init_cache
-from app.database import db
+from app.utils.http_cache import init_compression
+from app.utils.templates import init_templates, precompile_templates
+from app.database import db, configure_sqlite, init_db
 
 
 def create_app(config_name: str = None) -> Flask:
@@ -34,19 +36,25 @@ def create_app(config_name: str = None) -> Flask:
     config = get_config(config_name)
     app.config.from_object(config)
     
-    # 데이터베이스 초기화
-    db.init_app(app)
+    # 템플릿 바이트코드 캐시 설정 (Jinja 환경이 생성되기 전에 적용)
+    init_templates(app)
     
-    # 데이터베이스 테이블 생성 (개발 환경에서만 자동 생성)
-    with app.app_context():
-        db.create_all()
+    # 데이터베이스 초기화 (SQLite 엔진 프로필은 엔진 생성 전에 적용)
+    configure_sqlite(app)
+    db.init_app(app)
     
     # 로깅 설정
     setup_logging(app)
     
+    # 데이터베이스 테이블 생성 (이전 스키마는 마이그레이션)
+    init_db(app)
+    
     # 캐시 초기화
     init_cache(app)
     
+    # 응답 압축 초기화
+    init_compression(app)
+    
     # 에러 핸들러 등록
     register_error_handlers(app)
     
@@ -54,6 +62,10 @@ def create_app(config_name: str = None) -> Flask:
     from app.utils.formatters import format_time
     app.jinja_env.filters['format_time'] = format_time
     
+    # 템플릿 사전 컴파일 (첫 요청이 템플릿 컴파일 비용을 치르지 않도록)
+    if app.config.get("TEMPLATE_PRECOMPILE", True):
+        precompile_templates(app)
+    
     # Blueprint 라우트 등록
     from app.routes import main_bp, pr_bp, api_bp
     app.register_blueprint(main_bp)
@@ -73,6 +85,10 @@ def create_app(config_name: str = None) -> Flask:
         from app.routes.api_routes import health
         return health()
     
+    # 캐시 예열 스케줄러 생성 (시작은 서버 진입점 또는 WARMUP_AUTOSTART)
+    from app.services.warmup_service import init_warmup
+    init_warmup(app)
+    
     app.logger.info('ViewReview 애플리케이션 초기화 완료')
     
     return app
@@ -1,7 +1,11 @@
 """데이터베이스 모델 정의"""
 
+import sqlite3
+
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+from sqlalchemy import MetaData, Table, event, inspect, select, text
+from sqlalchemy.engine import make_url
 
 # SQLAlchemy 인스턴스 생성 (app/__init__.py에서 초기화됨)
 db = SQLAlchemy()
@@ -11,6 +15,7 @@ class CommentCheck(db.Model):
     """코멘트 체크 상태를 저장하는 모델
     
     각 PR의 코멘트에 대한 사용자의 대응 완료 여부를 저장합니다.
+    (repo_owner, repo_name, pr_number, comment_id)로 식별되므로 여러 저장소를 함께 사용해도 섞이지 않습니다.
     """
     
     __tablename__ = 'comment_checks'
@@ -18,14 +23,14 @@ class CommentCheck(db.Model):
     # 기본 키
     id = db.Column(db.Integer, primary_key=True)
     
-    # PR 및 코멘트 식별 정보
-    pr_number = db.Column(db.Integer, nullable=False, index=True)
-    comment_id = db.Column(db.String(100), nullable=False, index=True)
-    
     # 저장소 정보 (PR이 속한 저장소)
     repo_owner = db.Column(db.String(200), nullable=False)
     repo_name = db.Column(db.String(200), nullable=False)
     
+    # PR 및 코멘트 식별 정보 (comment_id는 GitHub 리뷰 코멘트의 databaseId)
+    pr_number = db.Column(db.Integer, nullable=False)
+    comment_id = db.Column(db.BigInteger, nullable=False)
+    
     # 체크 상태
     is_checked = db.Column(db.Boolean, default=True, nullable=False)
     
@@ -33,9 +38,14 @@ class CommentCheck(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
-    # 복합 유니크 제약조건: 같은 PR의 같은 코멘트는 하나의 레코드만 존재
     __table_args__ = (
-        db.UniqueConstraint('pr_number', 'comment_id', name='uq_pr_comment'),
+        # 복합 유니크 제약조건: 같은 저장소/PR의 같은 코멘트는 하나의 레코드만 존재 (upsert 충돌 대상)
+        db.UniqueConstraint('repo_owner', 'repo_name', 'pr_number', 'comment_id', name='uq_repo_pr_comment'),
+        # PR별 체크 목록 조회를 테이블 접근 없이 인덱스만으로 처리하기 위한 커버링 인덱스
+        db.Index(
+            'ix_comment_checks_pr_checked',
+            'repo_owner', 'repo_name', 'pr_number', 'is_checked', 'comment_id', 'updated_at'
+        ),
     )
     
     def to_dict(self):
@@ -52,5 +62,190 @@ class CommentCheck(db.Model):
         }
     
     def __repr__(self):
-        return f"<CommentCheck(pr={self.pr_number}, comment={self.comment_id}, checked={self.is_checked})>"
+        return (
+            f"<CommentCheck(repo={self.repo_owner}/{self.repo_name}, pr={self.pr_number}, "
+            f"comment={self.comment_id}, checked={self.is_checked})>"
+        )
+
+
+class CacheEntry(db.Model):
+    """영속 캐시 항목 모델
+
+    DatabaseCache 백엔드(app/utils/cache_backends.py)가 사용하는 테이블입니다.
+    값은 pickle로 직렬화되며, 크기가 크면 zlib으로 압축되어 저장됩니다.
+    """
+    
+    __tablename__ = 'cache_entries'
+    
+    # 캐시 키 (버전 접두사 포함)
+    key = db.Column(db.String(255), primary_key=True)
+    
+    # 직렬화된 값과 압축 여부
+    value = db.Column(db.LargeBinary, nullable=False)
+    compressed = db.Column(db.Boolean, default=False, nullable=False)
+    
+    # 만료 시각 (Unix timestamp, None이면 만료 없음)
+    expires_at = db.Column(db.Float, nullable=True, index=True)
+    
+    # 키 버전 (CACHE_KEY_VERSION)
+    version = db.Column(db.String(20), nullable=False)
+    
+    # 마지막 저장 시각 (Unix timestamp)
+    updated_at = db.Column(db.Float, nullable=False)
+    
+    def __repr__(self):
+        return f"<CacheEntry(key={self.key}, expires_at={self.expires_at})>"
+
+
+class CacheTag(db.Model):
+    """캐시 태그 소속 모델
+
+    DatabaseCache 백엔드가 태그별 캐시 키 목록을 (tag, key) 한 행씩 저장하는 테이블입니다.
+    여러 워커 프로세스가 동시에 등록해도 서로의 키를 덮어쓰지 않으며,
+    항목과 같은 만료 시각을 가져 정리(purge) 시 함께 삭제됩니다.
+    """
+    
+    __tablename__ = 'cache_tags'
+    
+    # 태그와 캐시 키 (버전 접두사 포함)
+    tag = db.Column(db.String(255), primary_key=True)
+    key = db.Column(db.String(255), primary_key=True)
+    
+    # 만료 시각 (Unix timestamp, None이면 만료 없음)
+    expires_at = db.Column(db.Float, nullable=True, index=True)
+    
+    # 키 버전 (CACHE_KEY_VERSION)
+    version = db.Column(db.String(20), nullable=False)
+    
+    def __repr__(self):
+        return f"<CacheTag(tag={self.tag}, key={self.key})>"
+
+
+def _migrate_comment_checks(app) -> None:
+    """
+    이전 형식의 comment_checks 테이블을 새 스키마로 옮긴다.
+    
+    이전 테이블은 (pr_number, comment_id) 유니크 제약과 문자열 comment_id를 사용했다.
+    새 테이블을 만든 뒤 숫자 comment_id를 가진 레코드만 정수로 변환해 복사한다.
+    """
+    inspector = inspect(db.engine)
+    if not inspector.has_table(CommentCheck.__tablename__):
+        return
+    
+    unique_columns = [
+        constraint["column_names"]
+        for constraint in inspector.get_unique_constraints(CommentCheck.__tablename__)
+    ]
+    if ["repo_owner", "repo_name", "pr_number", "comment_id"] in unique_columns:
+        return
+    
+    app.logger.info("comment_checks 테이블을 저장소 단위 스키마로 마이그레이션합니다.")
+    
+    legacy = "comment_checks_legacy"
+    legacy_indexes = [index["name"] for index in inspector.get_indexes(CommentCheck.__tablename__)]
+    with db.engine.begin() as conn:
+        conn.execute(text(f"ALTER TABLE comment_checks RENAME TO {legacy}"))
+        # 이전 테이블의 인덱스 이름이 새 테이블과 겹치지 않도록 제거
+        for index_name in legacy_indexes:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+    
+    CommentCheck.__table__.create(db.engine)
+    
+    with db.engine.begin() as conn:
+        legacy_table = Table(legacy, MetaData(), autoload_with=conn)
+        rows = conn.execute(
+            select(*(legacy_table.c[column] for column in (
+                "repo_owner", "repo_name", "pr_number", "comment_id",
+                "is_checked", "created_at", "updated_at",
+            )))
+        ).mappings().all()
+        
+        migrated = [
+            dict(row, comment_id=int(row["comment_id"]))
+            for row in rows
+            if str(row["comment_id"]).isdigit()
+        ]
+        if migrated:
+            conn.execute(CommentCheck.__table__.insert(), migrated)
+        conn.execute(text(f"DROP TABLE {legacy}"))
+    
+    app.logger.info(f"comment_checks 마이그레이션 완료: {len(migrated)}/{len(rows)}개 레코드")
+
 
+def _is_file_sqlite(uri: str) -> bool:
+    """파일 기반 SQLite 데이터베이스 URI인지 확인 (메모리 DB 제외)"""
+    url = make_url(uri)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def configure_sqlite(app) -> None:
+    """
+    SQLite 엔진 프로필 적용 (db.init_app 이전에 호출)
+    
+    파일 기반 SQLite를 사용할 때 여러 스레드/프로세스가 동시에 쓰더라도
+    "database is locked" 없이 기다렸다가 처리되도록 엔진 옵션을 설정합니다.
+    연결마다 적용할 PRAGMA는 init_db에서 엔진에 등록됩니다.
+    
+    - 연결 풀: 스레드 간 연결 재사용 (SQLITE_POOL_SIZE, SQLITE_MAX_OVERFLOW)
+    - busy timeout: 잠금이 풀릴 때까지 대기 (SQLITE_BUSY_TIMEOUT_MS)
+    
+    Args:
+        app: Flask 애플리케이션
+    """
+    if not app.config.get("SQLITE_TUNING", True):
+        return
+    if not _is_file_sqlite(app.config.get("SQLALCHEMY_DATABASE_URI", "")):
+        return
+    
+    options = dict(app.config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    connect_args = dict(options.get("connect_args") or {})
+    
+    # 드라이버 수준의 잠금 대기 시간 (초), 풀의 연결은 여러 스레드에서 번갈아 사용
+    connect_args.setdefault("timeout", app.config.get("SQLITE_BUSY_TIMEOUT_MS", 15000) / 1000)
+    connect_args.setdefault("check_same_thread", False)
+    
+    options["connect_args"] = connect_args
+    options.setdefault("pool_size", app.config.get("SQLITE_POOL_SIZE", 5))
+    options.setdefault("max_overflow", app.config.get("SQLITE_MAX_OVERFLOW", 10))
+    options.setdefault("pool_timeout", app.config.get("SQLITE_POOL_TIMEOUT", 30))
+    
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = options
+
+
+def _register_sqlite_pragmas(app) -> None:
+    """SQLite 연결이 만들어질 때마다 PRAGMA를 적용하도록 엔진에 등록 (앱 컨텍스트 안에서 호출)"""
+    if not app.config.get("SQLITE_TUNING", True):
+        return
+    if not _is_file_sqlite(app.config.get("SQLALCHEMY_DATABASE_URI", "")):
+        return
+    
+    pragmas = {
+        "journal_mode": app.config.get("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": app.config.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": int(app.config.get("SQLITE_BUSY_TIMEOUT_MS", 15000)),
+    }
+    
+    def set_pragmas(dbapi_connection, connection_record):
+        if not isinstance(dbapi_connection, sqlite3.Connection):
+            return
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+    
+    event.listen(db.engine, "connect", set_pragmas)
+
+
+def init_db(app) -> None:
+    """
+    데이터베이스 초기화 (SQLite PRAGMA 등록, 이전 스키마 마이그레이션 후 테이블 생성)
+    
+    Args:
+        app: Flask 애플리케이션 (db.init_app 이후)
+    """
+    with app.app_context():
+        _register_sqlite_pragmas(app)
+        _migrate_comment_checks(app)
+        db.create_all()
@@ -1,23 +1,55 @@
 """API 엔드포인트 라우트"""
 
-from flask import Blueprint, request, jsonify
+import queue
+
+from flask import Blueprint, Response, request, jsonify
 from flask import current_app
 
 from app.services.comment_service import CommentService
 from app.services.pr_service import PRService
-from app.utils.validators import validate_pr_number, validate_comment_body
+from app.services.check_service import CheckService
+from app.services.dashboard_service import DashboardService
+from app.services.live_service import get_live_service
+from app.services.warmup_service import get_warmup_status
+from github.ratelimit import get_governor
+from app.utils.validators import (
+    validate_pr_number,
+    validate_comment_body,
+    validate_check_operations,
+    validate_comment_id,
+)
+from app.utils.http_cache import conditional_json, parse_fields, project
 from app.exceptions import ValidationError, NotFoundError
-from app.database import db, CommentCheck
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+# /api/pr/<n>/comments 응답의 PR 필드와 코멘트 필드 (fields=로 코멘트 필드 선택)
+PR_FIELDS = (
+    "number", "title", "url", "state", "author", "createdAt", "updatedAt", "headRefOid", "commitCount",
+)
+COMMENT_FIELDS = (
+    "id", "databaseId", "url", "path", "diffHunk", "lineInfo",
+    "author", "authorUrl", "avatarUrl", "bodyHTML", "createdAt", "isResolved", "replies",
+)
+# 요청한 경우에만 포함하는 코멘트 필드 (hunk: 라인 번호가 포함된 구조화된 diff)
+COMMENT_EXTRA_FIELDS = ("hunk",)
+# compact 보기(PR_VIEWS)로 조회하지 않는 코멘트 필드 (하나라도 요청하면 full 보기로 조회)
+FULL_VIEW_FIELDS = frozenset(("diffHunk", "hunk", "avatarUrl", "replies"))
+
+
+def _repo_api():
+    """repo 쿼리 파라미터로 선택한 저장소의 GitHubAPI (없으면 기본 저장소)"""
+    return DashboardService().resolve_repo(request.args.get("repo"))
+
 
 @api_bp.route("/health")
 def health():
     """헬스체크 엔드포인트"""
     return jsonify({
         "status": "ok",
-        "service": "code-review-checker"
+        "service": "code-review-checker",
+        "warmup": get_warmup_status(current_app),
+        "rate_limit": get_governor().status,
     })
 
 
@@ -37,7 +69,7 @@ def add_reply(pr_number):
             raise ValidationError("comment_id가 필요합니다.", field="comment_id")
         
         # 서비스 레이어를 통한 비즈니스 로직 처리
-        comment_service = CommentService()
+        comment_service = CommentService(_repo_api())
         result = comment_service.add_reply_to_comment(
             pr_number=pr_number,
             comment_id=comment_id,
@@ -57,33 +89,115 @@ def add_reply(pr_number):
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@api_bp.route("/pr/<int:pr_number>/comments", methods=["GET"])
+def get_pr_comments(pr_number):
+    """PR 리뷰 코멘트 조회 (API)
+    
+    쿼리 파라미터:
+        include_resolved: 해결된 코멘트 포함 여부 (기본값: false)
+        fields: 코멘트 필드 선택 (예: "id,author,path" 또는 "-bodyHTML,-diffHunk", "hunk"는 지정한 경우에만 포함)
+    
+    diffHunk, hunk, avatarUrl, replies를 모두 제외하면 가벼운 compact 보기로 조회합니다.
+    응답에는 strong ETag가 붙으며, If-None-Match가 일치하면 304를 반환합니다.
+    """
+    try:
+        # 입력 검증
+        pr_number = validate_pr_number(pr_number)
+        include_resolved = request.args.get("include_resolved", "false").lower() == "true"
+        fields = parse_fields(request.args.get("fields"), COMMENT_FIELDS + COMMENT_EXTRA_FIELDS, COMMENT_FIELDS)
+        
+        # 서비스 레이어를 통한 비즈니스 로직 처리 (캐싱된 payload 사용)
+        pr_service = PRService(_repo_api())
+        pr_data = pr_service.get_pr_with_comments(
+            pr_number=pr_number,
+            include_resolved=include_resolved,
+            view="full" if FULL_VIEW_FIELDS.intersection(fields) else "compact"
+        )
+        
+        data = {key: pr_data.get(key) for key in PR_FIELDS}
+        data["comments"] = project(pr_data.get("comments", []), fields)
+        data["resolvedCount"] = pr_data.get("resolved_count", 0)
+        
+        return conditional_json({"success": True, "data": data})
+    
+    except ValidationError as e:
+        return jsonify({"success": False, "error": e.message}), 400
+    except NotFoundError as e:
+        return jsonify({"success": False, "error": e.message}), 404
+    except Exception as e:
+        current_app.logger.error(
+            f"코멘트 조회 실패: PR #{pr_number}, {str(e)}",
+            exc_info=True
+        )
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@api_bp.route("/pr/<int:pr_number>/events", methods=["GET"])
+def pr_events(pr_number):
+    """PR 변경 알림 스트림 (Server-Sent Events)
+    
+    연결 직후 현재 스레드 상태를 `state` 이벤트로, 이후 새로 생기거나 바뀐 리뷰 스레드를
+    `threads` 이벤트로 보냅니다. 두 이벤트 모두 스레드별 databaseId, 버전, 해결 여부만 담습니다.
+    GitHub 조회는 모든 탭이 공유하는 백그라운드 poller가 PR당 한 번만 합니다.
+    """
+    try:
+        pr_number = validate_pr_number(pr_number)
+        if not current_app.config.get("LIVE_UPDATES", True):
+            return jsonify({"success": False, "error": "실시간 갱신이 비활성화되어 있습니다."}), 404
+        
+        live_service = get_live_service()
+        key, events = live_service.subscribe(pr_number, _repo_api())
+    
+    except ValidationError as e:
+        return jsonify({"success": False, "error": e.message}), 400
+    except Exception as e:
+        current_app.logger.error(
+            f"실시간 갱신 구독 실패: PR #{pr_number}, {str(e)}",
+            exc_info=True
+        )
+        return jsonify({"success": False, "error": str(e)}), 500
+    
+    keepalive = current_app.config.get("LIVE_KEEPALIVE", 15)
+    
+    def stream():
+        try:
+            # 연결이 끊기면 브라우저가 5초 뒤 다시 연결
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    name, data = events.get(timeout=keepalive)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: {name}\ndata: {data}\n\n"
+        finally:
+            live_service.unsubscribe(key, events)
+    
+    response = Response(stream(), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"  # 프록시 버퍼링 방지
+    return response
+
+
 @api_bp.route("/pr/<int:pr_number>/comments/<comment_id>/check", methods=["POST", "GET", "DELETE"])
 def toggle_comment_check(pr_number, comment_id):
     """코멘트 체크 상태 저장/조회/삭제 (API)
     
-    POST: 체크 상태 저장 또는 업데이트
+    POST: 체크 상태 저장 또는 업데이트 (upsert)
     GET: 체크 상태 조회
     DELETE: 체크 상태 삭제 (체크 해제)
     """
     try:
         # 입력 검증
         pr_number = validate_pr_number(pr_number)
+        comment_id = validate_comment_id(comment_id)
         
-        if not comment_id:
-            raise ValidationError("comment_id가 필요합니다.", field="comment_id")
-        
-        # 저장소 정보 가져오기
-        pr_service = PRService()
-        repo = pr_service.get_repo_info()
-        repo_owner = repo["owner"]
-        repo_name = repo["name"]
+        # 서비스 레이어를 통한 비즈니스 로직 처리 (현재 저장소 범위)
+        check_service = CheckService(_repo_api())
         
         if request.method == "GET":
             # 체크 상태 조회
-            comment_check = CommentCheck.query.filter_by(
-                pr_number=pr_number,
-                comment_id=str(comment_id)
-            ).first()
+            comment_check = check_service.get_check(pr_number, comment_id)
             
             if comment_check:
                 return jsonify({
@@ -105,53 +219,17 @@ def toggle_comment_check(pr_number, comment_id):
         elif request.method == "POST":
             # 체크 상태 저장 또는 업데이트
             is_checked = request.json.get("is_checked", True) if request.is_json else True
+            check_service.set_check(pr_number, comment_id, bool(is_checked))
             
-            # 기존 레코드 조회
-            comment_check = CommentCheck.query.filter_by(
-                pr_number=pr_number,
-                comment_id=str(comment_id)
-            ).first()
-            
-            if comment_check:
-                # 기존 레코드 업데이트
-                comment_check.is_checked = is_checked
-                db.session.commit()
-                current_app.logger.info(
-                    f"코멘트 체크 상태 업데이트: PR #{pr_number}, comment_id={comment_id}, checked={is_checked}"
-                )
-            else:
-                # 새 레코드 생성
-                comment_check = CommentCheck(
-                    pr_number=pr_number,
-                    comment_id=str(comment_id),
-                    repo_owner=repo_owner,
-                    repo_name=repo_name,
-                    is_checked=is_checked
-                )
-                db.session.add(comment_check)
-                db.session.commit()
-                current_app.logger.info(
-                    f"코멘트 체크 상태 저장: PR #{pr_number}, comment_id={comment_id}, checked={is_checked}"
-                )
-            
+            comment_check = check_service.get_check(pr_number, comment_id)
             return jsonify({
                 "success": True,
-                "data": comment_check.to_dict()
+                "data": comment_check.to_dict() if comment_check else {"is_checked": False}
             })
         
         elif request.method == "DELETE":
             # 체크 상태 삭제 (체크 해제)
-            comment_check = CommentCheck.query.filter_by(
-                pr_number=pr_number,
-                comment_id=str(comment_id)
-            ).first()
-            
-            if comment_check:
-                db.session.delete(comment_check)
-                db.session.commit()
-                current_app.logger.info(
-                    f"코멘트 체크 상태 삭제: PR #{pr_number}, comment_id={comment_id}"
-                )
+            check_service.set_check(pr_number, comment_id, False)
             
             return jsonify({
                 "success": True,
@@ -161,7 +239,6 @@ def toggle_comment_check(pr_number, comment_id):
     except ValidationError as e:
         return jsonify({"success": False, "error": e.message}), 400
     except Exception as e:
-        db.session.rollback()
         current_app.logger.error(
             f"코멘트 체크 상태 처리 실패: PR #{pr_number}, comment_id={comment_id}, {str(e)}",
             exc_info=True
@@ -169,6 +246,42 @@ def toggle_comment_check(pr_number, comment_id):
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@api_bp.route("/pr/<int:pr_number>/comments/checks", methods=["POST"])
+def bulk_comment_checks(pr_number):
+    """여러 코멘트의 체크 상태를 한 번에 저장 (API)
+    
+    요청 본문: {"operations": [{"comment_id": "123", "is_checked": true}, ...]}
+    모든 작업은 하나의 트랜잭션으로 적용됩니다. 페이지를 떠날 때
+    navigator.sendBeacon으로도 보낼 수 있도록 Content-Type과 무관하게 JSON으로 읽습니다.
+    """
+    try:
+        # 입력 검증
+        pr_number = validate_pr_number(pr_number)
+        payload = request.get_json(force=True, silent=True)
+        if not isinstance(payload, dict):
+            raise ValidationError("JSON 본문이 필요합니다.", field="operations")
+        
+        operations = validate_check_operations(
+            payload.get("operations"),
+            max_operations=current_app.config.get("MAX_BULK_CHECK_OPERATIONS", 500)
+        )
+        
+        # 서비스 레이어를 통한 비즈니스 로직 처리
+        check_service = CheckService(_repo_api())
+        result = check_service.apply_checks(pr_number, operations)
+        
+        return jsonify({"success": True, "data": result})
+    
+    except ValidationError as e:
+        return jsonify({"success": False, "error": e.message}), 400
+    except Exception as e:
+        current_app.logger.error(
+            f"코멘트 체크 상태 일괄 저장 실패: PR #{pr_number}, {str(e)}",
+            exc_info=True
+        )
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 @api_bp.route("/pr/<int:pr_number>/comments/checks", methods=["GET"])
 def get_all_comment_checks(pr_number):
     """PR의 모든 코멘트 체크 상태 조회 (API)
@@ -179,20 +292,8 @@ def get_all_comment_checks(pr_number):
         # 입력 검증
         pr_number = validate_pr_number(pr_number)
         
-        # 해당 PR의 모든 체크 상태 조회
-        comment_checks = CommentCheck.query.filter_by(
-            pr_number=pr_number,
-            is_checked=True
-        ).all()
-        
-        # 코멘트 ID를 키로 하는 딕셔너리로 변환
-        checks_dict = {
-            check.comment_id: {
-                "is_checked": check.is_checked,
-                "checked_at": check.updated_at.isoformat() if check.updated_at else None
-            }
-            for check in comment_checks
-        }
+        # 해당 PR의 모든 체크 상태 조회 (커버링 인덱스만으로 처리)
+        checks_dict = CheckService(_repo_api()).get_checks(pr_number)
         
         return jsonify({
             "success": True,
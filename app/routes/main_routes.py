@@ -1,10 +1,11 @@
 """메인 페이지 라우트"""
 
-from flask import Blueprint, render_template, request
+from flask import Blueprint, make_response, render_template, request
 from flask import current_app
 
-from app.services.pr_service import PRService
-from app.utils.validators import validate_pr_state, validate_pr_type
+from app.services.dashboard_service import DashboardService
+from app.utils.validators import validate_pr_state, validate_pr_type, validate_repo
+from app.utils.http_cache import not_modified, page_etag, payload_version, with_etag
 from app.exceptions import ValidationError
 
 main_bp = Blueprint('main', __name__)
@@ -19,25 +20,49 @@ def index():
             request.args.get("state", current_app.config.get("DEFAULT_PR_STATE", "open"))
         )
         pr_type = validate_pr_type(request.args.get("type", "authored"))
+        repo_filter = request.args.get("repo") or None
         
         # 서비스 레이어를 통한 비즈니스 로직 처리
-        pr_service = PRService()
-        repo = pr_service.get_repo_info()
-        owner = repo["owner"]
-        name = repo["name"]
+        # 설정된 저장소(또는 조직)의 PR 목록을 병렬로 조회하여 최근 업데이트 순으로 합침
+        dashboard_service = DashboardService()
+        repositories = dashboard_service.get_repositories()
+        multi_repo = dashboard_service.is_multi_repo()
+        
+        repos = repositories
+        if repo_filter:
+            repo_filter = validate_repo(repo_filter)
+            repos = [repo for repo in repositories if repo.lower() == repo_filter.lower()]
+            if not repos:
+                raise ValidationError(f"설정되지 않은 저장소입니다: {repo_filter}", field="repo")
+            repo_filter = repos[0]
         
         # PR 목록 조회
-        prs = pr_service.get_prs_by_type(pr_type=pr_type, state=state)
+        dashboard = dashboard_service.get_prs(pr_type=pr_type, state=state, repos=repos)
+        prs = dashboard["prs"]
+        owner, name = repos[0].split("/", 1)
+        
+        # 목록이 바뀌지 않았다면 렌더링 없이 304 응답
+        etag = page_etag(
+            "index", payload_version(prs), repositories, repo_filter,
+            sorted(dashboard["errors"]), state, pr_type
+        )
+        response = not_modified(etag)
+        if response is not None:
+            return response
         
-        return render_template(
+        return with_etag(make_response(render_template(
             "index.html",
             prs=prs,
             owner=owner,
             name=name,
+            multi_repo=multi_repo,
+            repositories=repositories,
+            repo_filter=repo_filter,
+            repo_errors=dashboard["errors"],
             state=state,
             pr_type=pr_type,
             config=current_app.config,
-        )
+        )), etag)
     
     except ValidationError:
         # 검증 에러는 에러 핸들러가 처리
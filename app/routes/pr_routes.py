@@ -1,11 +1,16 @@
 """PR 관련 라우트"""
 
-from flask import Blueprint, render_template, request
+from flask import Blueprint, make_response, render_template, request
 from flask import current_app
 
 from app.services.pr_service import PRService
+from app.services.dashboard_service import DashboardService
+from app.services.check_service import CheckService
 from app.utils.validators import validate_pr_number
-from app.exceptions import NotFoundError
+from app.utils.http_cache import not_modified, page_etag, with_etag
+from app.utils.formatters import format_time
+from app.utils.fragments import render_threads, thread_times
+from app.exceptions import NotFoundError, ValidationError
 
 pr_bp = Blueprint('pr', __name__, url_prefix='/pr')
 
@@ -19,30 +24,51 @@ def pr_detail(pr_number):
         include_resolved = request.args.get("include_resolved", "false").lower() == "true"
         compact_mode = request.args.get("compact_mode", "false").lower() == "true"
         
-        # 서비스 레이어를 통한 비즈니스 로직 처리
-        pr_service = PRService()
+        # 서비스 레이어를 통한 비즈니스 로직 처리 (repo 파라미터로 저장소 선택)
+        dashboard_service = DashboardService()
+        pr_service = PRService(dashboard_service.resolve_repo(request.args.get("repo")))
         repo = pr_service.get_repo_info()
         owner = repo["owner"]
         name = repo["name"]
         
-        # PR 상세 정보 조회
+        # PR 상세 정보 조회 (컴팩트 모드는 화면에 표시하는 필드만 조회)
         pr_data = pr_service.get_pr_with_comments(
             pr_number=pr_number,
-            include_resolved=include_resolved
+            include_resolved=include_resolved,
+            view="compact" if compact_mode else "full"
+        )
+        
+        # 체크 상태를 한 번의 쿼리로 불러와 함께 렌더링 (별도 API 호출 없이 바로 표시)
+        checks = CheckService(pr_service.github_api).get_checks(pr_number)
+        
+        # PR 데이터 버전, 체크 상태, 표시되는 상대 시간이 그대로면 렌더링 없이 304 응답
+        etag = page_etag(
+            "pr_detail", pr_data.get("version"), sorted(checks.items()),
+            owner, name, include_resolved, compact_mode,
+            [thread_times(comment) for comment in pr_data.get("comments", [])]
         )
+        response = not_modified(etag)
+        if response is not None:
+            return response
+        
+        # 스레드별 HTML 조각 (바뀐 스레드만 다시 렌더링)
+        threads = render_threads(pr_data, pr_number, checks, compact_mode)
         
-        return render_template(
+        return with_etag(make_response(render_template(
             "pr_detail.html",
             pr=pr_data,
+            threads=threads,
             owner=owner,
             name=name,
             include_resolved=include_resolved,
             compact_mode=compact_mode,
+            checks=checks,
+            repo_param=f"{owner}/{name}" if dashboard_service.is_multi_repo() else None,
             config=current_app.config,
-        )
+        )), etag)
     
-    except NotFoundError:
-        # NotFoundError는 에러 핸들러가 처리
+    except (NotFoundError, ValidationError):
+        # NotFoundError, ValidationError는 에러 핸들러가 처리
         raise
     except Exception as e:
         current_app.logger.error(
@@ -51,3 +77,42 @@ def pr_detail(pr_number):
         )
         raise
 
+
+@pr_bp.route("/<int:pr_number>/commits")
+def pr_commits(pr_number):
+    """PR 커밋 목록 HTML 조각 - 상세 페이지에서 커밋 목록을 펼칠 때 불러옴"""
+    try:
+        pr_number = validate_pr_number(pr_number)
+        compact_mode = request.args.get("compact_mode", "false").lower() == "true"
+        
+        pr_service = PRService(DashboardService().resolve_repo(request.args.get("repo")))
+        repo = pr_service.get_repo_info()
+        
+        # 캐싱된 상세 payload의 head 커밋으로 커밋 목록 캐시 구분
+        pr_data = pr_service.get_pr_payload(pr_number, "compact" if compact_mode else "full")
+        head_ref_oid = pr_data.get("headRefOid")
+        
+        commits = pr_service.get_pr_commits(pr_number, head_ref_oid)
+        
+        # 커밋 시각은 상대 시간("3분 전")으로 표시되므로 ETag에 포함
+        etag = page_etag(
+            "pr_commits", repo["owner"], repo["name"], pr_number, head_ref_oid,
+            [format_time(commit.get("committedDate")) for commit in commits]
+        )
+        response = not_modified(etag)
+        if response is not None:
+            return response
+        
+        return with_etag(make_response(render_template(
+            "partials/commit_list.html",
+            commits=commits,
+        )), etag)
+    
+    except (NotFoundError, ValidationError):
+        raise
+    except Exception as e:
+        current_app.logger.error(
+            f"PR 커밋 목록 로드 실패: PR #{pr_number}, {str(e)}",
+            exc_info=True
+        )
+        raise
@@ -2,6 +2,12 @@
 
 from app.services.pr_service import PRService
 from app.services.comment_service import CommentService
+from app.services.sync_service import SyncService
+from app.services.check_service import CheckService
+from app.services.live_service import LiveService, get_live_service
+from app.services.dashboard_service import DashboardService
 
-__all__ = ['PRService', 'CommentService']
-
+__all__ = [
+    'PRService', 'CommentService', 'SyncService', 'CheckService', 'LiveService', 'get_live_service',
+    'DashboardService',
+]
@@ -0,0 +1,197 @@
+"""코멘트 체크 상태 관련 비즈니스 로직 서비스"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from flask import current_app
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from github import GitHubAPI, get_github_api
+from app.database import db, CommentCheck
+
+# INSERT ... ON CONFLICT를 지원하는 데이터베이스별 insert 구성 함수
+_UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+class CheckService:
+    """코멘트 대응 완료(체크) 상태를 처리하는 서비스 클래스
+
+    모든 조회/저장은 현재 저장소(repo_owner, repo_name) 범위로 한정됩니다.
+    """
+
+    def __init__(self, github_api: Optional[GitHubAPI] = None):
+        """
+        Args:
+            github_api: GitHubAPI 인스턴스 (None이면 프로세스 전역 인스턴스 사용)
+        """
+        self.github_api = github_api or get_github_api()
+
+    def _repo(self) -> Dict[str, str]:
+        """현재 저장소 정보"""
+        return self.github_api.get_repo_info()
+
+    def _scope(self, pr_number: int) -> list:
+        """저장소/PR 범위 조건"""
+        repo = self._repo()
+        return [
+            CommentCheck.repo_owner == repo["owner"],
+            CommentCheck.repo_name == repo["name"],
+            CommentCheck.pr_number == pr_number,
+        ]
+
+    def _upsert_checked(self, pr_number: int, comment_ids: List[int]) -> None:
+        """
+        코멘트들을 체크 상태로 upsert (INSERT ... ON CONFLICT DO UPDATE)
+
+        upsert를 지원하지 않는 데이터베이스에서는 조회 후 저장으로 처리합니다.
+        """
+        repo = self._repo()
+        now = datetime.utcnow()
+        rows = [
+            {
+                "repo_owner": repo["owner"],
+                "repo_name": repo["name"],
+                "pr_number": pr_number,
+                "comment_id": comment_id,
+                "is_checked": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for comment_id in comment_ids
+        ]
+
+        make_insert = _UPSERT_INSERTS.get(db.engine.dialect.name)
+        if make_insert is not None:
+            stmt = make_insert(CommentCheck).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["repo_owner", "repo_name", "pr_number", "comment_id"],
+                set_={"is_checked": True, "updated_at": now},
+            )
+            db.session.execute(stmt)
+            return
+
+        existing = {
+            check.comment_id: check
+            for check in CommentCheck.query.filter(
+                *self._scope(pr_number),
+                CommentCheck.comment_id.in_(comment_ids)
+            ).all()
+        }
+        for row in rows:
+            check = existing.get(row["comment_id"])
+            if check:
+                check.is_checked = True
+            else:
+                db.session.add(CommentCheck(**row))
+
+    def _delete(self, pr_number: int, comment_ids: List[int]) -> None:
+        """코멘트들의 체크 레코드 삭제 (체크 해제)"""
+        db.session.execute(
+            delete(CommentCheck).where(
+                *self._scope(pr_number),
+                CommentCheck.comment_id.in_(comment_ids)
+            )
+        )
+
+    def apply_checks(
+        self,
+        pr_number: int,
+        operations: List[Dict[str, Any]]
+    ) -> Dict[str, List[int]]:
+        """
+        여러 코멘트의 체크/체크 해제를 하나의 트랜잭션으로 적용
+
+        같은 코멘트에 대한 작업이 여러 번 있으면 마지막 작업만 반영합니다.
+        체크는 한 번의 upsert, 체크 해제는 한 번의 delete로 처리합니다.
+
+        Args:
+            pr_number: PR 번호
+            operations: 검증된 작업 목록 [{"comment_id": int, "is_checked": bool}, ...]
+
+        Returns:
+            {"checked": [comment_id, ...], "unchecked": [comment_id, ...]}
+        """
+        # 코멘트별 마지막 작업만 남김 (빠르게 여러 번 토글한 경우)
+        final_states = {}
+        for operation in operations:
+            final_states[operation["comment_id"]] = operation["is_checked"]
+
+        result = {
+            "checked": [cid for cid, checked in final_states.items() if checked],
+            "unchecked": [cid for cid, checked in final_states.items() if not checked],
+        }
+        if not final_states:
+            return result
+
+        try:
+            if result["checked"]:
+                self._upsert_checked(pr_number, result["checked"])
+            if result["unchecked"]:
+                self._delete(pr_number, result["unchecked"])
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        current_app.logger.info(
+            f"코멘트 체크 상태 일괄 저장: PR #{pr_number}, "
+            f"checked={len(result['checked'])}, unchecked={len(result['unchecked'])}"
+        )
+        return result
+
+    def set_check(self, pr_number: int, comment_id: int, is_checked: bool = True) -> None:
+        """
+        코멘트 하나의 체크 상태 저장 (체크 해제면 레코드 삭제)
+
+        Args:
+            pr_number: PR 번호
+            comment_id: 코멘트 ID (databaseId)
+            is_checked: 체크 여부
+        """
+        self.apply_checks(pr_number, [{"comment_id": comment_id, "is_checked": is_checked}])
+
+    def get_check(self, pr_number: int, comment_id: int) -> Optional[CommentCheck]:
+        """
+        코멘트 하나의 체크 레코드 조회
+
+        Args:
+            pr_number: PR 번호
+            comment_id: 코멘트 ID (databaseId)
+
+        Returns:
+            CommentCheck 레코드 (없으면 None)
+        """
+        return CommentCheck.query.filter(
+            *self._scope(pr_number),
+            CommentCheck.comment_id == comment_id
+        ).first()
+
+    def get_checks(self, pr_number: int) -> Dict[int, Dict[str, Any]]:
+        """
+        PR의 체크된 코멘트 목록 조회
+
+        필요한 컬럼만 선택하므로 커버링 인덱스(ix_comment_checks_pr_checked)만으로 처리됩니다.
+
+        Args:
+            pr_number: PR 번호
+
+        Returns:
+            {comment_id: {"is_checked": True, "checked_at": ISO 문자열}} 딕셔너리
+        """
+        rows = db.session.execute(
+            select(CommentCheck.comment_id, CommentCheck.updated_at).where(
+                *self._scope(pr_number),
+                CommentCheck.is_checked.is_(True)
+            )
+        ).all()
+
+        return {
+            row.comment_id: {
+                "is_checked": True,
+                "checked_at": row.updated_at.isoformat() if row.updated_at else None
+            }
+            for row in rows
+        }
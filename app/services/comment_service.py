@@ -3,8 +3,10 @@
 from typing import Dict, Any, Optional
 from flask import current_app
 
-from github import GitHubAPI
+from github import GitHubAPI, get_github_api
 from app.exceptions import ValidationError
+from app.services.sync_service import SyncService
+from app.utils.cache import invalidate_tags, pr_tag
 
 
 class CommentService:
@@ -13,9 +15,9 @@ class CommentService:
     def __init__(self, github_api: Optional[GitHubAPI] = None):
         """
         Args:
-            github_api: GitHubAPI 인스턴스 (None이면 새로 생성)
+            github_api: GitHubAPI 인스턴스 (None이면 프로세스 전역 인스턴스 사용)
         """
-        self.github_api = github_api or GitHubAPI()
+        self.github_api = github_api or get_github_api()
     
     def add_reply_to_comment(
         self,
@@ -68,6 +70,11 @@ class CommentService:
                 f"답글 작성 완료: PR #{pr_number}, comment_id={comment_id}"
             )
             
+            # 해당 PR의 캐시만 무효화하여 다음 조회에 답글이 바로 보이도록 함
+            # (스냅샷은 watermark가 아직 바뀌지 않았을 수 있으므로 따로 삭제)
+            invalidate_tags(pr_tag(owner, name, pr_number))
+            SyncService(self.github_api).discard_snapshot(pr_number)
+            
             return result
             
         except Exception as e:
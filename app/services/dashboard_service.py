@@ -0,0 +1,167 @@
+"""여러 저장소의 PR 목록을 하나로 모아 보여주는 대시보드 서비스"""
+
+from typing import Any, Dict, List, Optional
+
+from flask import current_app, g
+
+from github import GitHubAPI, get_github_api
+from github.concurrency import fan_out
+from app.exceptions import GitHubAPIError, ValidationError
+from app.services.pr_service import PRService
+from app.utils.cache import cached, mark_stale
+from app.utils.validators import validate_repo
+
+
+class DashboardService:
+    """설정된 저장소 목록(REPOSITORIES)이나 조직(GITHUB_ORG)의 PR을 모아 처리하는 서비스 클래스
+
+    저장소별 PR 목록은 병렬로 조회하고 저장소마다 따로 캐싱(PRService)한 뒤,
+    최근 업데이트 순으로 합칩니다. 아무것도 설정하지 않으면 현재 디렉터리의 저장소 하나만 사용합니다.
+    """
+
+    def __init__(self, github_api: Optional[GitHubAPI] = None):
+        """
+        Args:
+            github_api: GitHubAPI 인스턴스 (None이면 프로세스 전역 인스턴스 사용)
+        """
+        self.github_api = github_api or get_github_api()
+
+    @staticmethod
+    def is_multi_repo() -> bool:
+        """저장소 목록이나 조직이 설정되어 여러 저장소를 모아 보는지 여부"""
+        config = current_app.config
+        return bool(config.get("REPOSITORIES") or config.get("GITHUB_ORG"))
+
+    # 1시간 캐싱, 이후 하루 동안 기존 값 제공 + 백그라운드 갱신
+    @cached(timeout=3600, key_prefix="org_repos", stale_ttl=86400, error_ttl=86400)
+    def get_org_repositories(self, org: str, limit: int) -> List[str]:
+        """
+        조직의 저장소 목록 조회 (캐싱 적용)
+
+        Args:
+            org: 조직 login
+            limit: 최대 저장소 수
+
+        Returns:
+            "owner/name" 리스트 (최근 push 순)
+        """
+        current_app.logger.info(f"조직 저장소 목록 조회: org={org}")
+        repos = self.github_api.list_org_repositories(org, limit=limit)
+        return [f"{repo['owner']}/{repo['name']}" for repo in repos]
+
+    def get_repositories(self) -> List[str]:
+        """
+        대시보드에 모아 볼 저장소 목록
+
+        REPOSITORIES에 지정한 저장소 다음에 GITHUB_ORG의 저장소를 붙이고 중복은 제거합니다.
+
+        Returns:
+            "owner/name" 리스트 (설정이 없으면 현재 디렉터리의 저장소 하나)
+        """
+        config = current_app.config
+        repos = [validate_repo(repo) for repo in config.get("REPOSITORIES") or ()]
+
+        org = config.get("GITHUB_ORG")
+        if org:
+            repos.extend(self.get_org_repositories(org, config.get("ORG_REPO_LIMIT", 30)))
+
+        if not repos:
+            repo = self.github_api.get_repo_info()
+            return [f"{repo['owner']}/{repo['name']}"]
+
+        unique: Dict[str, str] = {}
+        for repo in repos:
+            unique.setdefault(repo.lower(), repo)
+        return list(unique.values())
+
+    def resolve_repo(self, repo: Optional[str] = None) -> GitHubAPI:
+        """
+        요청의 repo 파라미터에 해당하는 GitHubAPI 인스턴스 조회
+
+        Args:
+            repo: "owner/name" (없으면 기본 저장소: 단일 저장소 모드에서는 현재 디렉터리의 저장소,
+                  여러 저장소 모드에서는 목록의 첫 번째 저장소)
+
+        Returns:
+            저장소가 고정된 GitHubAPI 인스턴스
+
+        Raises:
+            ValidationError: 형식이 잘못되었거나 대시보드에 설정되지 않은 저장소인 경우
+        """
+        if not repo:
+            if not self.is_multi_repo():
+                return self.github_api
+            return get_github_api(self.get_repositories()[0])
+
+        repo = validate_repo(repo)
+        configured = {name.lower(): name for name in self.get_repositories()}
+        if repo.lower() not in configured:
+            raise ValidationError(f"설정되지 않은 저장소입니다: {repo}", field="repo")
+        return get_github_api(configured[repo.lower()])
+
+    def get_prs(
+        self,
+        pr_type: str,
+        state: str,
+        repos: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 저장소의 PR 목록을 병렬로 조회하여 최근 업데이트 순으로 합침
+
+        저장소가 하나뿐이면 정렬하지 않고 GitHub가 반환한 순서(최근 생성 순)를 그대로 유지합니다.
+        한 저장소의 조회 실패는 다른 저장소의 결과에 영향을 주지 않으며,
+        모든 저장소가 실패한 경우에만 에러를 발생시킵니다.
+
+        Args:
+            pr_type: PR 타입 ("authored" 또는 "reviewed")
+            state: PR 상태 ("open", "closed", "merged", "all")
+            repos: 조회할 저장소 목록 (None이면 get_repositories)
+
+        Returns:
+            {"prs": PR 리스트 (각 PR에 repository 필드 추가), "repositories": 저장소 목록,
+             "errors": {저장소: 에러 메시지}}
+
+        Raises:
+            GitHubAPIError: 모든 저장소의 조회가 실패한 경우
+        """
+        repos = list(repos) if repos is not None else self.get_repositories()
+
+        def fetch(repo: str):
+            prs = PRService(get_github_api(repo)).get_prs_by_type(pr_type=pr_type, state=state)
+            # 워커 스레드의 컨텍스트에 기록된 오래된 데이터 표시를 호출한 요청으로 전달
+            return prs, g.get("stale_data")
+
+        results = fan_out(
+            repos,
+            fetch,
+            max_workers=current_app.config.get("DASHBOARD_WORKERS", 4),
+            throttle=self.github_api.fanout_throttle
+        )
+
+        merged: List[Dict[str, Any]] = []
+        errors: Dict[str, str] = {}
+        for result in results:
+            if result.error is not None:
+                current_app.logger.warning(f"저장소 PR 목록 조회 실패: {result.item}, {str(result.error)}")
+                errors[result.item] = getattr(result.error, "message", str(result.error))
+                continue
+
+            prs, stale_data = result.value
+            if stale_data:
+                mark_stale(stale_data["age"])
+            # 캐시에 저장된 객체를 변경하지 않도록 복사
+            merged.extend(dict(pr, repository=result.item) for pr in prs)
+
+        if repos and len(errors) == len(repos):
+            error = results[0].error
+            if isinstance(error, GitHubAPIError):
+                raise error
+            raise GitHubAPIError(f"PR 목록을 조회하지 못했습니다: {str(error)}")
+
+        if len(repos) > 1:
+            merged.sort(key=lambda pr: pr.get("updatedAt") or pr.get("createdAt") or "", reverse=True)
+
+        current_app.logger.info(
+            f"대시보드 PR 목록 조회 완료: {len(merged)}개 ({len(repos)}개 저장소, 실패 {len(errors)}개)"
+        )
+        return {"prs": merged, "repositories": repos, "errors": errors}
@@ -0,0 +1,221 @@
+"""PR 상세 페이지 실시간 갱신(Server-Sent Events) 서비스"""
+
+import json
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from flask import current_app
+
+from github import GitHubAPI, get_github_api
+from github.ratelimit import bulk
+from app.services.sync_service import SyncService
+from app.utils.cache import invalidate_tags, pr_tag
+from app.utils.http_cache import payload_version
+
+WatchKey = Tuple[str, str, int]
+
+
+class LiveService:
+    """여러 브라우저 탭이 구독한 PR을 하나의 백그라운드 poller로 감시하는 서비스 클래스
+
+    같은 PR을 몇 개의 탭에서 보고 있든 PR당 한 번만 조회하며, 주기마다 감시 중인
+    모든 PR의 watermark를 한 번의 GraphQL 호출로 확인합니다(SyncService.sync_prs).
+    변경된 PR은 스레드별 내용 버전을 비교하여 새로 생기거나 바뀐 스레드의 요약
+    (databaseId, 버전, 해결 여부)만 구독자에게 보냅니다.
+
+    구독자 큐에는 (이벤트 이름, JSON 문자열)이 들어갑니다. 구독 직후에는 현재 기준 상태를
+    `state` 이벤트로 먼저 보내므로, 탭이 숨겨져 연결을 닫았다가 다시 연결해도
+    그 사이의 변경을 브라우저에서 비교할 수 있습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[WatchKey, Set[queue.Queue]] = {}
+        self._versions: Dict[WatchKey, Dict[int, Dict[str, Any]]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _thread_versions(payload: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+        """스레드(databaseId)별 요약 - {"databaseId", "version", "isResolved"}"""
+        return {
+            comment["databaseId"]: {
+                "databaseId": comment["databaseId"],
+                "version": payload_version(comment),
+                "isResolved": comment.get("isResolved", False),
+            }
+            for comment in payload.get("comments", [])
+        }
+
+    def subscribe(
+        self,
+        pr_number: int,
+        github_api: Optional[GitHubAPI] = None
+    ) -> Tuple[WatchKey, queue.Queue]:
+        """
+        PR 변경 알림 구독 (요청 컨텍스트 안에서 호출)
+
+        Args:
+            pr_number: PR 번호
+            github_api: PR이 속한 저장소의 GitHubAPI (None이면 프로세스 전역 인스턴스)
+
+        Returns:
+            (감시 키, 이벤트 큐)
+        """
+        sync_service = SyncService(github_api or get_github_api())
+        repo = sync_service.github_api.get_repo_info()
+        key = (repo["owner"], repo["name"], pr_number)
+        events = queue.Queue(maxsize=current_app.config.get("LIVE_QUEUE_SIZE", 100))
+
+        with self._lock:
+            self._subscribers.setdefault(key, set()).add(events)
+            need_baseline = key not in self._versions
+
+        if need_baseline:
+            # 페이지를 렌더링한 스냅샷을 기준으로 이후 변경만 보냄
+            payload = sync_service.peek_pr_snapshot(pr_number) or {}
+            with self._lock:
+                self._versions.setdefault(key, self._thread_versions(payload))
+
+        with self._lock:
+            threads = list(self._versions.get(key, {}).values())
+        events.put_nowait(("state", json.dumps({"pr": pr_number, "threads": threads})))
+
+        self._ensure_poller(current_app._get_current_object())
+        current_app.logger.info(f"실시간 갱신 구독: PR #{pr_number} ({self.subscriber_count(key)}개 탭)")
+        return key, events
+
+    def unsubscribe(self, key: WatchKey, events: queue.Queue) -> None:
+        """
+        구독 해제 (마지막 구독자가 떠나면 해당 PR 감시 중단)
+
+        Args:
+            key: subscribe가 반환한 감시 키
+            events: subscribe가 반환한 이벤트 큐
+        """
+        with self._lock:
+            subscribers = self._subscribers.get(key)
+            if subscribers is None:
+                return
+            subscribers.discard(events)
+            if not subscribers:
+                del self._subscribers[key]
+                self._versions.pop(key, None)
+
+    def subscriber_count(self, key: Optional[WatchKey] = None) -> int:
+        """구독 중인 탭 수 (key가 없으면 전체)"""
+        with self._lock:
+            if key is not None:
+                return len(self._subscribers.get(key, ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def _ensure_poller(self, app) -> None:
+        """poller 스레드가 없으면 시작"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(app,),
+                name="live-poller",
+                daemon=True
+            )
+            self._thread.start()
+
+    def _run(self, app) -> None:
+        """감시 중인 PR이 남아 있는 동안 주기적으로 변경 확인"""
+        stop = threading.Event()
+        # 주기적인 변경 확인은 화면 요청보다 우선순위가 낮음
+        with app.app_context(), bulk():
+            while not stop.wait(app.config.get("LIVE_POLL_INTERVAL", 20)):
+                with self._lock:
+                    keys = list(self._subscribers)
+                    if not keys:
+                        self._thread = None
+                        return
+
+                try:
+                    self.poll(keys)
+                except Exception as e:
+                    app.logger.warning(f"실시간 갱신 조회 실패: {str(e)}")
+
+    def poll(self, keys: List[WatchKey]) -> None:
+        """
+        감시 중인 PR들의 변경을 확인하고 바뀐 스레드를 구독자에게 전송 (앱 컨텍스트 안에서 호출)
+
+        Args:
+            keys: 감시 키 목록
+        """
+        # 저장소별로 묶어서 확인 (저장소마다 한 번의 watermark 조회)
+        by_repo: Dict[Tuple[str, str], Dict[int, WatchKey]] = {}
+        for key in keys:
+            by_repo.setdefault((key[0], key[1]), {})[key[2]] = key
+
+        for (owner, name), numbers in by_repo.items():
+            sync_service = SyncService(get_github_api(f"{owner}/{name}"))
+
+            for pr_number in sync_service.sync_prs(list(numbers)):
+                key = numbers[pr_number]
+                payload = sync_service.peek_pr_snapshot(pr_number)
+                if payload is None:
+                    continue
+
+                event = self._diff(key, payload)
+                if event is None:
+                    continue
+
+                # 새로고침 시에도 최신 데이터가 보이도록 이 PR의 캐시만 무효화
+                invalidate_tags(pr_tag(owner, name, pr_number))
+                self._publish(key, event)
+
+    def _diff(self, key: WatchKey, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """이전에 보낸 버전과 비교하여 새로 생기거나 바뀐 스레드 이벤트 생성"""
+        versions = self._thread_versions(payload)
+
+        with self._lock:
+            previous = self._versions.get(key, {})
+            self._versions[key] = versions
+
+        changed = [
+            thread for database_id, thread in versions.items()
+            if previous.get(database_id, {}).get("version") != thread["version"]
+        ]
+        removed = [database_id for database_id in previous if database_id not in versions]
+
+        if not changed and not removed:
+            return None
+
+        return {
+            "pr": key[2],
+            "updatedAt": payload.get("updatedAt"),
+            "threads": changed,
+            "new": [t["databaseId"] for t in changed if t["databaseId"] not in previous],
+            "removed": removed,
+        }
+
+    def _publish(self, key: WatchKey, event: Dict[str, Any]) -> None:
+        """구독자 큐에 이벤트 추가 (큐가 가득 찬 느린 구독자는 건너뜀)"""
+        data = json.dumps(event, ensure_ascii=False, default=str)
+
+        with self._lock:
+            subscribers = list(self._subscribers.get(key, ()))
+
+        for events in subscribers:
+            try:
+                events.put_nowait(("threads", data))
+            except queue.Full:
+                pass
+
+
+# 프로세스 전역 인스턴스 (모든 SSE 연결이 공유)
+_live_service: Optional[LiveService] = None
+_live_service_lock = threading.Lock()
+
+
+def get_live_service() -> LiveService:
+    """프로세스 전역 LiveService 인스턴스 반환"""
+    global _live_service
+    with _live_service_lock:
+        if _live_service is None:
+            _live_service = LiveService()
+        return _live_service
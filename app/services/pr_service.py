@@ -4,9 +4,12 @@ from typing import List, Dict, Any, Optional
 from markupsafe import Markup
 from flask import current_app
 
-from github import GitHubAPI
-from app.exceptions import NotFoundError
-from app.utils.cache import cached
+from github import GitHubAPI, get_github_api
+from app.exceptions import GitHubAPIError, NotFoundError
+from app.services.sync_service import SyncService
+from app.utils.cache import cached, cache_tags
+from app.utils.diff import parse_hunk, render_hunk
+from app.utils.http_cache import payload_version
 
 
 class PRService:
@@ -15,25 +18,38 @@ class PRService:
     def __init__(self, github_api: Optional[GitHubAPI] = None):
         """
         Args:
-            github_api: GitHubAPI 인스턴스 (None이면 새로 생성)
+            github_api: GitHubAPI 인스턴스 (None이면 프로세스 전역 인스턴스 사용)
         """
-        self.github_api = github_api or GitHubAPI()
-        self._repo_info_cache: Optional[Dict[str, str]] = None
+        self.github_api = github_api or get_github_api()
+        self.sync_service = SyncService(self.github_api)
     
-    @cached(timeout=3600, key_prefix="repo_info")  # 1시간 캐싱
     def get_repo_info(self) -> Dict[str, str]:
         """
-        저장소 정보 조회 (캐싱 적용)
+        저장소 정보 조회 (프로세스당 한 번만 계산되어 공유됨)
         
         Returns:
             저장소 정보 딕셔너리 (owner, name)
         """
-        # 인스턴스 변수 캐시도 유지 (캐시 미스 시 빠른 접근)
-        if self._repo_info_cache is None:
-            self._repo_info_cache = self.github_api.get_repo_info()
-        return self._repo_info_cache
+        return self.github_api.get_repo_info()
     
-    @cached(timeout=300, key_prefix="pr_list")  # 5분 캐싱
+    def _cache_namespace(self) -> str:
+        """저장소별 캐시 키 구분값 (저장소마다 캐시 항목을 따로 유지)"""
+        repo = self.get_repo_info()
+        return f"{repo['owner']}/{repo['name']}"
+    
+    def _list_cache_tags(self, pr_type: str, state: str) -> List[str]:
+        """PR 목록 캐시 태그"""
+        repo = self.get_repo_info()
+        return cache_tags(repo["owner"], repo["name"], kind="pr_list")
+    
+    def _detail_cache_tags(self, pr_number: int, view: str = "full") -> List[str]:
+        """PR 상세 캐시 태그"""
+        repo = self.get_repo_info()
+        return cache_tags(repo["owner"], repo["name"], pr_number, kind="pr_detail")
+    
+    # 5분 캐싱, 이후 10분간 기존 값 제공 + 백그라운드 갱신, 조회 실패 시 하루 동안 마지막 값 제공
+    @cached(timeout=300, key_prefix="pr_list", stale_ttl=600, error_ttl=86400, tags=_list_cache_tags,
+            namespace=_cache_namespace)
     def get_prs_by_type(self, pr_type: str, state: str) -> List[Dict[str, Any]]:
         """
         PR 타입에 따라 목록 조회 (캐싱 적용)
@@ -62,44 +78,69 @@ class PRService:
             current_app.logger.error(f"PR 목록 조회 실패: {str(e)}", exc_info=True)
             raise
     
-    @cached(timeout=120, key_prefix="pr_detail")  # 2분 캐싱
-    def get_pr_with_comments(
-        self,
-        pr_number: int,
-        include_resolved: bool = False
-    ) -> Dict[str, Any]:
+    def _detail_commit_tags(self, pr_number: int, head_ref_oid: Optional[str]) -> List[str]:
+        """PR 커밋 목록 캐시 태그 (상세 캐시와 함께 무효화)"""
+        return self._detail_cache_tags(pr_number)
+    
+    # 2분 캐싱, 이후 10분간 기존 값 제공 + 백그라운드 갱신, 조회 실패 시 하루 동안 마지막 값 제공
+    # include_resolved 값과 무관하게 PR·보기당 하나의 payload만 캐싱
+    @cached(timeout=120, key_prefix="pr_detail", stale_ttl=600, error_ttl=86400, tags=_detail_cache_tags,
+            namespace=_cache_namespace)
+    def get_pr_payload(self, pr_number: int, view: str = "full") -> Dict[str, Any]:
         """
-        PR 상세 정보와 코멘트 조회 (캐싱 적용)
+        해결된 스레드를 포함한 PR 전체 payload 조회 (캐싱 적용)
+        
+        `threads`에 전체/미해결/해결 스레드 분할을 미리 계산해 두므로
+        get_pr_with_comments는 추가 조회 없이 두 가지 보기를 만들 수 있습니다.
+        
+        compact 보기는 전체 스냅샷이 이미 있으면 그것을 쓰고, 없으면 화면에 표시하는
+        필드만 조회합니다(diffHunk, 댓글, 아바타 제외). 커밋 목록은 포함하지 않으며
+        (commitCount만 제공) get_pr_commits로 따로 조회합니다.
         
         Args:
             pr_number: PR 번호
-            include_resolved: 해결된 코멘트 포함 여부
+            view: 조회 필드 구성 ("full" 또는 "compact")
         
         Returns:
-            PR 상세 정보 딕셔너리
+            PR 상세 정보 딕셔너리 (version: 내용 버전, threads: {"all", "unresolved", "resolved"},
+            각 코멘트의 version: 스레드 내용 버전)
         
         Raises:
             NotFoundError: PR을 찾을 수 없는 경우
         """
-        current_app.logger.info(
-            f"PR 상세 조회: number={pr_number}, include_resolved={include_resolved}"
-        )
+        current_app.logger.info(f"PR 상세 조회: number={pr_number}, view={view}")
         
         try:
-            repo = self.get_repo_info()
-            owner = repo["owner"]
-            name = repo["name"]
-            
-            # PR 코멘트 조회
-            pr_data = self.github_api.get_comments_for_pr(
-                owner, name, pr_number, include_resolved=include_resolved
-            )
+            if view == "full" or self.sync_service.peek_pr_snapshot(pr_number) is not None:
+                # PR 전체 데이터 조회 (변경이 없으면 저장된 스냅샷 재사용)
+                pr_data = self.sync_service.get_pr_snapshot(pr_number)
+            else:
+                # 화면에 필요한 필드만 조회 (스냅샷으로 저장하지 않음)
+                repo = self.get_repo_info()
+                pr_data = self.github_api.get_comments_for_pr(
+                    repo["owner"], repo["name"], pr_number, include_resolved=True, view=view
+                )
             
             if not pr_data:
                 raise NotFoundError("PR", str(pr_number))
             
+            # 내용 버전 (페이지 ETag 계산에 사용)
+            version = payload_version(pr_data)
+            
+            # 스레드별 내용 버전 (스레드 HTML 조각 캐시 키에 사용)
+            for comment in pr_data.get("comments", []):
+                comment["version"] = payload_version(comment)
+            
             # 데이터 가공: bodyHTML을 Markup으로 래핑
             pr_data = self._process_pr_data(pr_data)
+            pr_data["version"] = version
+            
+            comments = pr_data.get("comments", [])
+            pr_data["threads"] = {
+                "all": comments,
+                "unresolved": [c for c in comments if not c.get("isResolved")],
+                "resolved": [c for c in comments if c.get("isResolved")],
+            }
             
             current_app.logger.info(f"PR 상세 조회 완료: PR #{pr_number}")
             return pr_data
@@ -107,28 +148,90 @@ class PRService:
         except NotFoundError:
             raise
         except Exception as e:
+            # 없는 PR (GraphQL NOT_FOUND)
+            if isinstance(e, GitHubAPIError) and e.status_code == 404:
+                raise NotFoundError("PR", str(pr_number)) from e
             current_app.logger.error(
                 f"PR 상세 조회 실패: PR #{pr_number}, {str(e)}",
                 exc_info=True
             )
             raise
     
+    def get_pr_with_comments(
+        self,
+        pr_number: int,
+        include_resolved: bool = False,
+        view: str = "full"
+    ) -> Dict[str, Any]:
+        """
+        PR 상세 정보와 코멘트 조회
+        
+        캐싱된 전체 payload에서 보기에 맞는 스레드 목록만 골라 반환합니다.
+        
+        Args:
+            pr_number: PR 번호
+            include_resolved: 해결된 코멘트 포함 여부
+            view: 조회 필드 구성 ("full" 또는 "compact")
+        
+        Returns:
+            PR 상세 정보 딕셔너리
+        
+        Raises:
+            NotFoundError: PR을 찾을 수 없는 경우
+        """
+        pr_data = dict(self.get_pr_payload(pr_number, view))
+        threads = pr_data["threads"]
+        pr_data["comments"] = threads["all"] if include_resolved else threads["unresolved"]
+        pr_data["resolved_count"] = len(threads["resolved"])
+        return pr_data
+    
+    # head 커밋별로 캐싱 (새 커밋이 push되면 키가 바뀜)
+    @cached(timeout=3600, key_prefix="pr_commits", stale_ttl=600, error_ttl=86400, tags=_detail_commit_tags,
+            namespace=_cache_namespace)
+    def get_pr_commits(self, pr_number: int, head_ref_oid: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        PR 커밋 목록 조회 (캐싱 적용, 커밋 목록을 펼쳤을 때만 호출)
+        
+        Args:
+            pr_number: PR 번호
+            head_ref_oid: PR의 head 커밋 SHA (캐시 키 구분용)
+        
+        Returns:
+            커밋 딕셔너리 리스트 (최신순)
+        """
+        current_app.logger.info(f"PR 커밋 목록 조회: number={pr_number}")
+        repo = self.get_repo_info()
+        return self.github_api.get_pr_commits(repo["owner"], repo["name"], pr_number)
+    
     def _process_pr_data(self, pr_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        PR 데이터 가공 (bodyHTML을 Markup으로 변환)
+        PR 데이터 가공 (bodyHTML을 Markup으로 변환, diff hunk 렌더링)
+        
+        같은 내용의 diff hunk(같은 라인에 달린 여러 코멘트)는 `hunks`에 한 번만 저장하고
+        렌더링하며, 각 코멘트는 `hunkId`로 참조합니다.
         
         Args:
             pr_data: 원본 PR 데이터
         
         Returns:
-            가공된 PR 데이터
+            가공된 PR 데이터 (hunks: {hunkId: 렌더링된 diff HTML})
         """
+        hunks: Dict[str, Dict[str, Any]] = {}
         comments = pr_data.get("comments", [])
         if comments:
             for comment in comments:
                 body = comment.get("bodyHTML")
                 comment["bodyHTML_safe"] = Markup(body) if body else Markup("")
                 
+                # 파싱된 hunk 모델 공유 (모델이 없는 이전 스냅샷은 여기서 파싱)
+                hunk = comment.get("hunk")
+                if hunk is None and comment.get("diffHunk"):
+                    hunk = parse_hunk(comment["diffHunk"])
+                if hunk is not None:
+                    hunk = hunks.setdefault(hunk["id"], hunk)
+                    comment["hunk"] = hunk
+                    comment["hunkId"] = hunk["id"]
+                
                 # 댓글도 Markup 처리
                 replies = comment.get("replies")
                 if replies:
@@ -137,5 +240,5 @@ class PRService:
                         if body:
                             reply["bodyHTML"] = Markup(body)
         
+        pr_data["hunks"] = {hunk_id: render_hunk(hunk) for hunk_id, hunk in hunks.items()}
         return pr_data
-
@@ -0,0 +1,268 @@
+"""PR 상세 데이터 증분 동기화 서비스"""
+
+import copy
+import time
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional
+
+from flask import current_app
+
+from github import GitHubAPI, get_github_api
+from app.exceptions import GitHubAPIError
+from app.utils.cache import cache
+
+
+class IncrementalSyncError(Exception):
+    """증분 병합이 불가능하여 전체 재조회가 필요한 경우"""
+    pass
+
+
+class SyncService:
+    """PR 상세 데이터를 watermark(updatedAt) 기준으로 증분 동기화하는 서비스 클래스
+
+    각 PR의 전체 스레드(해결된 스레드 포함) payload를 스냅샷으로 저장하고,
+    이후에는 가벼운 watermark 조회로 변경 여부만 확인합니다.
+    변경된 PR은 REST 리뷰 코멘트 `since=` 조회 결과를 스냅샷에 병합합니다.
+    """
+
+    def __init__(self, github_api: Optional[GitHubAPI] = None):
+        """
+        Args:
+            github_api: GitHubAPI 인스턴스 (None이면 프로세스 전역 인스턴스 사용)
+        """
+        self.github_api = github_api or get_github_api()
+
+    @staticmethod
+    def _snapshot_key(owner: str, name: str, pr_number: int) -> str:
+        """스냅샷 캐시 키"""
+        return f"pr_snapshot:{owner}/{name}#{pr_number}"
+
+    def _store(self, owner: str, name: str, pr_number: int, snapshot: Dict[str, Any]) -> None:
+        """스냅샷 저장"""
+        cache.set(
+            self._snapshot_key(owner, name, pr_number),
+            snapshot,
+            timeout=current_app.config.get("PR_SNAPSHOT_TTL", 7 * 24 * 3600),
+        )
+
+    def get_pr_snapshot(self, pr_number: int) -> Dict[str, Any]:
+        """
+        PR의 전체 payload 조회 (증분 동기화 적용)
+
+        Args:
+            pr_number: PR 번호
+
+        Returns:
+            해결된 스레드를 포함한 PR payload 복사본 (PR이 없으면 빈 딕셔너리)
+        """
+        repo = self.github_api.get_repo_info()
+        owner, name = repo["owner"], repo["name"]
+
+        snapshot = None
+        if current_app.config.get("INCREMENTAL_SYNC", True):
+            snapshot = cache.get(self._snapshot_key(owner, name, pr_number))
+
+        if snapshot is None:
+            snapshot = self._full_sync(owner, name, pr_number)
+        else:
+            watermarks = self.github_api.get_pr_watermarks(owner, name, [pr_number])
+            snapshot = self._refresh(owner, name, pr_number, snapshot, watermarks.get(pr_number))
+
+        if snapshot is None:
+            return {}
+        return copy.deepcopy(snapshot["payload"])
+
+    def peek_pr_snapshot(self, pr_number: int) -> Optional[Dict[str, Any]]:
+        """
+        저장된 스냅샷의 payload 조회 (GitHub 조회 없음)
+
+        Args:
+            pr_number: PR 번호
+
+        Returns:
+            PR payload (스냅샷이 없으면 None)
+        """
+        repo = self.github_api.get_repo_info()
+        snapshot = cache.get(self._snapshot_key(repo["owner"], repo["name"], pr_number))
+        if snapshot is None:
+            return None
+        return snapshot["payload"]
+
+    def discard_snapshot(self, pr_number: int) -> None:
+        """
+        저장된 스냅샷 삭제 (다음 조회는 전체 재조회)
+
+        스냅샷은 PR 태그(pr_tag)에 등록하지 않으므로 invalidate_tags로는 지워지지 않습니다.
+        답글 작성처럼 GitHub의 updatedAt이 바로 바뀌지 않을 수 있는 변경 직후에 호출합니다.
+
+        Args:
+            pr_number: PR 번호
+        """
+        repo = self.github_api.get_repo_info()
+        cache.delete(self._snapshot_key(repo["owner"], repo["name"], pr_number))
+
+    def sync_prs(self, pr_numbers: Iterable[int]) -> List[int]:
+        """
+        여러 PR의 스냅샷을 한 번의 watermark 조회로 점검하고 변경된 PR만 갱신한다.
+
+        스냅샷이 없는 PR은 건너뛴다.
+
+        Args:
+            pr_numbers: PR 번호 목록
+
+        Returns:
+            갱신된 PR 번호 리스트
+        """
+        repo = self.github_api.get_repo_info()
+        owner, name = repo["owner"], repo["name"]
+
+        snapshots = {}
+        for pr_number in pr_numbers:
+            snapshot = cache.get(self._snapshot_key(owner, name, pr_number))
+            if snapshot is not None:
+                snapshots[pr_number] = snapshot
+
+        if not snapshots:
+            return []
+
+        watermarks = self.github_api.get_pr_watermarks(owner, name, list(snapshots))
+
+        updated = []
+        for pr_number, snapshot in snapshots.items():
+            refreshed = self._refresh(owner, name, pr_number, snapshot, watermarks.get(pr_number))
+            if refreshed is not snapshot:
+                updated.append(pr_number)
+        return updated
+
+    def _full_sync(self, owner: str, name: str, pr_number: int) -> Optional[Dict[str, Any]]:
+        """PR 전체를 다시 조회하여 스냅샷으로 저장"""
+        current_app.logger.info(f"PR 전체 동기화: PR #{pr_number}")
+
+        payload = self.github_api.get_comments_for_pr(
+            owner, name, pr_number, include_resolved=True
+        )
+        if not payload:
+            return None
+
+        now = time.time()
+        snapshot = {
+            "updatedAt": payload.get("updatedAt"),
+            "headRefOid": payload.get("headRefOid"),
+            "fullSyncedAt": now,
+            "payload": payload,
+        }
+        self._store(owner, name, pr_number, snapshot)
+        return snapshot
+
+    def _refresh(
+        self,
+        owner: str,
+        name: str,
+        pr_number: int,
+        snapshot: Dict[str, Any],
+        watermark: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        watermark와 비교하여 스냅샷을 그대로 쓰거나, 증분 병합하거나, 전체 재조회한다.
+
+        Returns:
+            최신 스냅샷 (변경이 없으면 전달받은 snapshot 객체 그대로)
+        """
+        max_age = current_app.config.get("INCREMENTAL_SYNC_FULL_REFRESH", 1800)
+
+        # 증분 병합으로는 삭제된 코멘트를 알 수 없으므로 일정 시간마다 전체 재조회
+        if watermark is None or time.time() - snapshot["fullSyncedAt"] > max_age:
+            return self._full_sync(owner, name, pr_number)
+
+        if watermark.get("updatedAt") == snapshot["updatedAt"]:
+            return snapshot
+
+        try:
+            snapshot = self._merge_deltas(owner, name, pr_number, snapshot, watermark)
+        except (IncrementalSyncError, GitHubAPIError) as e:
+            current_app.logger.info(f"증분 동기화 불가, 전체 재조회: PR #{pr_number}, {e}")
+            return self._full_sync(owner, name, pr_number)
+
+        self._store(owner, name, pr_number, snapshot)
+        return snapshot
+
+    def _merge_deltas(
+        self,
+        owner: str,
+        name: str,
+        pr_number: int,
+        snapshot: Dict[str, Any],
+        watermark: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        변경된 PR의 코멘트/스레드 상태/커밋 수 변경분을 스냅샷에 병합한다.
+
+        Raises:
+            IncrementalSyncError: 스냅샷에 없는 스레드에 대한 댓글 등 병합할 수 없는 변경이 있는 경우
+        """
+        current_app.logger.info(
+            f"PR 증분 동기화: PR #{pr_number}, since={snapshot['updatedAt']}"
+        )
+
+        payload = copy.deepcopy(snapshot["payload"])
+        threads = {c["databaseId"]: c for c in payload.get("comments", [])}
+
+        # 1) since 이후 생성/수정된 코멘트 병합
+        deltas = self.github_api.get_review_comments_since(
+            owner, name, pr_number, snapshot["updatedAt"]
+        )
+        for node in sorted(deltas, key=lambda n: n.get("createdAt") or ""):
+            root_id = node.get("inReplyTo")
+
+            if root_id is None:
+                if node["databaseId"] in threads:
+                    threads[node["databaseId"]]["bodyHTML"] = node.get("bodyHTML")
+                else:
+                    comment = self.github_api.build_comment(
+                        {"isResolved": False, "comments": [node]}
+                    )
+                    payload.setdefault("comments", []).append(comment)
+                    threads[comment["databaseId"]] = comment
+                continue
+
+            thread = threads.get(root_id)
+            if thread is None:
+                raise IncrementalSyncError(f"스냅샷에 없는 스레드의 댓글: {root_id}")
+            if not node.get("author"):
+                continue
+
+            reply = self.github_api.build_reply(node)
+            for existing in thread["replies"]:
+                if existing["id"] == reply["id"]:
+                    existing["bodyHTML"] = reply["bodyHTML"]
+                    break
+            else:
+                thread["replies"].append(reply)
+                thread["replies"].sort(key=lambda r: r.get("createdAt") or "")
+
+        # 2) 스레드 해결 여부 갱신 (삭제된 스레드는 제거)
+        states = self.github_api.get_thread_states(owner, name, pr_number)
+        comments = []
+        for comment in payload.get("comments", []):
+            if comment["databaseId"] in states:
+                comment["isResolved"] = states[comment["databaseId"]]
+                comments.append(comment)
+        comments.sort(key=itemgetter("createdAt"), reverse=True)
+        payload["comments"] = comments
+
+        # 3) 커밋 목록은 스냅샷에 두지 않고(get_pr_commits로 따로 조회) 개수만 갱신
+        payload.pop("commits", None)
+        payload.update({
+            "title": watermark.get("title", payload.get("title")),
+            "state": watermark.get("state", payload.get("state")),
+            "updatedAt": watermark.get("updatedAt"),
+            "headRefOid": watermark.get("headRefOid"),
+            "commitCount": (watermark.get("commits") or {}).get("totalCount", payload.get("commitCount")),
+        })
+
+        return {
+            "updatedAt": watermark.get("updatedAt"),
+            "headRefOid": watermark.get("headRefOid"),
+            "fullSyncedAt": snapshot["fullSyncedAt"],
+            "payload": payload,
+        }
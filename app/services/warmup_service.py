@@ -0,0 +1,272 @@
+"""열린 PR의 캐시를 미리 채워 두는 백그라운드 스케줄러"""
+
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from github import get_github_api
+from github.concurrency import Throttle
+from github.ratelimit import bulk, is_rate_limit_error
+from app.exceptions import GitHubAPIError
+from app.services.dashboard_service import DashboardService
+from app.services.pr_service import PRService
+from app.utils.cache import cache
+
+# 여러 프로세스(WSGI 워커) 중 예열을 실행할 하나를 정하는 리더 임대 키
+LEADER_KEY = "warmup:leader"
+
+
+class WarmupScheduler:
+    """PR 목록과 최근 업데이트된 열린 PR의 상세 payload를 주기적으로 갱신하는 스케줄러
+
+    대시보드의 모든 저장소를 대상으로 하며, 한 주기에 갱신하는 PR 수(WARMUP_MAX_PRS)와
+    초당 조회 수(WARMUP_RATE)를 제한하고 저장소와 관계없이 updatedAt이 최신인 PR부터 갱신합니다.
+    조회는 bulk 우선순위로 실행되며, 사용량 제한에 걸리거나 남은 사용량이 하한 아래로
+    내려가면(github.ratelimit) 남은 작업을 다음 주기로 미룹니다.
+
+    여러 프로세스가 같은 캐시 DB를 공유하면 캐시의 리더 임대(LEADER_KEY)를 가진
+    프로세스 하나만 예열합니다. 임대는 주기마다 갱신되며, 리더가 멈추면 두 주기 뒤
+    다른 프로세스가 넘겨받습니다.
+    """
+
+    def __init__(self, app):
+        """
+        Args:
+            app: Flask 애플리케이션 인스턴스
+        """
+        self.app = app
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._token = f"{os.getpid()}:{uuid.uuid4().hex}"
+        self._status: Dict[str, Any] = {
+            "enabled": True,
+            "started": False,
+            "leader": False,
+            "running": False,
+            "runs": 0,
+            "last_run_at": None,
+            "last_duration": None,
+            "last_error": None,
+            "next_run_at": None,
+            "warmed": [],
+            "skipped": [],
+        }
+
+    @property
+    def status(self) -> Dict[str, Any]:
+        """스케줄러 상태 (헬스체크 응답용 복사본)"""
+        with self._lock:
+            return dict(self._status, warmed=list(self._status["warmed"]), skipped=list(self._status["skipped"]))
+
+    def _update_status(self, **values: Any) -> None:
+        with self._lock:
+            self._status.update(values)
+
+    def start(self) -> bool:
+        """
+        백그라운드 스레드 시작
+
+        Returns:
+            시작 여부 (이미 실행 중이면 True)
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return True
+
+        self._thread = threading.Thread(target=self._run, name="cache-warmup", daemon=True)
+        self._thread.start()
+        self._update_status(started=True)
+        self.app.logger.info("캐시 예열 스케줄러 시작")
+        return True
+
+    def stop(self) -> None:
+        """스케줄러 중지 (리더 임대를 가지고 있으면 반납)"""
+        self._stop.set()
+        with self.app.app_context():
+            if cache.get(LEADER_KEY) == self._token:
+                cache.delete(LEADER_KEY)
+
+    def _acquire_leadership(self) -> bool:
+        """
+        리더 임대 획득 또는 갱신 (앱 컨텍스트 안에서 호출)
+
+        임대가 비어 있거나 만료됐으면 가져오고, 이미 가지고 있으면 만료 시각을 늘립니다.
+        캐시 백엔드가 프로세스별(simple 등)이면 항상 자기 임대만 보이므로 프로세스마다 예열합니다.
+
+        Returns:
+            이번 주기에 예열을 실행할지 여부
+        """
+        lease = self.app.config.get("WARMUP_INTERVAL", 240) * 2
+        if cache.add(LEADER_KEY, self._token, timeout=lease):
+            return True
+        if cache.get(LEADER_KEY) == self._token:
+            cache.set(LEADER_KEY, self._token, timeout=lease)
+            return True
+        return False
+
+    def _run(self) -> None:
+        """WARMUP_INTERVAL마다 run_once 실행 (시작 직후 한 번 실행)"""
+        delay = self.app.config.get("WARMUP_INITIAL_DELAY", 5)
+        while True:
+            self._update_status(next_run_at=time.time() + delay)
+            if self._stop.wait(delay):
+                return
+
+            # 예열 조회는 화면 요청보다 우선순위가 낮음 (사용량이 부족하면 늦추거나 미룸)
+            with self.app.app_context(), bulk():
+                try:
+                    leader = self._acquire_leadership()
+                except Exception as e:
+                    self.app.logger.warning(f"캐시 예열 리더 확인 실패: {str(e)}")
+                    leader = False
+
+                self._update_status(leader=leader)
+                if leader:
+                    self.run_once()
+
+            delay = self.app.config.get("WARMUP_INTERVAL", 240)
+
+    def run_once(self) -> List[str]:
+        """
+        PR 목록과 상세 payload를 한 번 갱신 (앱 컨텍스트 안에서 호출)
+
+        Returns:
+            갱신한 PR 리스트 ("owner/name#번호")
+        """
+        config = self.app.config
+        started = time.time()
+        self._update_status(running=True)
+
+        throttle = Throttle(config.get("WARMUP_RATE", 1))
+        detail_ttl = config.get("WARMUP_DETAIL_MIN_AGE", 60)
+        warmed: List[str] = []
+        skipped: List[str] = []
+        error = None
+
+        try:
+            # 1) 메인 페이지 목록 갱신 (저장소별, 캐시 무시)
+            services = {
+                repo: PRService(get_github_api(repo))
+                for repo in DashboardService().get_repositories()
+            }
+            candidates = {}
+            for repo, pr_service in services.items():
+                try:
+                    for pr_type in config.get("WARMUP_PR_TYPES", ("authored",)):
+                        throttle.acquire()
+                        for pr in PRService.get_prs_by_type.refresh(pr_service, pr_type, "open"):
+                            candidates[(repo, pr["number"])] = pr
+                except GitHubAPIError as e:
+                    # 사용량 제한이 아니면 해당 저장소만 건너뜀
+                    if is_rate_limit_error(e):
+                        raise
+                    self.app.logger.warning(f"캐시 예열 PR 목록 조회 실패: {repo}, {str(e)}")
+
+            # 2) 최근 업데이트된 PR부터 예산만큼 상세 payload 갱신
+            ordered = sorted(
+                candidates.items(),
+                key=lambda item: item[1].get("updatedAt") or item[1].get("createdAt") or "",
+                reverse=True
+            )
+
+            for (repo, number), _ in ordered[:config.get("WARMUP_MAX_PRS", 10)]:
+                label = f"{repo}#{number}"
+                # 최근에 조회된(화면에서 본) PR은 건너뜀
+                age = PRService.get_pr_payload.cache_age(services[repo], number)
+                if age is not None and age < detail_ttl:
+                    skipped.append(label)
+                    continue
+
+                throttle.acquire()
+                PRService.get_pr_payload.refresh(services[repo], number)
+                warmed.append(label)
+
+        except GitHubAPIError as e:
+            error = str(e)
+            if is_rate_limit_error(e):
+                self.app.logger.warning(f"캐시 예열 중단 (사용량 제한): {error}")
+            else:
+                self.app.logger.warning(f"캐시 예열 실패: {error}")
+        except Exception as e:
+            error = str(e)
+            self.app.logger.error(f"캐시 예열 실패: {error}", exc_info=True)
+
+        duration = time.time() - started
+        with self._lock:
+            self._status.update(
+                running=False,
+                runs=self._status["runs"] + 1,
+                last_run_at=started,
+                last_duration=round(duration, 2),
+                last_error=error,
+                warmed=warmed,
+                skipped=skipped,
+            )
+
+        self.app.logger.info(
+            f"캐시 예열 완료: {len(warmed)}개 갱신, {len(skipped)}개 건너뜀 ({duration:.1f}초)"
+        )
+        return warmed
+
+
+def init_warmup(app) -> Optional[WarmupScheduler]:
+    """
+    캐시 예열 스케줄러 생성 (WARMUP_ENABLED가 False면 생성하지 않음)
+
+    CLI 명령 등 서버가 아닌 프로세스에서도 호출되므로 WARMUP_AUTOSTART가 True일 때만
+    바로 시작합니다. 그 외에는 서버 실행 진입점에서 start_warmup으로 시작합니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+
+    Returns:
+        WarmupScheduler (비활성화된 경우 None)
+    """
+    if not app.config.get("WARMUP_ENABLED", True):
+        return None
+
+    scheduler = WarmupScheduler(app)
+    app.extensions["warmup"] = scheduler
+    if app.config.get("WARMUP_AUTOSTART", False):
+        scheduler.start()
+    return scheduler
+
+
+def start_warmup(app, use_reloader: bool = False) -> bool:
+    """
+    서버 실행 진입점에서 캐시 예열 스케줄러 시작
+
+    개발 서버의 리로더를 쓰면 코드 변경을 감시하는 부모 프로세스에서는 시작하지 않고
+    실제 서버를 실행하는 자식 프로세스(WERKZEUG_RUN_MAIN)에서만 시작합니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+        use_reloader: 개발 서버 리로더 사용 여부
+
+    Returns:
+        시작 여부
+    """
+    scheduler = app.extensions.get("warmup")
+    if scheduler is None:
+        return False
+    if use_reloader and os.environ.get("WERKZEUG_RUN_MAIN") != "true":
+        return False
+    return scheduler.start()
+
+
+def get_warmup_status(app) -> Dict[str, Any]:
+    """
+    헬스체크용 캐시 예열 상태
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+
+    Returns:
+        상태 딕셔너리 (비활성화된 경우 {"enabled": False})
+    """
+    scheduler = app.extensions.get("warmup")
+    if scheduler is None:
+        return {"enabled": False}
+    return scheduler.status
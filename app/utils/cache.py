@@ -1,12 +1,18 @@
 """캐싱 유틸리티"""
 
 from functools import wraps
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Dict, Iterable, List, Optional
 import hashlib
+import inspect
 import json
-from flask import current_app
+import threading
+import time
+from flask import current_app, g
 from flask_caching import Cache
 
+from app.exceptions import GitHubAPIError
+from github.ratelimit import bulk
+
 # Flask-Caching 인스턴스
 cache = Cache()
 
@@ -20,13 +26,20 @@ def init_cache(app) -> None:
     """
     # 간단한 메모리 캐시 사용 (프로덕션에서는 Redis 등 사용 권장)
     cache_config = {
-        'CACHE_TYPE': 'simple',  # 'simple', 'redis', 'memcached' 등
+        'CACHE_TYPE': 'simple',  # 'simple', 'database', 'redis', 'memcached' 등
         'CACHE_DEFAULT_TIMEOUT': 300,  # 기본 5분
     }
     
     # 환경 변수로 캐시 타입 설정 가능
     cache_type = app.config.get('CACHE_TYPE', 'simple')
-    if cache_type == 'redis':
+    if cache_type == 'database':
+        # SQLAlchemy 데이터베이스에 저장 (재시작 후에도 유지, 워커 프로세스 간 공유)
+        cache_config.update({
+            'CACHE_TYPE': 'app.utils.cache_backends.DatabaseCache',
+            'CACHE_KEY_VERSION': app.config.get('CACHE_KEY_VERSION', '3'),
+            'CACHE_COMPRESS_THRESHOLD': app.config.get('CACHE_COMPRESS_THRESHOLD', 1024),
+        })
+    elif cache_type == 'redis':
         cache_config.update({
             'CACHE_TYPE': 'redis',
             'CACHE_REDIS_URL': app.config.get('CACHE_REDIS_URL', 'redis://localhost:6379/0'),
@@ -38,9 +51,38 @@ def init_cache(app) -> None:
         })
     
     cache.init_app(app, config=cache_config)
+    
+    @app.context_processor
+    def inject_stale_data():
+        """템플릿에서 오래된 데이터 표시 여부를 확인할 수 있도록 주입"""
+        return {"stale_data": g.get("stale_data")}
+    
+    @app.after_request
+    def add_stale_warning(response):
+        """오래된 캐시 데이터로 응답한 경우 Warning 헤더 추가"""
+        if g.get("stale_data"):
+            response.headers["Warning"] = '110 - "Response is Stale"'
+        return response
+    
     app.logger.info(f'캐시 시스템 초기화 완료: {cache_type}')
 
 
+def mark_stale(age: float) -> None:
+    """
+    현재 요청이 오래된 캐시 데이터로 응답함을 기록
+    
+    Args:
+        age: 데이터가 저장된 뒤 지난 시간 (초)
+    """
+    try:
+        stale_data = g.get("stale_data") or {"age": 0}
+        stale_data["age"] = max(stale_data["age"], int(age))
+        g.stale_data = stale_data
+    except RuntimeError:
+        # 요청/애플리케이션 컨텍스트 밖(백그라운드 갱신 등)에서는 기록하지 않음
+        pass
+
+
 def cache_key(prefix: str, *args, **kwargs) -> str:
     """
     캐시 키 생성
@@ -59,13 +101,241 @@ def cache_key(prefix: str, *args, **kwargs) -> str:
     return f"{prefix}:{key_hash}"
 
 
-def cached(timeout: int = 300, key_prefix: Optional[str] = None):
+def repo_tag(owner: str, name: str) -> str:
+    """저장소 단위 캐시 태그"""
+    return f"repo:{owner}/{name}"
+
+
+def pr_tag(owner: str, name: str, pr_number: int) -> str:
+    """PR 단위 캐시 태그"""
+    return f"pr:{owner}/{name}#{pr_number}"
+
+
+def kind_tag(kind: str) -> str:
+    """데이터 종류(pr_list, pr_detail 등) 단위 캐시 태그"""
+    return f"kind:{kind}"
+
+
+def cache_tags(
+    owner: str,
+    name: str,
+    pr_number: Optional[int] = None,
+    kind: Optional[str] = None
+) -> List[str]:
+    """
+    캐시 항목에 붙일 태그 목록 생성
+    
+    Args:
+        owner: 저장소 소유자
+        name: 저장소 이름
+        pr_number: PR 번호 (선택)
+        kind: 데이터 종류 (선택)
+    
+    Returns:
+        태그 리스트 (저장소, PR, 종류 순)
+    """
+    tags = [repo_tag(owner, name)]
+    if pr_number is not None:
+        tags.append(pr_tag(owner, name, pr_number))
+    if kind:
+        tags.append(kind_tag(kind))
+    return tags
+
+
+def _tag_index_key(tag: str) -> str:
+    """태그별 캐시 키 목록을 저장하는 인덱스 키"""
+    return f"tag_index:{tag}"
+
+
+# 태그 인덱스 읽기-수정-쓰기 보호용 락 (프로세스 단위, 태그를 직접 지원하지 않는 백엔드용)
+_tag_lock = threading.Lock()
+
+
+def _tag_backend() -> Optional[Any]:
+    """태그를 행 단위로 저장하는 캐시 백엔드 (DatabaseCache, 그 외 백엔드는 None)"""
+    backend = cache.cache
+    if hasattr(backend, "add_tags") and hasattr(backend, "delete_tags"):
+        return backend
+    return None
+
+
+def register_tags(key: str, tags: Iterable[str], timeout: int) -> None:
+    """
+    캐시 키를 태그 인덱스에 등록
+    
+    DatabaseCache는 (tag, key)를 한 행씩 upsert하므로 여러 프로세스가 동시에 등록해도
+    서로의 키를 잃지 않습니다. 그 외 백엔드는 {캐시 키: 만료 시각} 인덱스를 일반 캐시 항목으로
+    저장하며, 등록할 때 만료된 키를 정리하고 인덱스도 가장 늦게 만료되는 키에 맞춰 만료시킵니다.
+    
+    Args:
+        key: 캐시 키
+        tags: 태그 목록
+        timeout: 캐시 항목의 만료 시간 (초, 0이면 만료 없음)
+    """
+    backend = _tag_backend()
+    if backend is not None:
+        backend.add_tags(key, tags, timeout)
+        return
+    
+    now = time.time()
+    expires_at = now + timeout if timeout else None
+    
+    with _tag_lock:
+        for tag in tags:
+            index_key = _tag_index_key(tag)
+            index = cache.get(index_key) or {}
+            index = {
+                k: exp for k, exp in index.items()
+                if exp is None or exp > now
+            }
+            index[key] = expires_at
+            
+            # 인덱스는 마지막 항목이 만료될 때 함께 만료 (만료 없는 항목이 있으면 만료 없음)
+            if any(exp is None for exp in index.values()):
+                index_timeout = 0
+            else:
+                index_timeout = max(1, int(max(index.values()) - now) + 1)
+            cache.set(index_key, index, timeout=index_timeout)
+
+
+def invalidate_tags(*tags: str) -> int:
+    """
+    태그가 붙은 캐시 항목만 삭제
+    
+    Args:
+        *tags: 무효화할 태그 (repo_tag, pr_tag, kind_tag 등으로 생성)
+    
+    Returns:
+        삭제한 캐시 항목 수
+    """
+    backend = _tag_backend()
+    if backend is not None:
+        deleted = len(backend.delete_tags(tags))
+    else:
+        deleted = 0
+        with _tag_lock:
+            for tag in tags:
+                index_key = _tag_index_key(tag)
+                index = cache.get(index_key) or {}
+                # delete_many는 백엔드에 따라 이미 없는 키에서 멈추므로 하나씩 삭제
+                for k in index:
+                    cache.delete(k)
+                deleted += len(index)
+                cache.delete(index_key)
+    
+    current_app.logger.info(f"캐시 태그 무효화: {', '.join(tags)} ({deleted}개 항목)")
+    return deleted
+
+
+class SingleFlight:
+    """같은 키에 대한 동시 호출을 하나로 합치는 클래스
+
+    첫 번째 호출(leader)만 함수를 실행하고, 실행 중에 들어온 같은 키의 호출은
+    그 결과(또는 예외)를 기다렸다가 그대로 돌려받습니다.
+    """
+    
+    class _Call:
+        """진행 중인 호출 한 건"""
+        
+        def __init__(self):
+            self.event = threading.Event()
+            self.result: Any = None
+            self.error: Optional[BaseException] = None
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, "SingleFlight._Call"] = {}
+    
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        key에 대해 fn을 한 번만 실행하고 결과를 공유한다.
+        
+        Args:
+            key: 호출을 합칠 기준 키
+            fn: 실행할 함수
+        
+        Returns:
+            fn의 반환값
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._Call()
+                self._calls[key] = call
+        
+        if not is_leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+
+# 캐시 미스 시 같은 키의 동시 조회를 하나로 합치는 프로세스 전역 객체
+single_flight = SingleFlight()
+
+# 백그라운드 갱신이 진행 중인 캐시 키
+_revalidating = set()
+_revalidating_lock = threading.Lock()
+
+
+def _get_entry(key: str) -> Optional[Dict[str, Any]]:
+    """
+    cached()가 저장한 항목 조회
+
+    이전 형식(값만 저장)의 항목은 캐시 미스로 처리합니다.
+
+    Returns:
+        {"value", "stored_at"} (없거나 형식이 다르면 None)
+    """
+    entry = cache.get(key)
+    if not isinstance(entry, dict) or "stored_at" not in entry or "value" not in entry:
+        return None
+    return entry
+
+
+def cached(
+    timeout: int = 300,
+    key_prefix: Optional[str] = None,
+    stale_ttl: int = 0,
+    error_ttl: int = 0,
+    tags: Optional[Callable[..., Iterable[str]]] = None,
+    namespace: Optional[Callable[[Any], str]] = None
+):
     """
     캐싱 데코레이터
     
+    캐시 키는 인자 이름과 값으로 만들며, 메서드의 경우 self/cls는 제외합니다.
+    따라서 요청마다 새로 만든 서비스 인스턴스도 같은 캐시 항목을 공유하고,
+    위치 인자/키워드 인자/기본값 사용 여부에 관계없이 같은 호출은 같은 키가 됩니다.
+    캐시 미스 시 같은 키의 동시 요청은 한 번만 함수를 실행합니다.
+    
+    만료 단계:
+        - timeout 이내: 캐시 값 그대로 반환
+        - timeout ~ timeout + stale_ttl (stale-while-revalidate):
+          캐시 값을 바로 반환하고 백그라운드에서 갱신
+        - 그 이후: 다시 조회하되, GitHubAPIError가 나면 저장 후 timeout + stale_ttl + error_ttl
+          이내의 마지막 값을 오래된 데이터 표시(mark_stale)와 함께 반환 (stale-if-error)
+    
     Args:
-        timeout: 캐시 만료 시간 (초)
+        timeout: 캐시 만료 시간 (초, soft TTL)
         key_prefix: 캐시 키 접두사 (None이면 함수 이름 사용)
+        stale_ttl: 만료 후 백그라운드 갱신 중 기존 값을 제공할 시간 (초)
+        error_ttl: hard TTL이 지난 뒤 조회 실패 시 마지막 값을 제공할 시간 (초)
+        tags: 함수와 같은 인자를 받아 캐시 태그 목록을 반환하는 함수 (invalidate_tags로 삭제 가능)
+        namespace: 메서드의 self를 받아 캐시 키 구분 문자열을 반환하는 함수
+            (예: 저장소별 인스턴스가 서로의 캐시 항목을 공유하지 않도록 "owner/name" 반환)
     
     사용 예시:
         @cached(timeout=60)
@@ -73,26 +343,106 @@ def cached(timeout: int = 300, key_prefix: Optional[str] = None):
             # ...
     """
     def decorator(f: Callable) -> Callable:
+        signature = inspect.signature(f)
+        params = list(signature.parameters)
+        is_method = bool(params) and params[0] in ("self", "cls")
+        prefix = key_prefix or f"{f.__module__}.{f.__name__}"
+        hard_ttl = timeout + stale_ttl
+        
+        def make_key(args, kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            if is_method:
+                instance = arguments.pop(params[0])
+                if namespace is not None:
+                    return cache_key(f"{prefix}:{namespace(instance)}", **arguments)
+            return cache_key(prefix, **arguments)
+        
+        def load(key, args, kwargs) -> Any:
+            """함수를 실행하고 저장 시각과 함께 캐싱"""
+            value = f(*args, **kwargs)
+            cache.set(
+                key,
+                {"value": value, "stored_at": time.time()},
+                timeout=hard_ttl + error_ttl
+            )
+            if tags is not None:
+                register_tags(key, tags(*args, **kwargs), hard_ttl + error_ttl)
+            return value
+        
+        def revalidate_in_background(key, args, kwargs) -> None:
+            """백그라운드 스레드에서 캐시 갱신 (같은 키의 갱신은 하나만 실행)"""
+            with _revalidating_lock:
+                if key in _revalidating:
+                    return
+                _revalidating.add(key)
+            
+            app = current_app._get_current_object()
+            
+            def run():
+                try:
+                    # 백그라운드 갱신은 화면 요청보다 우선순위가 낮음
+                    with app.app_context(), bulk():
+                        single_flight.do(key, lambda: load(key, args, kwargs))
+                        app.logger.debug(f"캐시 백그라운드 갱신 완료: {key}")
+                except Exception as e:
+                    app.logger.warning(f"캐시 백그라운드 갱신 실패: {key}, {str(e)}")
+                finally:
+                    with _revalidating_lock:
+                        _revalidating.discard(key)
+            
+            threading.Thread(target=run, daemon=True).start()
+        
         @wraps(f)
         def wrapper(*args, **kwargs):
             # 캐시 키 생성
-            prefix = key_prefix or f"{f.__module__}.{f.__name__}"
-            key = cache_key(prefix, *args, **kwargs)
+            key = make_key(args, kwargs)
             
             # 캐시에서 조회
-            result = cache.get(key)
-            if result is not None:
-                current_app.logger.debug(f"캐시 히트: {key}")
-                return result
+            entry = _get_entry(key)
+            if entry is not None:
+                age = time.time() - entry["stored_at"]
+                
+                if age < timeout:
+                    current_app.logger.debug(f"캐시 히트: {key}")
+                    return entry["value"]
+                
+                if age < hard_ttl:
+                    current_app.logger.debug(f"캐시 히트 (백그라운드 갱신): {key}")
+                    revalidate_in_background(key, args, kwargs)
+                    return entry["value"]
             
-            # 캐시 미스: 함수 실행
+            # 캐시 미스: 함수 실행 (동시 요청은 하나로 합침)
             current_app.logger.debug(f"캐시 미스: {key}")
-            result = f(*args, **kwargs)
             
-            # 결과 캐싱
-            cache.set(key, result, timeout=timeout)
-            return result
+            try:
+                return single_flight.do(key, lambda: load(key, args, kwargs))
+            except GitHubAPIError as e:
+                if entry is None:
+                    raise
+                age = time.time() - entry["stored_at"]
+                current_app.logger.warning(
+                    f"조회 실패로 오래된 캐시 제공: {key}, {int(age)}초 전 데이터, {e.message}"
+                )
+                mark_stale(age)
+                return entry["value"]
+        
+        def refresh(*args, **kwargs) -> Any:
+            """캐시를 무시하고 함수를 실행하여 캐시 갱신"""
+            key = make_key(args, kwargs)
+            return single_flight.do(key, lambda: load(key, args, kwargs))
+        
+        def cache_age(*args, **kwargs) -> Optional[float]:
+            """캐시 항목이 저장된 뒤 지난 시간 (초, 없으면 None)"""
+            entry = _get_entry(make_key(args, kwargs))
+            if entry is None:
+                return None
+            return time.time() - entry["stored_at"]
         
+        wrapper.make_cache_key = make_key
+        wrapper.refresh = refresh
+        wrapper.cache_age = cache_age
         return wrapper
     return decorator
 
@@ -102,15 +452,11 @@ def clear_cache(pattern: Optional[str] = None) -> None:
     캐시 삭제
     
     Args:
-        pattern: 삭제할 캐시 키 패턴 (None이면 전체 삭제)
+        pattern: 삭제할 캐시 태그 (예: pr_tag(owner, name, 42), None이면 전체 삭제)
     """
     if pattern:
-        # 패턴 기반 삭제 (구현은 캐시 타입에 따라 다름)
-        current_app.logger.info(f"캐시 삭제: 패턴={pattern}")
-        # Redis의 경우 keys() + delete() 사용
-        # SimpleCache의 경우 전체 삭제만 가능
-        cache.clear()
+        # 태그가 붙은 항목만 삭제 (모든 캐시 백엔드에서 동작)
+        invalidate_tags(pattern)
     else:
         current_app.logger.info("전체 캐시 삭제")
         cache.clear()
-
@@ -0,0 +1,290 @@
+"""Flask-Caching 커스텀 백엔드
+
+DatabaseCache는 캐시 항목을 애플리케이션 SQLAlchemy 데이터베이스(`cache_entries`
+테이블)에 저장합니다. 서버 재시작 후에도 데이터가 유지되고, 같은 호스트의 모든
+워커 프로세스가 캐시를 공유합니다.
+
+- TTL: 항목별 만료 시각(expires_at) 저장, 조회 시 만료 항목 무시
+- 버전 키: CACHE_KEY_VERSION이 바뀌면 이전 버전 항목은 조회되지 않고 정리됨
+- 압축: 직렬화 크기가 임계값을 넘으면 zlib으로 압축하여 저장
+- 태그: 태그별 캐시 키를 (tag, key) 한 행씩 `cache_tags` 테이블에 저장 (프로세스 간 경합 없음)
+"""
+
+import pickle
+import threading
+import time
+import zlib
+from typing import Any, Iterable, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from flask_caching.backends.base import BaseCache
+
+from app.database import db, CacheEntry, CacheTag
+
+# INSERT ... ON CONFLICT를 지원하는 데이터베이스별 insert 구성 함수
+_UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+# set 호출 몇 번마다 만료/구버전 항목을 정리할지
+PURGE_EVERY = 200
+
+
+class DatabaseCache(BaseCache):
+    """SQLAlchemy 데이터베이스를 저장소로 사용하는 캐시 백엔드"""
+
+    def __init__(
+        self,
+        engine,
+        default_timeout: int = 300,
+        key_prefix: str = "",
+        version: str = "1",
+        compress_threshold: int = 1024,
+        ignore_errors: bool = False
+    ):
+        """
+        Args:
+            engine: SQLAlchemy 엔진
+            default_timeout: 기본 만료 시간 (초, 0이면 만료 없음)
+            key_prefix: 모든 키 앞에 붙일 접두사
+            version: 키 버전 (바뀌면 이전 항목은 모두 무효화됨)
+            compress_threshold: 이 크기(바이트) 이상이면 압축하여 저장
+            ignore_errors: delete_many에서 에러를 무시할지 여부
+        """
+        super().__init__(default_timeout=default_timeout)
+        self.engine = engine
+        self.table = CacheEntry.__table__
+        self.tag_table = CacheTag.__table__
+        self.version = str(version)
+        self.key_prefix = f"{key_prefix}v{self.version}:"
+        self.compress_threshold = compress_threshold
+        self.ignore_errors = ignore_errors
+
+        self._set_count = 0
+        self._count_lock = threading.Lock()
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        """Flask-Caching이 호출하는 생성 함수"""
+        with app.app_context():
+            engine = db.engine
+
+        kwargs.update(
+            engine=engine,
+            key_prefix=config.get("CACHE_KEY_PREFIX") or "",
+            version=config.get("CACHE_KEY_VERSION", "3"),
+            compress_threshold=config.get("CACHE_COMPRESS_THRESHOLD", 1024),
+            ignore_errors=config.get("CACHE_IGNORE_ERRORS", False),
+        )
+        return cls(*args, **kwargs)
+
+    def _full_key(self, key: str) -> str:
+        """버전 접두사가 붙은 실제 저장 키"""
+        return f"{self.key_prefix}{key}"
+
+    def _dump(self, value: Any) -> tuple:
+        """값 직렬화 → (바이트, 압축 여부)"""
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) >= self.compress_threshold:
+            return zlib.compress(data), True
+        return data, False
+
+    @staticmethod
+    def _load(data: bytes, compressed: bool) -> Any:
+        """바이트 → 값 역직렬화"""
+        if compressed:
+            data = zlib.decompress(data)
+        return pickle.loads(data)
+
+    def _expires_at(self, timeout: Optional[int]) -> Optional[float]:
+        """만료 시각 계산 (None이면 만료 없음)"""
+        timeout = self._normalize_timeout(timeout)
+        return time.time() + timeout if timeout > 0 else None
+
+    def get(self, key: str) -> Any:
+        try:
+            with self.engine.connect() as conn:
+                row = conn.execute(
+                    select(self.table.c.value, self.table.c.compressed, self.table.c.expires_at)
+                    .where(self.table.c.key == self._full_key(key))
+                ).first()
+        except SQLAlchemyError:
+            return None
+
+        if row is None:
+            return None
+        if row.expires_at is not None and row.expires_at <= time.time():
+            return None
+
+        try:
+            return self._load(row.value, row.compressed)
+        except (pickle.PickleError, zlib.error, EOFError, AttributeError, ImportError):
+            return None
+
+    def _write(self, key: str, value: Any, timeout: Optional[int], overwrite: bool) -> bool:
+        """항목 저장 (overwrite=False이면 유효한 항목이 이미 있을 때 저장하지 않음)"""
+        data, compressed = self._dump(value)
+        full_key = self._full_key(key)
+        now = time.time()
+        row = {
+            "key": full_key,
+            "value": data,
+            "compressed": compressed,
+            "expires_at": self._expires_at(timeout),
+            "version": self.version,
+            "updated_at": now,
+        }
+
+        try:
+            with self.engine.begin() as conn:
+                existing = conn.execute(
+                    select(self.table.c.expires_at).where(self.table.c.key == full_key)
+                ).first()
+
+                if existing is not None:
+                    alive = existing.expires_at is None or existing.expires_at > now
+                    if alive and not overwrite:
+                        return False
+                    conn.execute(
+                        self.table.update().where(self.table.c.key == full_key).values(**row)
+                    )
+                else:
+                    conn.execute(self.table.insert().values(**row))
+        except SQLAlchemyError:
+            return False
+
+        self._maybe_purge()
+        return True
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        return self._write(key, value, timeout, overwrite=True)
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        return self._write(key, value, timeout, overwrite=False)
+
+    def delete(self, key: str) -> bool:
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(delete(self.table).where(self.table.c.key == self._full_key(key)))
+        except SQLAlchemyError:
+            return False
+        return True
+
+    def delete_many(self, *keys: str) -> list:
+        if not keys:
+            return []
+        full_keys = [self._full_key(key) for key in keys]
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(delete(self.table).where(self.table.c.key.in_(full_keys)))
+        except SQLAlchemyError:
+            return []
+        return list(keys)
+
+    def has(self, key: str) -> bool:
+        try:
+            with self.engine.connect() as conn:
+                row = conn.execute(
+                    select(self.table.c.expires_at).where(self.table.c.key == self._full_key(key))
+                ).first()
+        except SQLAlchemyError:
+            return False
+        return row is not None and (row.expires_at is None or row.expires_at > time.time())
+
+    def clear(self) -> bool:
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(delete(self.table))
+                conn.execute(delete(self.tag_table))
+        except SQLAlchemyError:
+            return False
+        return True
+
+    def purge(self) -> None:
+        """만료된 항목과 이전 버전 항목 삭제 (태그 소속 포함)"""
+        now = time.time()
+        try:
+            with self.engine.begin() as conn:
+                for table in (self.table, self.tag_table):
+                    conn.execute(
+                        delete(table).where(
+                            (table.c.expires_at <= now) | (table.c.version != self.version)
+                        )
+                    )
+        except SQLAlchemyError:
+            pass
+
+    def add_tags(self, key: str, tags: Iterable[str], timeout: Optional[int] = None) -> bool:
+        """
+        캐시 키를 태그에 등록 (태그마다 한 행, 이미 있으면 만료 시각만 갱신)
+
+        Args:
+            key: 캐시 키
+            tags: 태그 목록
+            timeout: 캐시 항목과 같은 만료 시간 (초, 0이면 만료 없음)
+
+        Returns:
+            성공 여부
+        """
+        full_key = self._full_key(key)
+        expires_at = self._expires_at(timeout)
+        rows = [
+            {"tag": tag, "key": full_key, "expires_at": expires_at, "version": self.version}
+            for tag in dict.fromkeys(tags)
+        ]
+        if not rows:
+            return True
+
+        try:
+            with self.engine.begin() as conn:
+                make_insert = _UPSERT_INSERTS.get(self.engine.dialect.name)
+                if make_insert is not None:
+                    stmt = make_insert(self.tag_table).values(rows)
+                    conn.execute(stmt.on_conflict_do_update(
+                        index_elements=["tag", "key"],
+                        set_={"expires_at": stmt.excluded.expires_at, "version": self.version},
+                    ))
+                else:
+                    for row in rows:
+                        conn.execute(delete(self.tag_table).where(
+                            (self.tag_table.c.tag == row["tag"]) & (self.tag_table.c.key == full_key)
+                        ))
+                    conn.execute(self.tag_table.insert(), rows)
+        except SQLAlchemyError:
+            return False
+        return True
+
+    def delete_tags(self, tags: Iterable[str]) -> List[str]:
+        """
+        태그가 붙은 캐시 항목과 태그 소속을 한 트랜잭션에서 삭제
+
+        Args:
+            tags: 태그 목록
+
+        Returns:
+            삭제한 캐시 키 목록 (접두사 제외)
+        """
+        tags = list(tags)
+        try:
+            with self.engine.begin() as conn:
+                full_keys = conn.execute(
+                    select(self.tag_table.c.key).distinct().where(self.tag_table.c.tag.in_(tags))
+                ).scalars().all()
+                if full_keys:
+                    conn.execute(delete(self.table).where(self.table.c.key.in_(full_keys)))
+                conn.execute(delete(self.tag_table).where(self.tag_table.c.tag.in_(tags)))
+        except SQLAlchemyError:
+            return []
+        return [key[len(self.key_prefix):] for key in full_keys]
+
+    def _maybe_purge(self) -> None:
+        """set 호출이 일정 횟수 쌓일 때마다 정리"""
+        with self._count_lock:
+            self._set_count += 1
+            if self._set_count < PURGE_EVERY:
+                return
+            self._set_count = 0
+        self.purge()
@@ -0,0 +1,169 @@
+"""리뷰 코멘트 diff hunk 파싱 및 HTML 렌더링 유틸리티"""
+
+import hashlib
+import re
+from typing import Any, Dict, List, Optional
+
+from markupsafe import Markup, escape
+
+from app.utils.memo import LRUMemo
+
+# 코멘트가 달린 라인 주위로 보여줄 마지막 라인 수
+HUNK_CONTEXT_LINES = 10
+
+# 이전 버전 스냅샷의 잘린 diffHunk 텍스트에 붙어 있던 생략 표시
+OMITTED_MARKER = "... (위 생략됨)"
+
+_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@ ?(.*)$")
+
+# 라인 첫 글자 → 종류
+_LINE_KINDS = {"+": "add", "-": "del", " ": "context", "\\": "meta"}
+
+# 렌더링 시 라인 종류 → CSS 클래스
+_LINE_CLASSES = {
+    "add": "diff-addition",
+    "del": "diff-deletion",
+    "context": "diff-context",
+    "meta": "diff-file",
+}
+
+# 내용 해시별 파싱/렌더링 결과
+_parsed = LRUMemo(maxsize=4096)
+_rendered = LRUMemo(maxsize=4096)
+
+
+def hunk_id(diff_hunk: str) -> str:
+    """diff hunk 내용 해시 (같은 라인에 달린 코멘트들은 같은 값)"""
+    return hashlib.sha1(diff_hunk.encode("utf-8")).hexdigest()[:16]
+
+
+def parse_hunk(diff_hunk: str, context_lines: int = HUNK_CONTEXT_LINES) -> Dict[str, Any]:
+    """
+    diff hunk를 구조화된 모델로 파싱 (내용 해시별로 한 번만 계산)
+
+    라인 번호는 전체 hunk를 기준으로 계산하고, 라인 목록은 마지막 context_lines개만 남깁니다.
+    반환값은 같은 hunk를 쓰는 모든 코멘트가 공유하므로 변경하지 않아야 합니다.
+
+    Args:
+        diff_hunk: GitHub 리뷰 코멘트의 diffHunk 텍스트
+        context_lines: 남길 마지막 라인 수
+
+    Returns:
+        {"id", "header", "oldStart", "oldLines", "newStart", "newLines", "section",
+         "omitted": 생략된 라인 수,
+         "lines": [{"kind": "add"|"del"|"context"|"meta", "old": int|None, "new": int|None, "text"}]}
+    """
+    key = (hunk_id(diff_hunk), context_lines)
+    return _parsed.get_or_compute(key, lambda: _parse(diff_hunk, key[0], context_lines))
+
+
+def _parse(diff_hunk: str, content_id: str, context_lines: int) -> Dict[str, Any]:
+    """parse_hunk 실제 구현"""
+    model: Dict[str, Any] = {
+        "id": content_id,
+        "header": "",
+        "oldStart": None,
+        "oldLines": None,
+        "newStart": None,
+        "newLines": None,
+        "section": "",
+        "omitted": 0,
+        "lines": [],
+    }
+    lines: List[Dict[str, Any]] = []
+    old_no: Optional[int] = None
+    new_no: Optional[int] = None
+
+    for text in diff_hunk.split("\n"):
+        if not text:
+            continue
+
+        header = _HEADER_RE.match(text)
+        if header:
+            old_no, new_no = int(header.group(1)), int(header.group(3))
+            if not model["header"]:
+                model.update({
+                    "header": text.strip(),
+                    "oldStart": old_no,
+                    "oldLines": int(header.group(2) or 1),
+                    "newStart": new_no,
+                    "newLines": int(header.group(4) or 1),
+                    "section": header.group(5).strip(),
+                })
+            continue
+
+        if text == OMITTED_MARKER:
+            continue
+
+        kind = _LINE_KINDS.get(text[0], "context")
+        line = {"kind": kind, "old": None, "new": None, "text": text}
+        if kind in ("del", "context") and old_no is not None:
+            line["old"] = old_no
+            old_no += 1
+        if kind in ("add", "context") and new_no is not None:
+            line["new"] = new_no
+            new_no += 1
+        lines.append(line)
+
+    if len(lines) > context_lines:
+        model["omitted"] = len(lines) - context_lines
+        lines = lines[-context_lines:]
+    model["lines"] = lines
+    return model
+
+
+def hunk_text(model: Dict[str, Any]) -> str:
+    """
+    모델을 화면용 diffHunk 텍스트로 변환 (헤더와, 생략된 라인이 있으면 생략 표시 포함)
+
+    Args:
+        model: parse_hunk 결과
+
+    Returns:
+        마지막 라인들만 남긴 diff 텍스트
+    """
+    texts = [model["header"]] if model["header"] else []
+    if model["omitted"]:
+        texts.append(OMITTED_MARKER)
+    texts.extend(line["text"] for line in model["lines"])
+    return "\n".join(texts)
+
+
+def render_hunk(model: Dict[str, Any]) -> Markup:
+    """
+    모델을 diff HTML로 렌더링 (내용 해시별로 한 번만 렌더링)
+
+    Args:
+        model: parse_hunk 결과
+
+    Returns:
+        `<pre class="diff">` 블록 Markup
+    """
+    key = (model["id"], model["omitted"], len(model["lines"]))
+    return _rendered.get_or_compute(key, lambda: _render(model))
+
+
+def _number(value: Optional[int]) -> str:
+    """라인 번호 표시 문자열 (번호가 없으면 빈 문자열)"""
+    return str(value) if value is not None else ""
+
+
+def _render(model: Dict[str, Any]) -> Markup:
+    """render_hunk 실제 구현"""
+    parts = ['<pre class="diff"><code>']
+
+    if model["header"]:
+        parts.append(f'<span class="diff-hunk-header">{escape(model["header"])}</span>')
+    if model["omitted"]:
+        parts.append(f'<span class="diff-omitted">… {model["omitted"]}줄 생략됨</span>')
+
+    for line in model["lines"]:
+        parts.append(
+            f'<span class="{_LINE_CLASSES[line["kind"]]}">'
+            f'<span class="diff-num">{_number(line["old"])}</span>'
+            f'<span class="diff-num">{_number(line["new"])}</span>'
+            f'{escape(line["text"])}</span>'
+        )
+
+    parts.append("</code></pre>")
+    return Markup("".join(parts))
@@ -0,0 +1,115 @@
+"""PR 상세 페이지의 리뷰 스레드 HTML 조각 캐싱"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import current_app
+from markupsafe import Markup
+
+from app.utils.formatters import format_time
+from app.utils.memo import LRUMemo
+
+THREAD_TEMPLATE = "partials/review_thread.html"
+
+# (스레드, 내용 버전, 표시 옵션)별 렌더링된 HTML
+_fragments = LRUMemo(maxsize=4096)
+
+
+def thread_times(comment: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    스레드와 답글에 표시되는 상대 시간("3분 전") 목록
+
+    시간이 지나 표시가 바뀌면 캐싱된 조각과 페이지 ETag도 달라지도록 키에 포함합니다.
+
+    Args:
+        comment: 코멘트(스레드) 딕셔너리
+
+    Returns:
+        상대 시간 문자열 튜플 (스레드, 답글 순)
+    """
+    return (format_time(comment.get("createdAt")),) + tuple(
+        format_time(reply.get("createdAt")) for reply in comment.get("replies") or ()
+    )
+
+
+def render_thread(
+    comment: Dict[str, Any],
+    pr_number: int,
+    hunk_html: Optional[Markup],
+    checked: bool,
+    compact: bool
+) -> Markup:
+    """
+    리뷰 스레드 하나를 HTML 조각으로 렌더링 (같은 입력이면 캐싱된 조각 재사용)
+
+    캐시 키는 스레드 ID, 내용 버전(comment["version"]), 체크 여부, 컴팩트 모드와
+    화면에 표시되는 상대 시간("3분 전")으로 구성되므로, 바뀐 스레드만 다시 렌더링됩니다.
+
+    Args:
+        comment: 코멘트(스레드) 딕셔너리 (PRService.get_pr_payload 결과의 항목)
+        pr_number: PR 번호
+        hunk_html: 렌더링된 diff HTML (없으면 None)
+        checked: 대응 완료 체크 여부
+        compact: 컴팩트 모드 여부
+
+    Returns:
+        스레드 HTML Markup
+    """
+    times = thread_times(comment)
+    version = comment.get("version")
+    if version is None:
+        # 버전이 없으면 캐싱하지 않음
+        return _render(comment, pr_number, hunk_html, checked, compact)
+
+    key = (comment.get("id"), pr_number, version, checked, compact, times)
+    return _fragments.get_or_compute(
+        key, lambda: _render(comment, pr_number, hunk_html, checked, compact)
+    )
+
+
+def render_threads(
+    pr_data: Dict[str, Any],
+    pr_number: int,
+    checks: Dict[int, Any],
+    compact: bool
+) -> List[Markup]:
+    """
+    PR의 모든 표시 대상 스레드를 HTML 조각 목록으로 렌더링
+
+    Args:
+        pr_data: PRService.get_pr_with_comments 결과
+        pr_number: PR 번호
+        checks: 체크된 코멘트 {comment_id: ...}
+        compact: 컴팩트 모드 여부
+
+    Returns:
+        스레드 HTML Markup 리스트 (comments 순서)
+    """
+    hunks = pr_data.get("hunks") or {}
+    return [
+        render_thread(
+            comment,
+            pr_number,
+            hunks.get(comment.get("hunkId")),
+            comment.get("databaseId") in checks,
+            compact
+        )
+        for comment in pr_data.get("comments", [])
+    ]
+
+
+def _render(
+    comment: Dict[str, Any],
+    pr_number: int,
+    hunk_html: Optional[Markup],
+    checked: bool,
+    compact: bool
+) -> Markup:
+    """스레드 템플릿 렌더링"""
+    template = current_app.jinja_env.get_template(THREAD_TEMPLATE)
+    return Markup(template.render(
+        c=comment,
+        pr_number=pr_number,
+        hunk_html=hunk_html,
+        checked=checked,
+        compact_mode=compact,
+    ))
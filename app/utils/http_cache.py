@@ -0,0 +1,269 @@
+"""HTTP 조건부 요청(ETag), 응답 압축 및 응답 필드 선택 유틸리티"""
+
+import gzip
+import hashlib
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from flask import Response, current_app, g, request
+
+from app.exceptions import ValidationError
+
+try:
+    import brotli
+except ImportError:  # brotli는 선택 의존성 (없으면 gzip만 사용)
+    brotli = None
+
+# 프로세스 시작 시각: 배포(재시작) 후 템플릿이 바뀌면 페이지 ETag도 달라지도록 포함
+_BOOT_ID = str(time.time_ns())
+
+# 압축 방식별 ETag 접미사 (표현이 다르면 strong ETag도 달라야 함)
+_ENCODING_SUFFIXES = {"gzip": "-gzip", "br": "-br"}
+
+
+def parse_fields(
+    fields_param: Optional[str],
+    allowed: Iterable[str],
+    default: Iterable[str]
+) -> List[str]:
+    """
+    `fields=` 쿼리 파라미터를 해석하여 응답에 포함할 필드 목록을 반환
+
+    - "a,b,c": 지정한 필드만 포함
+    - "-a,-b": 기본 필드에서 지정한 필드만 제외
+    - 없거나 빈 값: 기본 필드
+
+    Args:
+        fields_param: fields 쿼리 파라미터 값
+        allowed: 선택 가능한 필드 목록
+        default: 기본으로 포함할 필드 목록 (순서 유지)
+
+    Returns:
+        포함할 필드 리스트
+
+    Raises:
+        ValidationError: 알 수 없는 필드이거나 포함/제외를 섞어 쓴 경우
+    """
+    default = list(default)
+    if not fields_param or not fields_param.strip():
+        return default
+
+    names = [name.strip() for name in fields_param.split(",") if name.strip()]
+    excluded = [name[1:] for name in names if name.startswith("-")]
+    included = [name for name in names if not name.startswith("-")]
+
+    if excluded and included:
+        raise ValidationError("fields에는 포함할 필드와 제외할 필드를 함께 지정할 수 없습니다.", field="fields")
+
+    allowed_set: Set[str] = set(allowed)
+    unknown = [name for name in excluded + included if name not in allowed_set]
+    if unknown:
+        raise ValidationError(
+            f"알 수 없는 필드입니다: {', '.join(unknown)} (가능한 값: {', '.join(sorted(allowed_set))})",
+            field="fields"
+        )
+
+    if excluded:
+        return [name for name in default if name not in excluded]
+    return list(dict.fromkeys(included))
+
+
+def project(items: Iterable[Dict[str, Any]], fields: List[str]) -> List[Dict[str, Any]]:
+    """
+    각 딕셔너리에서 지정한 필드만 남긴 새 리스트 생성
+
+    Args:
+        items: 원본 딕셔너리 목록
+        fields: 남길 필드 목록
+
+    Returns:
+        필드가 선택된 딕셔너리 리스트
+    """
+    return [{name: item.get(name) for name in fields} for item in items]
+
+
+def compute_etag(body: bytes) -> str:
+    """응답 본문으로부터 strong ETag 값 계산"""
+    return hashlib.sha256(body).hexdigest()[:32]
+
+
+def payload_version(data: Any) -> str:
+    """
+    데이터 내용으로부터 버전 문자열 계산 (내용이 같으면 항상 같은 값)
+
+    Args:
+        data: JSON으로 직렬화 가능한 데이터 (Markup 등 문자열 하위 타입 포함)
+
+    Returns:
+        버전 문자열
+    """
+    body = json.dumps(data, sort_keys=True, default=str, separators=(",", ":"))
+    return compute_etag(body.encode("utf-8"))
+
+
+def page_etag(*parts: Any) -> str:
+    """
+    HTML 페이지용 ETag 계산
+
+    데이터 버전, 체크 상태, 화면 옵션 등 렌더링 결과에 영향을 주는 값과
+    프로세스 시작 시각, 오래된 데이터 표시 여부를 함께 해시합니다.
+
+    Args:
+        *parts: 렌더링 결과를 결정하는 값들
+
+    Returns:
+        ETag 값 (따옴표 제외)
+    """
+    return payload_version([_BOOT_ID, bool(g.get("stale_data")), *parts])
+
+
+def not_modified(etag: str) -> Optional[Response]:
+    """
+    요청의 If-None-Match가 etag(또는 압축 표현의 etag)와 일치하면 304 응답 반환
+
+    템플릿 렌더링이나 직렬화 전에 호출하여, 변경이 없으면 렌더링을 건너뛸 수 있습니다.
+
+    Args:
+        etag: 압축 전 표현의 ETag 값
+
+    Returns:
+        304 Response (일치하지 않으면 None)
+    """
+    for tag in [etag] + [etag + suffix for suffix in _ENCODING_SUFFIXES.values()]:
+        if tag in request.if_none_match:
+            response = current_app.response_class(status=304)
+            response.set_etag(tag)
+            response.vary.add("Accept-Encoding")
+            _set_revalidate(response)
+            return response
+    return None
+
+
+def _set_revalidate(response: Response, max_age: int = 0) -> None:
+    """브라우저가 저장하되 사용할 때마다 재검증하도록 Cache-Control 설정"""
+    response.cache_control.private = True
+    if max_age:
+        response.cache_control.max_age = max_age
+    else:
+        response.cache_control.no_cache = True
+
+
+def with_etag(response: Response, etag: str, max_age: int = 0) -> Response:
+    """
+    응답에 strong ETag와 재검증용 Cache-Control 설정
+
+    Args:
+        response: Flask Response
+        etag: ETag 값
+        max_age: Cache-Control max-age (초, 0이면 매번 재검증)
+
+    Returns:
+        같은 Response
+    """
+    response.set_etag(etag)
+    _set_revalidate(response, max_age)
+    return response
+
+
+def conditional_json(payload: Any, max_age: int = 0) -> Response:
+    """
+    strong ETag가 붙은 JSON 응답 생성 (If-None-Match가 일치하면 304)
+
+    같은 데이터는 항상 같은 바이트로 직렬화되도록 키를 정렬하므로,
+    내용이 바뀌지 않았다면 폴링 요청은 본문 없이 304로 응답됩니다.
+
+    Args:
+        payload: JSON으로 직렬화할 데이터
+        max_age: Cache-Control max-age (초, 0이면 매번 재검증)
+
+    Returns:
+        Flask Response
+    """
+    body = json.dumps(
+        payload,
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+    etag = compute_etag(body)
+    response = not_modified(etag)
+    if response is not None:
+        return response
+
+    response = current_app.response_class(body, mimetype="application/json")
+    return with_etag(response, etag, max_age)
+
+
+def _choose_encoding() -> Optional[str]:
+    """Accept-Encoding에 따라 사용할 압축 방식 선택 (brotli 우선)"""
+    accept = request.accept_encodings
+    if brotli is not None and accept["br"]:
+        return "br"
+    if accept["gzip"]:
+        return "gzip"
+    return None
+
+
+def _compress(data: bytes, encoding: str, level: int) -> bytes:
+    """본문 압축 (같은 입력이면 항상 같은 출력)"""
+    if encoding == "br":
+        return brotli.compress(data, quality=min(11, max(0, level)))
+    return gzip.compress(data, compresslevel=min(9, max(1, level)), mtime=0)
+
+
+def init_compression(app) -> None:
+    """
+    응답 압축 초기화
+
+    크기가 COMPRESS_MIN_SIZE 이상인 HTML/JSON/CSS/JS 응답을 클라이언트가 지원하는
+    방식(brotli 설치 시 br, 아니면 gzip)으로 압축합니다. 스트리밍 응답(SSE 등)과
+    이미 인코딩된 응답은 건너뛰며, strong ETag에는 압축 방식 접미사를 붙입니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+    """
+    if not app.config.get("COMPRESS_RESPONSES", True):
+        return
+
+    min_size = app.config.get("COMPRESS_MIN_SIZE", 1024)
+    level = app.config.get("COMPRESS_LEVEL", 6)
+    mimetypes = set(app.config.get("COMPRESS_MIMETYPES", (
+        "text/html", "text/css", "text/plain", "application/json", "application/javascript", "text/javascript",
+    )))
+
+    @app.after_request
+    def compress_response(response):
+        """조건에 맞는 응답 본문 압축"""
+        if (
+            response.status_code != 200
+            or response.is_streamed
+            or response.direct_passthrough
+            or response.mimetype not in mimetypes
+            or "Content-Encoding" in response.headers
+        ):
+            return response
+
+        response.vary.add("Accept-Encoding")
+
+        data = response.get_data()
+        if len(data) < min_size:
+            return response
+
+        encoding = _choose_encoding()
+        if encoding is None:
+            return response
+
+        response.set_data(_compress(data, encoding, level))
+        response.headers["Content-Encoding"] = encoding
+
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag + _ENCODING_SUFFIXES[encoding])
+
+        return response
+
+    app.logger.info(
+        f"응답 압축 초기화 완료: {'br, gzip' if brotli is not None else 'gzip'} (최소 {min_size}바이트)"
+    )
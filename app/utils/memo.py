@@ -0,0 +1,45 @@
+"""프로세스 메모리 LRU 저장소"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+class LRUMemo:
+    """내용 해시 등 불변 키로 계산 결과를 재사용하는 스레드 안전한 LRU 저장소
+
+    같은 키는 항상 같은 결과를 내야 하므로 만료 시간 없이 개수만 제한합니다.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize: 최대 보관 개수 (넘으면 가장 오래 사용하지 않은 항목부터 제거)
+        """
+        self.maxsize = maxsize
+        self._items: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get_or_compute(self, key: Any, compute: Callable[[], Any]) -> Any:
+        """저장된 값을 반환하고, 없으면 compute()로 계산하여 저장"""
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+
+        value = compute()
+
+        with self._lock:
+            value = self._items.setdefault(key, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+        with self._lock:
+            self._items.clear()
@@ -0,0 +1,66 @@
+"""Jinja 템플릿 바이트코드 캐시 및 사전 컴파일"""
+
+import os
+import time
+from typing import List
+
+import click
+from jinja2 import FileSystemBytecodeCache
+
+
+def init_templates(app) -> None:
+    """
+    템플릿 바이트코드 캐시 설정 및 `flask precompile-templates` 명령 등록
+
+    컴파일된 템플릿을 TEMPLATE_CACHE_DIR에 저장하여 새 프로세스는 소스를 다시 컴파일하지 않고
+    바이트코드만 읽습니다. app.jinja_env에 처음 접근하기 전에 호출해야 합니다
+    (환경 생성 시 jinja_options가 적용됨).
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+    """
+    cache_dir = app.config.get("TEMPLATE_CACHE_DIR")
+    if cache_dir:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            app.jinja_options = dict(
+                app.jinja_options,
+                bytecode_cache=FileSystemBytecodeCache(cache_dir),
+            )
+        except OSError as e:
+            app.logger.warning(f"템플릿 바이트코드 캐시를 사용할 수 없습니다: {cache_dir}, {str(e)}")
+
+    @app.cli.command("precompile-templates")
+    def precompile_templates_command():
+        """모든 템플릿을 컴파일하여 바이트코드 캐시에 저장"""
+        names = precompile_templates(app)
+        click.echo(f"{len(names)}개 템플릿 컴파일 완료: {app.config.get('TEMPLATE_CACHE_DIR')}")
+
+
+def precompile_templates(app) -> List[str]:
+    """
+    모든 HTML 템플릿을 불러와 Jinja 환경의 템플릿 캐시(와 바이트코드 캐시)를 채움
+
+    템플릿이 사용하는 필터를 등록한 뒤에 호출해야 합니다.
+
+    Args:
+        app: Flask 애플리케이션 인스턴스
+
+    Returns:
+        불러온 템플릿 이름 리스트
+    """
+    started = time.perf_counter()
+    names = app.jinja_env.list_templates(extensions=("html",))
+
+    loaded = []
+    for name in names:
+        try:
+            app.jinja_env.get_template(name)
+            loaded.append(name)
+        except Exception as e:
+            app.logger.warning(f"템플릿 사전 컴파일 실패: {name}, {str(e)}")
+
+    app.logger.info(
+        f"템플릿 사전 컴파일 완료: {len(loaded)}개 ({(time.perf_counter() - started) * 1000:.1f}ms)"
+    )
+    return loaded
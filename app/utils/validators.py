@@ -1,7 +1,12 @@
 """입력 검증 유틸리티"""
 
+import re
+
 from app.exceptions import ValidationError
 
+# GitHub 저장소 "owner/name" 형식
+_REPO_RE = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?/[A-Za-z0-9._-]+$")
+
 
 def validate_pr_number(pr_number: int) -> int:
     """
@@ -81,6 +86,32 @@ def validate_pr_type(pr_type: str) -> str:
     return pr_type_lower
 
 
+def validate_repo(repo: str) -> str:
+    """
+    저장소 이름 검증
+    
+    Args:
+        repo: 검증할 저장소 ("owner/name")
+    
+    Returns:
+        앞뒤 공백을 제거한 저장소 이름
+    
+    Raises:
+        ValidationError: 저장소 이름이 유효하지 않은 경우
+    """
+    if not isinstance(repo, str):
+        raise ValidationError("저장소는 문자열이어야 합니다.", field="repo")
+    
+    repo_stripped = repo.strip()
+    if not _REPO_RE.match(repo_stripped):
+        raise ValidationError(
+            f"저장소는 owner/name 형식이어야 합니다. 받은 값: {repo}",
+            field="repo"
+        )
+    
+    return repo_stripped
+
+
 def validate_comment_body(body: str) -> str:
     """
     코멘트 본문 검증
@@ -110,3 +141,69 @@ def validate_comment_body(body: str) -> str:
     
     return body_stripped
 
+
+def validate_comment_id(comment_id) -> int:
+    """
+    코멘트 ID(GitHub databaseId) 검증
+    
+    Args:
+        comment_id: 검증할 코멘트 ID (정수 또는 숫자 문자열)
+    
+    Returns:
+        정수로 변환된 코멘트 ID
+    
+    Raises:
+        ValidationError: 코멘트 ID가 유효하지 않은 경우
+    """
+    if isinstance(comment_id, bool) or comment_id is None:
+        raise ValidationError("comment_id가 필요합니다.", field="comment_id")
+    
+    if isinstance(comment_id, str):
+        comment_id = comment_id.strip()
+        if not comment_id.isdigit():
+            raise ValidationError("comment_id는 양의 정수여야 합니다.", field="comment_id")
+        comment_id = int(comment_id)
+    
+    if not isinstance(comment_id, int) or comment_id < 1:
+        raise ValidationError("comment_id는 양의 정수여야 합니다.", field="comment_id")
+    
+    return comment_id
+
+
+def validate_check_operations(operations, max_operations: int = 500) -> list:
+    """
+    코멘트 체크 일괄 처리 요청 검증
+    
+    Args:
+        operations: [{"comment_id": ..., "is_checked": bool}, ...] 형태의 목록
+        max_operations: 한 번에 허용할 최대 작업 수
+    
+    Returns:
+        검증된 작업 목록 (comment_id는 정수, is_checked는 bool)
+    
+    Raises:
+        ValidationError: 작업 목록이 유효하지 않은 경우
+    """
+    if not isinstance(operations, list):
+        raise ValidationError("operations는 목록이어야 합니다.", field="operations")
+    
+    if len(operations) > max_operations:
+        raise ValidationError(
+            f"한 번에 최대 {max_operations}개까지 처리할 수 있습니다. 받은 개수: {len(operations)}",
+            field="operations"
+        )
+    
+    validated = []
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise ValidationError("각 작업은 객체여야 합니다.", field="operations")
+        
+        comment_id = validate_comment_id(operation.get("comment_id"))
+        
+        is_checked = operation.get("is_checked", True)
+        if not isinstance(is_checked, bool):
+            raise ValidationError("is_checked는 true 또는 false여야 합니다.", field="is_checked")
+        
+        validated.append({"comment_id": comment_id, "is_checked": is_checked})
+    
+    return validated
@@ -21,19 +21,100 @@ class Config:
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False  # 성능 최적화를 위해 False
     
+    # SQLite 엔진 프로필 (파일 기반 SQLite에만 적용)
+    # WAL 모드에서는 읽기와 쓰기가 서로를 막지 않고, 쓰기끼리는 busy timeout 동안 대기
+    SQLITE_TUNING = os.environ.get("SQLITE_TUNING", "True").lower() in ("true", "1", "yes")
+    SQLITE_JOURNAL_MODE = os.environ.get("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL")  # WAL에서는 NORMAL로도 손상 없음
+    SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "15000"))  # 잠금 대기 시간 (밀리초)
+    SQLITE_POOL_SIZE = int(os.environ.get("SQLITE_POOL_SIZE", "5"))  # 유지할 연결 수
+    SQLITE_MAX_OVERFLOW = int(os.environ.get("SQLITE_MAX_OVERFLOW", "10"))  # 일시적으로 추가 허용할 연결 수
+    
     # GitHub 관련 설정
     DEFAULT_PR_STATE = "open"  # "open", "closed", "merged", "all"
     DEFAULT_INCLUDE_RESOLVED = False  # resolved 코멘트 포함 여부
     
+    # 대시보드 저장소 설정 (둘 다 없으면 현재 디렉터리의 저장소 하나만 표시)
+    # REPOSITORIES: 쉼표로 구분한 "owner/name" 목록, GITHUB_ORG: 조직의 저장소 전체 (최근 push 순)
+    REPOSITORIES = tuple(repo.strip() for repo in os.environ.get("REPOSITORIES", "").split(",") if repo.strip())
+    GITHUB_ORG = os.environ.get("GITHUB_ORG")
+    ORG_REPO_LIMIT = int(os.environ.get("ORG_REPO_LIMIT", "30"))  # 조직에서 가져올 최대 저장소 수
+    DASHBOARD_WORKERS = int(os.environ.get("DASHBOARD_WORKERS", "4"))  # 동시에 조회할 최대 저장소 수
+    
+    # GitHub API 전송 설정
+    # "auto": 토큰(GITHUB_TOKEN/GH_TOKEN 또는 `gh auth token`)이 있으면 HTTP 연결 풀, 없으면 gh CLI
+    # "http": 항상 HTTP 연결 풀 사용, "gh": 항상 gh CLI 사용
+    GITHUB_TRANSPORT = os.environ.get("GITHUB_TRANSPORT", "auto")
+    GITHUB_API_URL = os.environ.get("GITHUB_API_URL", "https://api.github.com")  # REST 기본 URL
+    GITHUB_GRAPHQL_URL = os.environ.get("GITHUB_GRAPHQL_URL")  # None이면 GITHUB_API_URL + "/graphql"
+    GITHUB_HTTP_POOL_SIZE = int(os.environ.get("GITHUB_HTTP_POOL_SIZE", "4"))  # 유지할 keep-alive 연결 개수
+    GITHUB_HTTP_TIMEOUT = float(os.environ.get("GITHUB_HTTP_TIMEOUT", "30"))  # 요청 타임아웃 (초)
+    
+    # 여러 PR을 한꺼번에 조회할 때의 병렬 처리 설정
+    GITHUB_FANOUT_WORKERS = int(os.environ.get("GITHUB_FANOUT_WORKERS", "4"))  # 동시에 조회할 최대 PR 개수
+    GITHUB_FANOUT_RATE = float(os.environ.get("GITHUB_FANOUT_RATE", "5"))  # 초당 시작할 최대 PR 조회 수 (0이면 제한 없음)
+    
+    # GraphQL 사용량(rate limit)에 따른 백그라운드 조회 조절 (limit 대비 비율)
+    # 남은 사용량이 RESERVE 아래면 예열/백그라운드 갱신/리뷰 스캔 간격을 벌리고, FLOOR 아래면 초기화 시각까지 미룸
+    GITHUB_RATE_RESERVE = float(os.environ.get("GITHUB_RATE_RESERVE", "0.2"))
+    GITHUB_RATE_FLOOR = float(os.environ.get("GITHUB_RATE_FLOOR", "0.05"))
+    GITHUB_RATE_MAX_DELAY = float(os.environ.get("GITHUB_RATE_MAX_DELAY", "10"))  # 조회 간 최대 대기 시간 (초)
+    GITHUB_RATE_YIELD_TIMEOUT = float(os.environ.get("GITHUB_RATE_YIELD_TIMEOUT", "2"))  # 화면 요청에 양보하는 최대 시간 (초)
+    
     # GitHub API 제한 설정
-    # GraphQL 쿼리에서 한 번에 가져올 수 있는 최대 개수
-    MAX_REVIEW_THREADS = int(os.environ.get("MAX_REVIEW_THREADS", "100"))  # PR당 최대 리뷰 스레드 개수
-    MAX_COMMENTS_PER_THREAD = int(os.environ.get("MAX_COMMENTS_PER_THREAD", "100"))  # 스레드당 최대 코멘트 개수
-    MAX_COMMITS = int(os.environ.get("MAX_COMMITS", "100"))  # PR당 최대 커밋 개수
+    # GraphQL 쿼리 한 페이지에서 가져올 최대 개수 (나머지는 커서 페이지네이션으로 이어서 조회)
+    MAX_REVIEW_THREADS = int(os.environ.get("MAX_REVIEW_THREADS", "100"))  # 페이지당 최대 리뷰 스레드 개수
+    MAX_COMMENTS_PER_THREAD = int(os.environ.get("MAX_COMMENTS_PER_THREAD", "100"))  # 페이지당 스레드별 최대 코멘트 개수
+    MAX_COMMITS = int(os.environ.get("MAX_COMMITS", "100"))  # 페이지당 최대 커밋 개수
+    # 한 번의 GraphQL 쿼리에서 요청할 최대 노드 수 (스레드 × 코멘트 페이지 크기를 이 값에 맞춰 줄임)
+    GRAPHQL_NODE_BUDGET = int(os.environ.get("GRAPHQL_NODE_BUDGET", "2500"))
     
     # PR 목록 제한 (gh CLI는 기본적으로 30개 제한, 더 많은 경우 --limit 옵션 사용)
     MAX_PR_LIST_LIMIT = int(os.environ.get("MAX_PR_LIST_LIMIT", "100"))  # PR 목록 최대 개수
     
+    # "내가 리뷰한 PR" 조회 시 하나의 GraphQL 쿼리에 alias로 묶을 PR 개수
+    REVIEWED_SCAN_BATCH_SIZE = int(os.environ.get("REVIEWED_SCAN_BATCH_SIZE", "10"))
+    
+    # 캐시 설정
+    # "database": SQLAlchemy 데이터베이스에 저장 (재시작 후에도 유지), "simple": 프로세스 메모리
+    CACHE_TYPE = os.environ.get("CACHE_TYPE", "database")
+    CACHE_KEY_VERSION = os.environ.get("CACHE_KEY_VERSION", "3")  # 바꾸면 기존 캐시 항목 전체 무효화
+    CACHE_COMPRESS_THRESHOLD = int(os.environ.get("CACHE_COMPRESS_THRESHOLD", "1024"))  # 압축 저장 기준 크기 (바이트)
+    
+    # 증분 동기화 설정
+    # PR 상세 데이터를 스냅샷으로 저장하고 updatedAt이 바뀐 경우에만 변경분을 병합
+    INCREMENTAL_SYNC = os.environ.get("INCREMENTAL_SYNC", "True").lower() in ("true", "1", "yes")
+    PR_SNAPSHOT_TTL = int(os.environ.get("PR_SNAPSHOT_TTL", str(7 * 24 * 3600)))  # 스냅샷 보관 시간 (초)
+    INCREMENTAL_SYNC_FULL_REFRESH = int(os.environ.get("INCREMENTAL_SYNC_FULL_REFRESH", "1800"))  # 전체 재조회 주기 (초)
+    
+    # 캐시 예열 스케줄러 (열린 PR 목록과 최근 업데이트된 PR 상세를 미리 조회)
+    WARMUP_ENABLED = os.environ.get("WARMUP_ENABLED", "True").lower() in ("true", "1", "yes")
+    WARMUP_AUTOSTART = os.environ.get("WARMUP_AUTOSTART", "False").lower() in ("true", "1", "yes")  # create_app에서 바로 시작 (WSGI 서버용)
+    WARMUP_INTERVAL = int(os.environ.get("WARMUP_INTERVAL", "240"))  # 예열 주기 (초, PR 목록 캐시 시간보다 짧게)
+    WARMUP_MAX_PRS = int(os.environ.get("WARMUP_MAX_PRS", "10"))  # 주기당 상세를 갱신할 최대 PR 수
+    WARMUP_RATE = float(os.environ.get("WARMUP_RATE", "1"))  # 초당 최대 조회 수
+    WARMUP_DETAIL_MIN_AGE = int(os.environ.get("WARMUP_DETAIL_MIN_AGE", "60"))  # 이보다 최근에 조회된 PR 상세는 건너뜀 (초)
+    WARMUP_PR_TYPES = tuple(os.environ.get("WARMUP_PR_TYPES", "authored").split(","))  # 예열할 목록 종류
+    
+    # PR 상세 페이지 실시간 갱신 (Server-Sent Events)
+    LIVE_UPDATES = os.environ.get("LIVE_UPDATES", "True").lower() in ("true", "1", "yes")
+    LIVE_POLL_INTERVAL = int(os.environ.get("LIVE_POLL_INTERVAL", "20"))  # 감시 중인 PR 변경 확인 주기 (초)
+    LIVE_KEEPALIVE = int(os.environ.get("LIVE_KEEPALIVE", "15"))  # 연결 유지용 주석 전송 주기 (초)
+    
+    # 응답 압축 설정 (brotli 패키지가 설치되어 있으면 br, 아니면 gzip)
+    COMPRESS_RESPONSES = os.environ.get("COMPRESS_RESPONSES", "True").lower() in ("true", "1", "yes")
+    COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", "1024"))  # 이 크기(바이트) 이상만 압축
+    COMPRESS_LEVEL = int(os.environ.get("COMPRESS_LEVEL", "6"))  # 압축 수준
+    
+    # 코멘트 체크 일괄 저장 설정
+    MAX_BULK_CHECK_OPERATIONS = int(os.environ.get("MAX_BULK_CHECK_OPERATIONS", "500"))  # 요청당 최대 작업 수
+    CHECK_FLUSH_INTERVAL_MS = int(os.environ.get("CHECK_FLUSH_INTERVAL_MS", "800"))  # 브라우저에서 변경을 모아 보내는 주기 (밀리초)
+    
+    # 템플릿 설정
+    # 컴파일된 템플릿(바이트코드)을 저장할 디렉터리 (빈 값이면 사용 안 함), 앱 생성 시 전체 템플릿 사전 컴파일 여부
+    TEMPLATE_CACHE_DIR = os.environ.get("TEMPLATE_CACHE_DIR", os.path.join(basedir, ".jinja_cache"))
+    TEMPLATE_PRECOMPILE = os.environ.get("TEMPLATE_PRECOMPILE", "True").lower() in ("true", "1", "yes")
+    
     # UI 설정
     APP_TITLE = "코드 리뷰 체커"
     COMMENTS_PER_PAGE = 50  # 페이지네이션 (향후 구현)
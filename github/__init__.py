@@ -1,5 +1,5 @@
 """GitHub API 모듈"""
 
-from .api import GitHubAPI
+from .api import GitHubAPI, get_github_api
 
-__all__ = ["GitHubAPI"]
+__all__ = ["GitHubAPI", "get_github_api"]
@@ -1,99 +1,400 @@
 """GitHub CLI 및 GraphQL API 래퍼"""
 
-import json
-import subprocess
-from typing import List, Dict, Any, Optional
+import logging
+import threading
+from typing import List, Dict, Any, Iterator, Optional
 from operator import itemgetter
 from flask import current_app
 
 from app.exceptions import GitHubAPIError
+from app.utils.diff import hunk_text, parse_hunk
+from github import transport as gh_transport
+from github.concurrency import Throttle, fan_out
+from github.identity import get_identity_resolver
+from github.pagination import MAX_PAGE_SIZE, is_cost_error, paginate, plan_page_sizes
+from github.ratelimit import execute_graphql, is_rate_limit_error
+
+
+# PR 상태 필터 → GraphQL PullRequestState 목록 (gh pr list와 동일하게 closed는 merged 포함)
+PR_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+    "merged": ["MERGED"],
+    "all": ["OPEN", "CLOSED", "MERGED"],
+}
+
+# PR 상태 필터 → 검색 쿼리 한정자
+PR_SEARCH_QUALIFIERS = {
+    "open": "is:open",
+    "closed": "is:closed",
+    "merged": "is:merged",
+    "all": "",
+}
+
+PR_LIST_FIELDS = """
+  number
+  title
+  url
+  state
+  createdAt
+  updatedAt
+  headRefName
+"""
+
+PAGE_INFO_FIELDS = """
+  pageInfo {
+    hasNextPage
+    endCursor
+  }
+"""
+
+REVIEW_COMMENT_FIELDS = """
+  id
+  databaseId
+  url
+  path
+  diffHunk
+  line
+  startLine
+  originalLine
+  originalStartLine
+  bodyHTML
+  createdAt
+  author {
+    login
+    url
+    avatarUrl
+  }
+"""
+
+# 컴팩트 보기용 리뷰 코멘트 필드 (diffHunk, 아바타 제외, 라인 번호로 위치 표시)
+COMPACT_REVIEW_COMMENT_FIELDS = """
+  id
+  databaseId
+  url
+  path
+  line
+  startLine
+  originalLine
+  originalStartLine
+  bodyHTML
+  createdAt
+  author {
+    login
+    url
+  }
+"""
+
+COMMIT_FIELDS = """
+  commit {
+    abbreviatedOid
+    messageHeadline
+    committedDate
+    author {
+      name
+      user {
+        login
+        url
+        avatarUrl
+      }
+    }
+    url
+  }
+"""
+
+
+# 화면(view)별 조회 필드
+# - full: 모든 코멘트와 diffHunk, 아바타
+# - compact: 스레드의 첫 코멘트만, 가벼운 필드만 (댓글과 diff를 표시하지 않음)
+PR_VIEWS = {
+    "full": {"comment_fields": REVIEW_COMMENT_FIELDS, "thread_comments": None},
+    "compact": {"comment_fields": COMPACT_REVIEW_COMMENT_FIELDS, "thread_comments": 1},
+}
+
+
+def review_thread_fields(comments_first: int, comment_fields: str = REVIEW_COMMENT_FIELDS) -> str:
+    """리뷰 스레드 노드 필드 (코멘트 첫 페이지 포함)"""
+    return f"""
+      id
+      isResolved
+      comments(first: {comments_first}) {{
+        {PAGE_INFO_FIELDS}
+        nodes {{
+          {comment_fields}
+        }}
+      }}
+    """
+
+# 변경 여부 확인(watermark) 쿼리 하나에 묶을 PR 개수
+WATERMARK_BATCH_SIZE = 50
 
 
 class GitHubAPI:
-    """GitHub CLI를 사용한 API 클라이언트"""
+    """GitHub GraphQL/REST API 클라이언트
+
+    실제 호출은 전송 계층(github.transport)이 담당합니다.
+    기본값은 프로세스 전역으로 공유되는 전송 객체입니다.
+    """
+
+    def __init__(self, transport=None, identity=None, repo: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            transport: 전송 객체 (None이면 프로세스 전역 전송 객체 사용)
+            identity: 저장소/사용자 식별 정보 조회 객체 (None이면 프로세스 전역 객체 사용)
+            repo: 고정할 저장소 {"owner", "name"} (None이면 현재 디렉터리의 저장소)
+        """
+        self._transport = transport
+        self.identity = identity or get_identity_resolver()
+        self.repo = dict(repo) if repo else None
+        self._fanout_throttle: Optional[Throttle] = None
+
+    def for_repo(self, owner: str, name: str) -> "GitHubAPI":
+        """
+        같은 전송 객체, 식별 정보, 병렬 조회 속도 제한을 공유하면서 저장소만 고정한 인스턴스 생성
+
+        Args:
+            owner: Repository owner
+            name: Repository name
+
+        Returns:
+            저장소가 고정된 GitHubAPI 인스턴스
+        """
+        api = GitHubAPI(self._transport, self.identity, repo={"owner": owner, "name": name})
+        api._fanout_throttle = self.fanout_throttle
+        return api
+
+    @property
+    def transport(self):
+        """전송 객체 (최초 사용 시 조회)"""
+        if self._transport is None:
+            self._transport = gh_transport.get_transport()
+        return self._transport
+
+    @property
+    def fanout_throttle(self) -> Throttle:
+        """병렬 조회 작업 시작 속도 제한 (인스턴스를 공유하는 모든 호출에 적용)"""
+        if self._fanout_throttle is None:
+            self._fanout_throttle = Throttle(
+                rate=float(self._get_config("GITHUB_FANOUT_RATE", 5)),
+                burst=int(self._get_config("GITHUB_FANOUT_WORKERS", 4)),
+            )
+        return self._fanout_throttle
+
+    def graphql(self, query: str, **variables) -> Dict[str, Any]:
+        """
+        GraphQL 쿼리를 실행하고 응답 JSON을 반환한다.
+
+        쿼리에 rateLimit 필드를 붙여 비용과 남은 예산을 프로세스 전역 governor에 기록하며,
+        bulk 우선순위의 호출은 남은 예산에 따라 늦추거나 미룬다(github.ratelimit 참고).
+
+        Raises:
+            GitHubAPIError: 호출 실패 (사용량 제한이면 status_code 429)
+        """
+        return execute_graphql(self.transport, query, variables)
+
+    def rest(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """REST API를 호출하고 응답 JSON을 반환한다."""
+        return self.transport.rest(method, endpoint, params=params, body=body, headers=headers)
 
     @staticmethod
-    def _extract_line_info(diff_hunk: str) -> str:
-        """diff hunk에서 라인 정보 추출"""
-        if not diff_hunk:
-            return ""
-        
-        lines = diff_hunk.split('\n')
-        for line in lines:
-            if line.startswith('@@'):
-                # @@ -10,7 +10,8 @@ 형태에서 정보 추출
-                return line.strip()
-        return ""
+    def _after(cursor: Optional[str]) -> Dict[str, str]:
+        """after 커서 변수 (첫 페이지에서는 생략)"""
+        return {"after": cursor} if cursor else {}
+
+    @staticmethod
+    def _get_config(key: str, default: Any) -> Any:
+        """애플리케이션 설정값 조회 (애플리케이션 컨텍스트 밖에서는 기본값 사용)"""
+        try:
+            if current_app:
+                return current_app.config.get(key, default)
+        except RuntimeError:
+            pass
+        return default
+
+    @staticmethod
+    def _logger() -> logging.Logger:
+        """애플리케이션 로거 (애플리케이션 컨텍스트 밖에서는 모듈 로거)"""
+        try:
+            return current_app.logger
+        except RuntimeError:
+            return logging.getLogger(__name__)
 
     @staticmethod
     def run_gh(args: List[str]) -> str:
         """gh CLI를 호출하고 stdout을 문자열로 반환한다."""
-        result = subprocess.run(
-            ["gh"] + args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        
-        if result.returncode != 0:
-            error_msg = result.stderr.strip()
-            raise GitHubAPIError(f"gh CLI 오류: {error_msg}")
-        
-        return result.stdout.strip()
+        return gh_transport.run_gh(args)
 
     def get_repo_info(self) -> Dict[str, str]:
-        """현재 repo의 owner, name 을 gh CLI로 조회한다."""
+        """현재 repo의 owner, name 을 조회한다 (고정된 저장소가 없으면 프로세스당 한 번만 계산)."""
+        if self.repo is not None:
+            return dict(self.repo)
         try:
-            owner = self.run_gh(["repo", "view", "--json", "owner", "-q", ".owner.login"])
-            name = self.run_gh(["repo", "view", "--json", "name", "-q", ".name"])
-            return {"owner": owner, "name": name}
-        except GitHubAPIError as e:
+            return self.identity.get_repo_info()
+        except (GitHubAPIError, OSError, KeyError, ValueError) as e:
             raise GitHubAPIError(
                 "현재 디렉터리가 Git 저장소가 아니거나 GitHub 인증이 필요합니다. "
                 "'gh auth login'을 실행하고 Git 저장소 내에서 앱을 실행하세요."
             ) from e
 
-    def get_my_pr_list(self, state: str = "all") -> List[Dict[str, Any]]:
+    def _list_pull_requests(
+        self,
+        owner: str,
+        name: str,
+        state: str,
+        limit: int,
+        author: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
-        내가 생성한 PR 목록을 gh CLI로 조회한다 (기본 정보만).
+        저장소의 PR 목록을 GraphQL로 조회한다 (생성일 최신순).
+
+        author가 주어지면 검색 API(`author:<login>`, `@me` 지원)를 사용한다.
 
         Args:
+            owner: Repository owner
+            name: Repository name
             state: "open", "closed", "merged", "all"
+            limit: 최대 개수
+            author: PR 작성자 필터 (선택)
 
         Returns:
-            PR 정보 리스트 (number, title, url, state, createdAt)
+            PR 정보 리스트 (number, title, url, state, createdAt, updatedAt, headRefName)
         """
-        # 설정에서 PR 목록 제한 가져오기
-        pr_limit = 100
-        try:
-            if current_app:
-                pr_limit = current_app.config.get("MAX_PR_LIST_LIMIT", 100)
-        except RuntimeError:
-            pass
+        if author:
+            search_query = " ".join(filter(None, [
+                f"repo:{owner}/{name}",
+                "is:pr",
+                f"author:{author}",
+                PR_SEARCH_QUALIFIERS.get(state, ""),
+                "sort:created-desc",
+            ]))
+            query = f"""
+              query($q: String!, $first: Int!, $after: String) {{
+                search(query: $q, type: ISSUE, first: $first, after: $after) {{
+                  pageInfo {{
+                    hasNextPage
+                    endCursor
+                  }}
+                  nodes {{
+                    ... on PullRequest {{
+                      {PR_LIST_FIELDS}
+                    }}
+                  }}
+                }}
+              }}
+            """
+            
+            def fetch_page(after: Optional[str], first: int) -> Dict[str, Any]:
+                data = self.graphql(query, q=search_query, first=first, **self._after(after))
+                return (data.get("data") or {}).get("search") or {}
+        else:
+            states = ", ".join(PR_STATES.get(state, PR_STATES["all"]))
+            query = f"""
+              query($owner: String!, $name: String!, $first: Int!, $after: String) {{
+                repository(owner: $owner, name: $name) {{
+                  pullRequests(
+                    states: [{states}],
+                    first: $first,
+                    after: $after,
+                    orderBy: {{field: CREATED_AT, direction: DESC}}
+                  ) {{
+                    pageInfo {{
+                      hasNextPage
+                      endCursor
+                    }}
+                    nodes {{
+                      {PR_LIST_FIELDS}
+                    }}
+                  }}
+                }}
+              }}
+            """
+            
+            def fetch_page(after: Optional[str], first: int) -> Dict[str, Any]:
+                data = self.graphql(query, owner=owner, name=name, first=first, **self._after(after))
+                repository = (data.get("data") or {}).get("repository") or {}
+                return repository.get("pullRequests") or {}
         
-        # gh CLI는 --limit 옵션으로 제한 가능 (기본값 30)
-        args = [
-            "pr", "list",
-            "--author", "@me",
-            "--state", state,
-            "--json", "number,title,url,state,createdAt",
+        # 검색 결과에는 PR이 아닌 노드가 빈 객체로 들어올 수 있음
+        return [
+            pr for pr in paginate(fetch_page, MAX_PAGE_SIZE, limit=limit)
+            if pr.get("number")
         ]
+
+    def list_org_repositories(self, org: str, limit: int = 30) -> List[Dict[str, str]]:
+        """
+        조직의 저장소 목록을 조회한다 (최근 push 순, 보관된 저장소 제외).
+
+        Args:
+            org: 조직 login
+            limit: 최대 개수
+
+        Returns:
+            저장소 정보 리스트 [{"owner", "name"}, ...]
+        """
+        query = """
+          query($org: String!, $first: Int!, $after: String) {
+            organization(login: $org) {
+              repositories(
+                first: $first,
+                after: $after,
+                isArchived: false,
+                orderBy: {field: PUSHED_AT, direction: DESC}
+              ) {
+                pageInfo {
+                  hasNextPage
+                  endCursor
+                }
+                nodes {
+                  name
+                  owner {
+                    login
+                  }
+                }
+              }
+            }
+          }
+        """
+
+        def fetch_page(after: Optional[str], first: int) -> Dict[str, Any]:
+            data = self.graphql(query, org=org, first=first, **self._after(after))
+            organization = (data.get("data") or {}).get("organization")
+            if organization is None:
+                raise GitHubAPIError(f"조직을 찾을 수 없습니다: {org}", status_code=404)
+            return organization.get("repositories") or {}
+
+        return [
+            {"owner": (node.get("owner") or {}).get("login") or org, "name": node["name"]}
+            for node in paginate(fetch_page, MAX_PAGE_SIZE, limit=limit)
+            if node.get("name")
+        ]
+
+    def get_my_pr_list(self, state: str = "all") -> List[Dict[str, Any]]:
+        """
+        내가 생성한 PR 목록을 조회한다 (기본 정보만).
+
+        Args:
+            state: "open", "closed", "merged", "all"
+
+        Returns:
+            PR 정보 리스트 (number, title, url, state, createdAt)
+        """
+        repo = self.get_repo_info()
+        pr_limit = self._get_config("MAX_PR_LIST_LIMIT", 100)
         
-        # 제한값이 기본값(30)보다 크면 --limit 옵션 추가
-        if pr_limit > 30:
-            args.extend(["--limit", str(pr_limit)])
-        
-        output = self.run_gh(args)
-        if not output:
-            return []
-        
-        import json
-        prs = json.loads(output)
-        return prs
+        return self._list_pull_requests(
+            repo["owner"], repo["name"], state, pr_limit, author="@me"
+        )
 
     def get_my_pr_numbers(self, state: str = "all") -> List[int]:
         """
-        내가 생성한 PR 번호 목록을 gh CLI로 조회한다.
+        내가 생성한 PR 번호 목록을 조회한다.
 
         Args:
             state: "open", "closed", "merged", "all"
@@ -106,21 +407,17 @@ class GitHubAPI:
 
     def get_current_user_login(self) -> str:
         """
-        현재 인증된 사용자의 로그인 이름을 조회한다.
+        현재 인증된 사용자의 로그인 이름을 조회한다 (프로세스당 한 번만 호출).
 
         Returns:
             사용자 로그인 이름
         """
         try:
-            login = self.run_gh(["api", "user", "-q", ".login"])
-            return login
-        except GitHubAPIError:
-            # 대체 방법: auth status에서 사용자 정보 가져오기
-            try:
-                status_output = self.run_gh(["auth", "status", "--json", "user", "-q", ".user.login"])
-                return status_output
-            except:
-                raise GitHubAPIError("사용자 정보를 조회할 수 없습니다. 'gh auth login'을 실행하세요.")
+            return self.identity.get_viewer_login()
+        except GitHubAPIError as e:
+            raise GitHubAPIError(
+                "사용자 정보를 조회할 수 없습니다. 'gh auth login'을 실행하세요."
+            ) from e
 
     def get_prs_with_my_review_comments(self, state: str = "open") -> List[Dict[str, Any]]:
         """
@@ -139,40 +436,9 @@ class GitHubAPI:
         # 현재 사용자 로그인 이름 가져오기
         my_login = self.get_current_user_login()
         
-        # 모든 OPEN PR 목록 조회
-        if state == "all":
-            pr_state = "all"
-        elif state == "merged":
-            # merged는 별도로 처리 필요
-            pr_state = "all"
-        else:
-            pr_state = state
-        
-        # 설정에서 PR 목록 제한 가져오기
-        pr_limit = 100
-        try:
-            if current_app:
-                pr_limit = current_app.config.get("MAX_PR_LIST_LIMIT", 100)
-        except RuntimeError:
-            pass
-        
-        # gh CLI는 --limit 옵션으로 제한 가능 (기본값 30)
-        args = [
-            "pr", "list",
-            "--state", pr_state,
-            "--json", "number,title,url,state,createdAt,headRefName",
-        ]
-        
-        # 제한값이 기본값(30)보다 크면 --limit 옵션 추가
-        if pr_limit > 30:
-            args.extend(["--limit", str(pr_limit)])
-        
-        output = self.run_gh(args)
-        
-        if not output:
-            return []
-        
-        all_prs = json.loads(output)
+        # 저장소의 PR 목록 조회
+        pr_limit = self._get_config("MAX_PR_LIST_LIMIT", 100)
+        all_prs = self._list_pull_requests(owner, name, state, pr_limit)
         
         # merged 상태 필터링 (필요한 경우)
         if state == "merged":
@@ -182,98 +448,125 @@ class GitHubAPI:
         elif state == "closed":
             all_prs = [pr for pr in all_prs if pr.get("state") == "CLOSED"]
         
-        # 각 PR에 대해 내가 리뷰 코멘트를 남겼는지 확인
-        prs_with_my_comments = []
+        # 여러 PR을 alias로 묶은 GraphQL 쿼리로 리뷰 코멘트 작성자를 일괄 확인
+        # 우선순위는 호출한 쪽을 따름 (화면 요청은 interactive, 캐시 예열/백그라운드 갱신은 bulk)
+        batch_size = max(1, int(self._get_config("REVIEWED_SCAN_BATCH_SIZE", 10)))
+        reviewed_numbers = set()
         
-        for pr in all_prs:
-            pr_number = pr["number"]
-            
-            # GraphQL로 해당 PR의 리뷰 코멘트 조회
-            # 설정에서 제한값 가져오기 (없으면 기본값 100 사용)
-            max_threads = 100
-            max_comments = 100
+        for start in range(0, len(all_prs), batch_size):
+            batch = [pr["number"] for pr in all_prs[start:start + batch_size]]
             try:
-                if current_app:
-                    max_threads = current_app.config.get("MAX_REVIEW_THREADS", 100)
-                    max_comments = current_app.config.get("MAX_COMMENTS_PER_THREAD", 100)
-            except RuntimeError:
-                # 애플리케이션 컨텍스트 외부에서는 기본값 사용
-                pass
-            
-            query = f"""
-              query($owner: String!, $name: String!, $number: Int!) {{
-                repository(owner: $owner, name: $name) {{
-                  pullRequest(number: $number) {{
-                    reviewThreads(first: {max_threads}) {{
-                      nodes {{
-                        comments(first: {max_comments}) {{
-                          nodes {{
-                            author {{
-                              login
-                            }}
+                reviewed_numbers.update(
+                    self._find_prs_with_comments_by(owner, name, batch, my_login)
+                )
+            except GitHubAPIError as e:
+                # 사용량 제한이면 일부만 확인한 결과를 반환하지 않도록 중단
+                if is_rate_limit_error(e):
+                    raise
+                # 배치 전체가 실패하면 PR 단위로 재시도하고, 실패한 PR만 스킵
+                for pr_number in batch:
+                    try:
+                        reviewed_numbers.update(
+                            self._find_prs_with_comments_by(owner, name, [pr_number], my_login)
+                        )
+                    except GitHubAPIError as e:
+                        if is_rate_limit_error(e):
+                            raise
+                        continue
+        
+        # 원래 PR 목록 순서를 유지
+        prs_with_my_comments = [pr for pr in all_prs if pr["number"] in reviewed_numbers]
+        
+        return prs_with_my_comments
+
+    def _find_prs_with_comments_by(
+        self,
+        owner: str,
+        name: str,
+        pr_numbers: List[int],
+        login: str
+    ) -> List[int]:
+        """
+        여러 PR을 하나의 GraphQL 쿼리로 조회하여 login이 리뷰 코멘트를 남긴 PR 번호를 반환한다.
+
+        각 PR은 `pr_<번호>` alias로 같은 repository 블록 안에 묶인다.
+
+        Args:
+            owner: Repository owner
+            name: Repository name
+            pr_numbers: 확인할 PR 번호 목록
+            login: 찾을 코멘트 작성자 로그인
+
+        Returns:
+            login의 코멘트가 있는 PR 번호 리스트
+        """
+        if not pr_numbers:
+            return []
+        
+        max_threads = self._get_config("MAX_REVIEW_THREADS", 100)
+        max_comments = self._get_config("MAX_COMMENTS_PER_THREAD", 100)
+        
+        pr_fields = "\n".join(
+            f"""
+                pr_{number}: pullRequest(number: {int(number)}) {{
+                  reviewThreads(first: {max_threads}) {{
+                    nodes {{
+                      comments(first: {max_comments}) {{
+                        nodes {{
+                          author {{
+                            login
                           }}
                         }}
                       }}
                     }}
                   }}
-                }}
-              }}
-            """
-            
-            try:
-                raw = self.run_gh([
-                    "api", "graphql",
-                    "-f", f"owner={owner}",
-                    "-f", f"name={name}",
-                    "-F", f"number={pr_number}",
-                    "-f", f"query={query}",
-                ])
-                
-                data = json.loads(raw)
-                threads = (
-                    data.get("data", {})
-                    .get("repository", {})
-                    .get("pullRequest", {})
-                    .get("reviewThreads", {})
-                    .get("nodes", [])
-                )
-                
-                # 내가 작성한 코멘트가 있는지 확인
-                has_my_comment = False
-                for thread in threads:
-                    comments = thread.get("comments", {}).get("nodes", [])
-                    for comment in comments:
-                        author_login = comment.get("author", {}).get("login", "")
-                        if author_login == my_login:
-                            has_my_comment = True
-                            break
-                    if has_my_comment:
-                        break
-                
-                if has_my_comment:
-                    prs_with_my_comments.append(pr)
-                    
-            except GitHubAPIError:
-                # 에러가 발생하면 해당 PR은 스킵
-                continue
+                }}"""
+            for number in pr_numbers
+        )
         
-        return prs_with_my_comments
+        query = f"""
+          query($owner: String!, $name: String!) {{
+            repository(owner: $owner, name: $name) {{
+              {pr_fields}
+            }}
+          }}
+        """
+        
+        data = self.graphql(query, owner=owner, name=name)
+        repository = (data.get("data") or {}).get("repository") or {}
+        
+        found = []
+        for number in pr_numbers:
+            pr = repository.get(f"pr_{number}") or {}
+            threads = (pr.get("reviewThreads") or {}).get("nodes") or []
+            if any(
+                (comment.get("author") or {}).get("login") == login
+                for thread in threads
+                for comment in (thread.get("comments") or {}).get("nodes") or []
+            ):
+                found.append(number)
+        
+        return found
 
     def get_comments_for_pr(
         self,
         owner: str,
         name: str,
         number: int,
-        include_resolved: bool = False
+        include_resolved: bool = False,
+        view: str = "full"
     ) -> Dict[str, Any]:
         """
         단일 PR(number)에 대해 PR 메타 정보 + review comment 목록을 반환한다.
 
+        커밋 목록은 포함하지 않으며(개수만 commitCount로 제공) get_pr_commits로 따로 조회한다.
+
         Args:
             owner: Repository owner
             name: Repository name
             number: PR 번호
             include_resolved: True이면 resolved 코멘트도 포함
+            view: 조회 필드 구성 ("full" 또는 "compact", PR_VIEWS 참고)
 
         Returns:
             {
@@ -295,67 +588,204 @@ class GitHubAPI:
             }
         """
 
-        # 설정에서 제한값 가져오기 (없으면 기본값 100 사용)
-        max_threads = 100
-        max_comments = 100
-        max_commits = 100
-        try:
-            if current_app:
-                max_threads = current_app.config.get("MAX_REVIEW_THREADS", 100)
-                max_comments = current_app.config.get("MAX_COMMENTS_PER_THREAD", 100)
-                max_commits = current_app.config.get("MAX_COMMITS", 100)
-        except RuntimeError:
-            # 애플리케이션 컨텍스트 외부에서는 기본값 사용
-            pass
+        pr, threads_connection = self._fetch_pr_first_page(owner, name, number, view)
+
+        if not pr:
+            return {}
+
+        comments: List[Dict[str, Any]] = []
+
+        # 스레드를 페이지 단위로 스트리밍하며 바로 코멘트 딕셔너리로 변환
+        for thread in self.iter_review_threads(owner, name, number, threads_connection, view):
+            is_resolved = thread.get("isResolved", False)
+            
+            # include_resolved가 False이고 resolved인 경우 스킵
+            if not include_resolved and is_resolved:
+                continue
+
+            comment = self.build_comment(thread)
+            if comment:
+                comments.append(comment)
+
+        # 코멘트를 시간 최신순으로 정렬 (createdAt 기준 내림차순) - itemgetter로 최적화
+        if comments:
+            comments.sort(key=itemgetter("createdAt"), reverse=True)
+
+        return {
+            "number": number,
+            "title": pr.get("title"),
+            "url": pr.get("url"),
+            "state": pr.get("state"),
+            "createdAt": pr.get("createdAt"),
+            "updatedAt": pr.get("updatedAt"),
+            "headRefOid": pr.get("headRefOid"),
+            "author": (pr.get("author") or {}).get("login"),
+            "comments": comments,
+            "commitCount": (pr.get("commits") or {}).get("totalCount", 0),
+        }
+
+    def get_pr_commits(self, owner: str, name: str, number: int) -> List[Dict[str, Any]]:
+        """
+        PR의 커밋 목록을 조회한다 (커밋 목록을 펼쳤을 때만 호출).
+
+        Args:
+            owner: Repository owner
+            name: Repository name
+            number: PR 번호
+
+        Returns:
+            커밋 딕셔너리 리스트 (committedDate 최신순)
+        """
+        commits = [
+            self.build_commit(commit_node)
+            for commit_node in self.iter_commits(owner, name, number)
+        ]
+
+        # 커밋을 시간 최신순으로 정렬 (committedDate 기준 내림차순) - itemgetter로 최적화
+        if commits:
+            commits.sort(key=itemgetter("committedDate"), reverse=True)
+        return commits
+
+    def get_pr_watermarks(
+        self,
+        owner: str,
+        name: str,
+        pr_numbers: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        여러 PR의 변경 여부 판단용 메타 정보(updatedAt, headRefOid 등)를 일괄 조회한다.
+
+        PR 50개씩 `pr_<번호>` alias로 묶어 가벼운 필드만 요청한다.
+
+        Args:
+            owner: Repository owner
+            name: Repository name
+            pr_numbers: PR 번호 목록
+
+        Returns:
+            {PR 번호: {"number", "title", "state", "updatedAt", "headRefOid", "commits": {"totalCount"}}}
+            (없는 PR은 제외)
+        """
+        watermarks: Dict[int, Dict[str, Any]] = {}
+        
+        for start in range(0, len(pr_numbers), WATERMARK_BATCH_SIZE):
+            batch = pr_numbers[start:start + WATERMARK_BATCH_SIZE]
+            pr_fields = "\n".join(
+                f"""
+                    pr_{int(number)}: pullRequest(number: {int(number)}) {{
+                      number
+                      title
+                      state
+                      updatedAt
+                      headRefOid
+                      commits {{
+                        totalCount
+                      }}
+                    }}"""
+                for number in batch
+            )
+            query = f"""
+              query($owner: String!, $name: String!) {{
+                repository(owner: $owner, name: $name) {{
+                  {pr_fields}
+                }}
+              }}
+            """
+            
+            data = self.graphql(query, owner=owner, name=name)
+            repository = (data.get("data") or {}).get("repository") or {}
+            for number in batch:
+                pr = repository.get(f"pr_{int(number)}")
+                if pr:
+                    watermarks[int(number)] = pr
+        
+        return watermarks
+
+    def get_review_comments_since(
+        self,
+        owner: str,
+        name: str,
+        number: int,
+        since: str
+    ) -> List[Dict[str, Any]]:
+        """
+        since 이후 생성/수정된 리뷰 코멘트를 REST API로 조회한다.
+
+        GraphQL 코멘트 노드와 같은 형태로 변환하고, 댓글이면 `inReplyTo`에
+        스레드 첫 코멘트의 databaseId를 담는다.
+
+        Args:
+            owner: Repository owner
+            name: Repository name
+            number: PR 번호
+            since: ISO 8601 타임스탬프
+
+        Returns:
+            코멘트 노드 리스트
+        """
+        endpoint = f"repos/{owner}/{name}/pulls/{number}/comments"
+        per_page = 100
+        comments: List[Dict[str, Any]] = []
+        page = 1
         
+        while True:
+            items = self.rest(
+                "GET",
+                endpoint,
+                params={"since": since, "per_page": per_page, "page": page},
+                headers={"Accept": "application/vnd.github.full+json"},
+            ) or []
+            
+            for item in items:
+                user = item.get("user") or {}
+                comments.append({
+                    "id": item.get("node_id"),
+                    "databaseId": item.get("id"),
+                    "inReplyTo": item.get("in_reply_to_id"),
+                    "url": item.get("html_url"),
+                    "path": item.get("path"),
+                    "diffHunk": item.get("diff_hunk"),
+                    "line": item.get("line"),
+                    "startLine": item.get("start_line"),
+                    "originalLine": item.get("original_line"),
+                    "originalStartLine": item.get("original_start_line"),
+                    "bodyHTML": item.get("body_html"),
+                    "createdAt": item.get("created_at"),
+                    "author": {
+                        "login": user.get("login"),
+                        "url": user.get("html_url"),
+                        "avatarUrl": user.get("avatar_url"),
+                    } if user else None,
+                })
+            
+            if len(items) < per_page:
+                return comments
+            page += 1
+
+    def get_thread_states(
+        self,
+        owner: str,
+        name: str,
+        number: int
+    ) -> Dict[int, bool]:
+        """
+        PR의 모든 리뷰 스레드의 해결 여부를 가볍게 조회한다.
+
+        Returns:
+            {스레드 첫 코멘트의 databaseId: isResolved}
+        """
         query = f"""
-          query($owner: String!, $name: String!, $number: Int!) {{
+          query($owner: String!, $name: String!, $number: Int!, $first: Int!, $after: String) {{
             repository(owner: $owner, name: $name) {{
               pullRequest(number: $number) {{
-                number
-                title
-                url
-                state
-                createdAt
-                author {{
-                  login
-                }}
-                reviewThreads(first: {max_threads}) {{
+                reviewThreads(first: $first, after: $after) {{
+                  {PAGE_INFO_FIELDS}
                   nodes {{
                     isResolved
-                    comments(first: {max_comments}) {{
+                    comments(first: 1) {{
                       nodes {{
-                        id
                         databaseId
-                        url
-                        path
-                        diffHunk
-                        bodyHTML
-                        createdAt
-                        author {{
-                          login
-                          url
-                          avatarUrl
-                        }}
-                      }}
-                    }}
-                  }}
-                }}
-                commits(first: {max_commits}) {{
-                  nodes {{
-                    commit {{
-                      abbreviatedOid
-                      messageHeadline
-                      committedDate
-                      author {{
-                        name
-                        user {{
-                          login
-                          url
-                          avatarUrl
-                        }}
                       }}
-                      url
                     }}
                   }}
                 }}
@@ -363,129 +793,335 @@ class GitHubAPI:
             }}
           }}
         """
+        
+        def fetch_page(after: Optional[str], first: int) -> Dict[str, Any]:
+            data = self.graphql(
+                query, owner=owner, name=name, number=number, first=first, **self._after(after)
+            )
+            pr = ((data.get("data") or {}).get("repository") or {}).get("pullRequest") or {}
+            return pr.get("reviewThreads") or {}
+        
+        states: Dict[int, bool] = {}
+        for thread in paginate(fetch_page, MAX_PAGE_SIZE):
+            nodes = (thread.get("comments") or {}).get("nodes") or []
+            if nodes and nodes[0].get("databaseId") is not None:
+                states[nodes[0]["databaseId"]] = thread.get("isResolved", False)
+        return states
+
+    def _page_sizes(self, view: str = "full") -> Dict[str, int]:
+        """
+        설정(MAX_*, GRAPHQL_NODE_BUDGET)에 따라 connection별 페이지 크기를 정한다.
 
-        raw = self.run_gh([
-            "api", "graphql",
-            "-f", f"owner={owner}",
-            "-f", f"name={name}",
-            "-F", f"number={number}",
-            "-f", f"query={query}",
-        ])
+        스레드당 코멘트를 하나만 받는 보기(compact)는 그만큼 스레드 페이지를 크게 잡는다.
 
-        data = json.loads(raw)
+        Args:
+            view: 조회 필드 구성 ("full" 또는 "compact")
 
-        pr = (
-            data.get("data", {})
-            .get("repository", {})
-            .get("pullRequest", {})
+        Returns:
+            {"threads": ..., "comments": ..., "commits": ...}
+        """
+        node_budget = int(self._get_config("GRAPHQL_NODE_BUDGET", 2500))
+        threads, comments = plan_page_sizes(
+            node_budget,
+            self._get_config("MAX_REVIEW_THREADS", 100),
+            PR_VIEWS[view]["thread_comments"] or self._get_config("MAX_COMMENTS_PER_THREAD", 100),
         )
+        commits = max(1, min(self._get_config("MAX_COMMITS", 100), MAX_PAGE_SIZE))
+        return {"threads": threads, "comments": comments, "commits": commits}
 
-        if not pr:
-            return {}
+    def _fetch_pr_first_page(
+        self,
+        owner: str,
+        name: str,
+        number: int,
+        view: str = "full"
+    ) -> tuple:
+        """
+        PR 메타 정보와 리뷰 스레드의 첫 페이지를 한 번의 쿼리로 조회한다.
 
-        threads = (
-            pr.get("reviewThreads", {})
-            .get("nodes", [])
-        )
+        커밋은 개수(totalCount)만 조회한다.
+        타임아웃/노드 제한으로 실패하면 노드 예산을 절반으로 줄여 재시도한다.
 
-        comments: List[Dict[str, Any]] = []
+        Args:
+            owner: Repository owner
+            name: Repository name
+            number: PR 번호
+            view: 조회 필드 구성 ("full" 또는 "compact")
 
-        for thread in threads:
-            is_resolved = thread.get("isResolved", False)
+        Returns:
+            (PR 딕셔너리, 스레드 connection)
+        """
+        sizes = self._page_sizes(view)
+        comment_fields = PR_VIEWS[view]["comment_fields"]
+        
+        while True:
+            query = f"""
+              query($owner: String!, $name: String!, $number: Int!) {{
+                repository(owner: $owner, name: $name) {{
+                  pullRequest(number: $number) {{
+                    number
+                    title
+                    url
+                    state
+                    createdAt
+                    updatedAt
+                    headRefOid
+                    author {{
+                      login
+                    }}
+                    reviewThreads(first: {sizes["threads"]}) {{
+                      {PAGE_INFO_FIELDS}
+                      nodes {{
+                        {review_thread_fields(sizes["comments"], comment_fields)}
+                      }}
+                    }}
+                    commits {{
+                      totalCount
+                    }}
+                  }}
+                }}
+              }}
+            """
             
-            # include_resolved가 False이고 resolved인 경우 스킵
-            if not include_resolved and is_resolved:
-                continue
+            try:
+                data = self.graphql(query, owner=owner, name=name, number=number)
+                break
+            except GitHubAPIError as e:
+                # 이 쿼리의 크기를 정하는 것은 스레드/코멘트 페이지뿐 (커밋은 개수만 조회)
+                if not is_cost_error(e) or max(sizes["threads"], sizes["comments"]) == 1:
+                    raise
+                sizes = {key: max(1, value // 2) for key, value in sizes.items()}
 
-            nodes = thread.get("comments", {}).get("nodes", []) or []
-            
-            # 첫 번째 코멘트가 원래 리뷰, 나머지는 댓글(replies)
-            if not nodes:
-                continue
-            
-            # 첫 번째 코멘트 (원래 리뷰)
-            first_comment = nodes[0]
-            author = first_comment.get("author") or {}
-            diff_hunk = first_comment.get("diffHunk") or ""
-            
-            # diff hunk를 마지막 10줄만 보여주기 (코멘트가 달린 라인 주위) - 최적화
-            if diff_hunk and '\n' in diff_hunk:
-                lines = diff_hunk.split('\n')
-                line_count = len(lines)
-                if line_count > 10:
-                    diff_hunk = '... (위 생략됨)\n' + '\n'.join(lines[-10:])
-            
-            # 파일 경로와 라인 번호 추출
-            path = first_comment.get("path") or ""
-            line_info = self._extract_line_info(diff_hunk) if diff_hunk else ""
-            
-            # 나머지 코멘트들을 댓글로 처리 - 최적화
-            replies = []
-            if len(nodes) > 1:
-                for reply_comment in nodes[1:]:
-                    reply_author = reply_comment.get("author")
-                    if reply_author:
-                        replies.append({
-                            "id": reply_comment.get("id"),
-                            "bodyHTML": reply_comment.get("bodyHTML"),
-                            "createdAt": reply_comment.get("createdAt"),
-                            "author": reply_author.get("login"),
-                            "authorUrl": reply_author.get("url"),
-                            "avatarUrl": reply_author.get("avatarUrl"),
-                        })
-            
-            comments.append({
-                "id": first_comment.get("id"),
-                "databaseId": first_comment.get("databaseId"),
-                "url": first_comment.get("url"),
-                "path": path,
-                "diffHunk": diff_hunk,
-                "lineInfo": line_info,
-                "author": author.get("login"),
-                "authorUrl": author.get("url"),
-                "avatarUrl": author.get("avatarUrl"),
-                "bodyHTML": first_comment.get("bodyHTML"),
-                "createdAt": first_comment.get("createdAt"),
-                "isResolved": is_resolved,
-                "replies": replies,
-            })
+        pr = (
+            (data.get("data") or {})
+            .get("repository", {})
+            .get("pullRequest")
+        ) or {}
 
-        # 코멘트를 시간 최신순으로 정렬 (createdAt 기준 내림차순) - itemgetter로 최적화
-        if comments:
-            comments.sort(key=itemgetter("createdAt"), reverse=True)
+        return pr, pr.get("reviewThreads")
 
-        # 커밋 목록 처리
-        commits = []
-        commit_nodes = pr.get("commits", {}).get("nodes", []) or []
-        for commit_node in commit_nodes:
-            commit = commit_node.get("commit", {})
-            author_info = commit.get("author", {})
-            user_info = author_info.get("user") or {}
-            
-            commits.append({
-                "abbreviatedOid": commit.get("abbreviatedOid"),
-                "messageHeadline": commit.get("messageHeadline"),
-                "committedDate": commit.get("committedDate"),
-                "authorName": author_info.get("name"),
-                "authorLogin": user_info.get("login"),
-                "authorUrl": user_info.get("url"),
-                "avatarUrl": user_info.get("avatarUrl"),
-                "url": commit.get("url"),
-            })
+    def iter_review_threads(
+        self,
+        owner: str,
+        name: str,
+        number: int,
+        first_connection: Optional[Dict[str, Any]] = None,
+        view: str = "full"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        PR의 리뷰 스레드를 커서 페이지네이션으로 스트리밍한다.
 
-        # 커밋을 시간 최신순으로 정렬 (committedDate 기준 내림차순) - itemgetter로 최적화
-        if commits:
-            commits.sort(key=itemgetter("committedDate"), reverse=True)
+        full 보기에서는 각 스레드의 코멘트도 끝까지 따라가며, yield되는 스레드의
+        `comments`는 모든 코멘트 노드의 리스트이다. 스레드당 코멘트 수가 정해진
+        보기(compact)는 첫 페이지의 코멘트만 사용한다.
+
+        Args:
+            owner: Repository owner
+            name: Repository name
+            number: PR 번호
+            first_connection: 이미 받아온 첫 페이지 (있으면 다음 페이지부터 요청)
+            view: 조회 필드 구성 ("full" 또는 "compact")
+
+        Yields:
+            {"id", "isResolved", "comments": [코멘트 노드, ...]}
+        """
+        sizes = self._page_sizes(view)
+        comment_fields = PR_VIEWS[view]["comment_fields"]
+        follow_comments = PR_VIEWS[view]["thread_comments"] is None
+        query = f"""
+          query($owner: String!, $name: String!, $number: Int!, $first: Int!, $after: String) {{
+            repository(owner: $owner, name: $name) {{
+              pullRequest(number: $number) {{
+                reviewThreads(first: $first, after: $after) {{
+                  {PAGE_INFO_FIELDS}
+                  nodes {{
+                    {review_thread_fields(sizes["comments"], comment_fields)}
+                  }}
+                }}
+              }}
+            }}
+          }}
+        """
+        
+        def fetch_page(after: Optional[str], first: int) -> Dict[str, Any]:
+            data = self.graphql(
+                query, owner=owner, name=name, number=number, first=first, **self._after(after)
+            )
+            pr = ((data.get("data") or {}).get("repository") or {}).get("pullRequest") or {}
+            return pr.get("reviewThreads") or {}
+        
+        for thread in paginate(fetch_page, sizes["threads"], first_connection):
+            if follow_comments:
+                comments = list(self._iter_thread_comments(thread, sizes["comments"]))
+            else:
+                comments = (thread.get("comments") or {}).get("nodes") or []
+            yield {
+                "id": thread.get("id"),
+                "isResolved": thread.get("isResolved", False),
+                "comments": comments,
+            }
+
+    def _iter_thread_comments(
+        self,
+        thread: Dict[str, Any],
+        page_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        """스레드의 코멘트를 첫 페이지부터 끝까지 스트리밍한다."""
+        query = f"""
+          query($id: ID!, $first: Int!, $after: String) {{
+            node(id: $id) {{
+              ... on PullRequestReviewThread {{
+                comments(first: $first, after: $after) {{
+                  {PAGE_INFO_FIELDS}
+                  nodes {{
+                    {REVIEW_COMMENT_FIELDS}
+                  }}
+                }}
+              }}
+            }}
+          }}
+        """
+        
+        def fetch_page(after: Optional[str], first: int) -> Dict[str, Any]:
+            data = self.graphql(query, id=thread["id"], first=first, **self._after(after))
+            return ((data.get("data") or {}).get("node") or {}).get("comments") or {}
+        
+        return paginate(fetch_page, page_size, thread.get("comments") or {})
+
+    def iter_commits(
+        self,
+        owner: str,
+        name: str,
+        number: int,
+        first_connection: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        PR의 커밋을 커서 페이지네이션으로 스트리밍한다.
+
+        Args:
+            owner: Repository owner
+            name: Repository name
+            number: PR 번호
+            first_connection: 이미 받아온 첫 페이지 (있으면 다음 페이지부터 요청)
 
+        Yields:
+            PullRequestCommit 노드 ({"commit": {...}})
+        """
+        query = f"""
+          query($owner: String!, $name: String!, $number: Int!, $first: Int!, $after: String) {{
+            repository(owner: $owner, name: $name) {{
+              pullRequest(number: $number) {{
+                commits(first: $first, after: $after) {{
+                  {PAGE_INFO_FIELDS}
+                  nodes {{
+                    {COMMIT_FIELDS}
+                  }}
+                }}
+              }}
+            }}
+          }}
+        """
+        
+        def fetch_page(after: Optional[str], first: int) -> Dict[str, Any]:
+            data = self.graphql(
+                query, owner=owner, name=name, number=number, first=first, **self._after(after)
+            )
+            pr = ((data.get("data") or {}).get("repository") or {}).get("pullRequest") or {}
+            return pr.get("commits") or {}
+        
+        return paginate(fetch_page, self._page_sizes()["commits"], first_connection)
+
+    @staticmethod
+    def _format_line_range(comment_node: Dict[str, Any]) -> str:
+        """코멘트 노드의 라인 번호 필드를 "L10-L12" 형식으로 변환한다 (없으면 빈 문자열)."""
+        end = comment_node.get("line") or comment_node.get("originalLine")
+        if not end:
+            return ""
+        start = comment_node.get("startLine") or comment_node.get("originalStartLine")
+        if start and start != end:
+            return f"L{start}-L{end}"
+        return f"L{end}"
+
+    @staticmethod
+    def build_reply(comment_node: Dict[str, Any]) -> Dict[str, Any]:
+        """코멘트 노드를 화면용 댓글 딕셔너리로 변환한다."""
+        author = comment_node.get("author") or {}
         return {
-            "number": number,
-            "title": pr.get("title"),
-            "url": pr.get("url"),
-            "state": pr.get("state"),
-            "createdAt": pr.get("createdAt"),
-            "author": pr.get("author", {}).get("login"),
-            "comments": comments,
-            "commits": commits,
+            "id": comment_node.get("id"),
+            "bodyHTML": comment_node.get("bodyHTML"),
+            "createdAt": comment_node.get("createdAt"),
+            "author": author.get("login"),
+            "authorUrl": author.get("url"),
+            "avatarUrl": author.get("avatarUrl"),
+        }
+
+    def build_comment(self, thread: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        리뷰 스레드를 화면용 코멘트 딕셔너리로 변환한다.
+
+        첫 번째 코멘트가 원래 리뷰이고, 나머지는 댓글(replies)이다.
+
+        Returns:
+            코멘트 딕셔너리 (스레드에 코멘트가 없으면 None)
+        """
+        nodes = thread.get("comments") or []
+        if not nodes:
+            return None
+        
+        # 첫 번째 코멘트 (원래 리뷰)
+        first_comment = nodes[0]
+        author = first_comment.get("author") or {}
+        diff_hunk = first_comment.get("diffHunk") or ""
+        
+        # diff hunk 파싱 (같은 내용은 한 번만 계산): 화면에는 코멘트가 달린 라인 주위의 마지막 10줄만 표시
+        hunk = parse_hunk(diff_hunk) if diff_hunk else None
+        if hunk is not None:
+            diff_hunk = hunk_text(hunk)
+        
+        # 파일 경로와 라인 번호 추출 (보기와 관계없이 라인 번호 필드로 같은 "L10-L12" 형식)
+        path = first_comment.get("path") or ""
+        line_info = self._format_line_range(first_comment)
+        
+        # 나머지 코멘트들을 댓글로 처리 (작성자가 없는 코멘트는 제외)
+        replies = [
+            self.build_reply(reply_comment)
+            for reply_comment in nodes[1:]
+            if reply_comment.get("author")
+        ]
+        
+        return {
+            "id": first_comment.get("id"),
+            "databaseId": first_comment.get("databaseId"),
+            "url": first_comment.get("url"),
+            "path": path,
+            "diffHunk": diff_hunk,
+            "lineInfo": line_info,
+            "hunk": hunk,
+            "author": author.get("login"),
+            "authorUrl": author.get("url"),
+            "avatarUrl": author.get("avatarUrl"),
+            "bodyHTML": first_comment.get("bodyHTML"),
+            "createdAt": first_comment.get("createdAt"),
+            "isResolved": thread.get("isResolved", False),
+            "replies": replies,
+        }
+
+    @staticmethod
+    def build_commit(commit_node: Dict[str, Any]) -> Dict[str, Any]:
+        """PullRequestCommit 노드를 화면용 커밋 딕셔너리로 변환한다."""
+        commit = commit_node.get("commit") or {}
+        author_info = commit.get("author") or {}
+        user_info = author_info.get("user") or {}
+        
+        return {
+            "abbreviatedOid": commit.get("abbreviatedOid"),
+            "messageHeadline": commit.get("messageHeadline"),
+            "committedDate": commit.get("committedDate"),
+            "authorName": author_info.get("name"),
+            "authorLogin": user_info.get("login"),
+            "authorUrl": user_info.get("url"),
+            "avatarUrl": user_info.get("avatarUrl"),
+            "url": commit.get("url"),
         }
 
     def get_all_comments(
@@ -509,12 +1145,28 @@ class GitHubAPI:
 
         pr_numbers = self.get_my_pr_numbers(state=state)
 
+        # PR별 조회를 제한된 워커로 병렬 실행 (결과는 PR 목록 순서 유지)
+        results = fan_out(
+            pr_numbers,
+            lambda pr_number: self.get_comments_for_pr(
+                owner, name, pr_number, include_resolved=include_resolved
+            ),
+            max_workers=int(self._get_config("GITHUB_FANOUT_WORKERS", 4)),
+            throttle=self.fanout_throttle,
+        )
+
         prs_with_comments: List[Dict[str, Any]] = []
+        errors = []
 
-        for pr_number in pr_numbers:
-            pr_data = self.get_comments_for_pr(
-                owner, name, pr_number, include_resolved=include_resolved
-            )
+        for result in results:
+            if result.error is not None:
+                # 실패한 PR만 스킵하고 나머지는 계속 표시
+                errors.append(result.error)
+                self._logger().warning(
+                    f"PR #{result.item} 코멘트 조회 실패: {result.error}"
+                )
+                continue
+            pr_data = result.value
             if not pr_data:
                 continue
             if not pr_data.get("comments"):
@@ -522,6 +1174,10 @@ class GitHubAPI:
 
             prs_with_comments.append(pr_data)
 
+        # 모든 PR이 실패했다면 (인증 오류 등) 빈 목록 대신 에러를 전달
+        if errors and len(errors) == len(results):
+            raise errors[0]
+
         return prs_with_comments
 
     def add_reply_to_comment(
@@ -554,13 +1210,41 @@ class GitHubAPI:
         
         endpoint = f"repos/{owner}/{name}/pulls/{pr_number}/comments"
         
-        # -F 플래그로 정수 타입 전달
-        raw = self.run_gh([
-            "api",
+        # in_reply_to는 정수 타입으로 전달
+        return self.rest(
+            "POST",
             endpoint,
-            "-X", "POST",
-            "-f", f"body={body}",
-            "-F", f"in_reply_to={comment_id_int}",
-        ])
-        
-        return json.loads(raw)
+            body={"body": body, "in_reply_to": comment_id_int},
+        )
+
+
+# 프로세스 전역 GitHubAPI 인스턴스 (저장소를 고정한 인스턴스는 "owner/name"별로 하나씩)
+_github_api: Optional[GitHubAPI] = None
+_repo_apis: Dict[str, GitHubAPI] = {}
+_github_api_lock = threading.Lock()
+
+
+def get_github_api(repo: Optional[str] = None) -> GitHubAPI:
+    """
+    프로세스 전역 GitHubAPI 인스턴스 조회 (모든 서비스가 공유)
+
+    Args:
+        repo: "owner/name" (None이면 현재 디렉터리의 저장소를 사용하는 기본 인스턴스)
+
+    Returns:
+        GitHubAPI 인스턴스 (저장소별 인스턴스도 전송 객체와 속도 제한을 공유)
+    """
+    global _github_api
+    if _github_api is None:
+        with _github_api_lock:
+            if _github_api is None:
+                _github_api = GitHubAPI()
+    if repo is None:
+        return _github_api
+
+    api = _repo_apis.get(repo)
+    if api is None:
+        owner, name = repo.split("/", 1)
+        with _github_api_lock:
+            api = _repo_apis.setdefault(repo, _github_api.for_repo(owner, name))
+    return api
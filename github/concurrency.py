@@ -0,0 +1,137 @@
+"""GitHub API 병렬 호출 도우미
+
+여러 PR(또는 저장소)에 대한 조회를 제한된 개수의 워커 스레드로 병렬 실행합니다.
+
+- 결과는 입력 순서대로 반환 (완료 순서와 무관)
+- 항목별로 에러를 격리 (한 PR 실패가 전체를 실패시키지 않음)
+- 동시에 실행 중인 작업 수는 워커 수로, 작업 시작 속도는 Throttle로 제한
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional
+
+from flask import current_app
+
+from github.ratelimit import current_priority, priority
+
+
+class FanOutResult(NamedTuple):
+    """병렬 실행 결과 한 건"""
+
+    item: Any
+    value: Any = None
+    error: Optional[BaseException] = None
+
+
+class Throttle:
+    """초당 작업 시작 횟수를 제한하는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate: 초당 허용 작업 수 (0 이하이면 제한 없음)
+            burst: 한 번에 몰아서 시작할 수 있는 최대 작업 수 (None이면 rate와 같음)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, float(burst if burst is not None else rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """토큰을 하나 얻을 때까지 대기"""
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_seconds = (1 - self._tokens) / self.rate
+
+            time.sleep(wait_seconds)
+
+
+def fan_out(
+    items: Iterable[Any],
+    fn: Callable[[Any], Any],
+    max_workers: int = 4,
+    throttle: Optional[Throttle] = None
+) -> List[FanOutResult]:
+    """
+    items 각각에 fn을 병렬로 적용한다.
+
+    애플리케이션 컨텍스트 안에서 호출되면 워커 스레드에도 같은 앱의 컨텍스트를
+    열어 주므로 fn 안에서 current_app 설정과 로거를 그대로 사용할 수 있다.
+    워커의 GitHub 요청은 호출한 쪽의 우선순위(github.ratelimit)를 그대로 따른다.
+    제출은 실행 중인 작업이 max_workers개를 넘지 않도록 완료되는 만큼만 이루어진다.
+
+    Args:
+        items: 입력 항목
+        fn: 항목 하나를 처리하는 함수
+        max_workers: 최대 동시 실행 작업 수
+        throttle: 작업 시작 속도 제한 (선택)
+
+    Returns:
+        입력 순서대로 정렬된 FanOutResult 리스트
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    try:
+        app = current_app._get_current_object()
+    except RuntimeError:
+        app = None
+
+    caller_priority = current_priority()
+
+    def run(item: Any) -> Any:
+        if throttle is not None:
+            throttle.acquire()
+        with priority(caller_priority):
+            if app is None:
+                return fn(item)
+            with app.app_context():
+                return fn(item)
+
+    max_workers = max(1, min(max_workers, len(items)))
+    results: List[Optional[FanOutResult]] = [None] * len(items)
+
+    if max_workers == 1:
+        for index, item in enumerate(items):
+            try:
+                results[index] = FanOutResult(item, run(item))
+            except Exception as e:
+                results[index] = FanOutResult(item, error=e)
+        return results
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="github-fanout") as executor:
+        pending = {}
+        next_index = 0
+
+        while next_index < len(items) or pending:
+            # 실행 중인 작업이 워커 수만큼 찰 때까지만 제출 (백프레셔)
+            while next_index < len(items) and len(pending) < max_workers:
+                future = executor.submit(run, items[next_index])
+                pending[future] = next_index
+                next_index += 1
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    results[index] = FanOutResult(items[index], future.result())
+                else:
+                    results[index] = FanOutResult(items[index], error=error)
+
+    return results
@@ -0,0 +1,253 @@
+"""저장소/사용자 식별 정보 조회
+
+현재 작업 디렉터리의 `.git/config`에서 GitHub remote를 직접 파싱하여 저장소
+owner/name을 구하고, 인증된 사용자 로그인은 GraphQL `viewer`로 한 번만 조회합니다.
+두 값 모두 프로세스당 한 번만 계산되어 모든 서비스가 공유합니다.
+"""
+
+import json
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from app.exceptions import GitHubAPIError
+from github import transport as gh_transport
+from github.ratelimit import execute_graphql
+
+# gh CLI와 같은 remote 우선순위 (나머지는 설정 파일 순서)
+REMOTE_PRIORITY = ("upstream", "github", "origin")
+
+_SECTION_RE = re.compile(r'^\s*\[\s*([^\s\]"]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+_SCP_URL_RE = re.compile(r'^(?:[^@/]+@)?([^:/]+):(?!//)/?(.+)$')
+_URL_RE = re.compile(r'^[a-z+]+://(?:[^@/]+@)?([^/:]+)(?::\d+)?/(.+)$')
+
+
+def find_git_config(start_dir: str) -> Optional[str]:
+    """
+    start_dir에서 상위로 올라가며 Git 설정 파일 경로를 찾는다.
+
+    `.git`이 파일인 경우(worktree, submodule)에는 `gitdir:`가 가리키는 디렉터리와
+    그 `commondir`을 따라간다.
+
+    Args:
+        start_dir: 탐색 시작 디렉터리
+
+    Returns:
+        config 파일 경로 (찾지 못하면 None)
+    """
+    current = os.path.abspath(start_dir)
+
+    while True:
+        dot_git = os.path.join(current, ".git")
+
+        if os.path.isdir(dot_git):
+            git_dir = dot_git
+        elif os.path.isfile(dot_git):
+            with open(dot_git, encoding="utf-8") as f:
+                content = f.read().strip()
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = os.path.join(current, content[len("gitdir:"):].strip())
+        else:
+            parent = os.path.dirname(current)
+            if parent == current:
+                return None
+            current = parent
+            continue
+
+        commondir_file = os.path.join(git_dir, "commondir")
+        if os.path.isfile(commondir_file):
+            with open(commondir_file, encoding="utf-8") as f:
+                git_dir = os.path.join(git_dir, f.read().strip())
+
+        config_path = os.path.join(git_dir, "config")
+        return config_path if os.path.isfile(config_path) else None
+
+
+def parse_remote_urls(config_text: str) -> List[Tuple[str, str]]:
+    """
+    Git 설정 파일 내용에서 (remote 이름, url) 목록을 파일 순서대로 추출한다.
+
+    Args:
+        config_text: `.git/config` 파일 내용
+
+    Returns:
+        (remote 이름, url) 튜플 리스트
+    """
+    remotes = []
+    remote_name = None
+
+    for line in config_text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+
+        section = _SECTION_RE.match(stripped)
+        if section:
+            is_remote = section.group(1).lower() == "remote"
+            remote_name = section.group(2) if is_remote else None
+            continue
+
+        if remote_name is None or "=" not in stripped:
+            continue
+
+        key, value = stripped.split("=", 1)
+        if key.strip().lower() == "url":
+            remotes.append((remote_name, value.strip().strip('"')))
+
+    return remotes
+
+
+def parse_github_url(url: str) -> Optional[Tuple[str, str, str]]:
+    """
+    remote URL에서 (host, owner, name)을 추출한다.
+
+    지원 형식: `git@host:owner/name.git`, `ssh://git@host/owner/name`,
+    `https://host/owner/name.git`
+
+    Args:
+        url: remote URL
+
+    Returns:
+        (host, owner, name) 튜플 (형식이 맞지 않으면 None)
+    """
+    match = _URL_RE.match(url) or _SCP_URL_RE.match(url)
+    if not match:
+        return None
+
+    host, path = match.group(1), match.group(2)
+    parts = path.strip("/").split("/")
+    if len(parts) != 2:
+        return None
+
+    owner, name = parts
+    if name.endswith(".git"):
+        name = name[:-4]
+    if not owner or not name:
+        return None
+
+    return host.lower(), owner, name
+
+
+class IdentityResolver:
+    """저장소 owner/name과 현재 사용자 로그인을 프로세스당 한 번만 조회하는 클래스"""
+
+    def __init__(self, repo_dir: Optional[str] = None, transport=None):
+        """
+        Args:
+            repo_dir: Git 저장소 디렉터리 (None이면 현재 작업 디렉터리)
+            transport: viewer 조회에 사용할 전송 객체 (None이면 프로세스 전역 전송 객체)
+        """
+        self.repo_dir = repo_dir or os.getcwd()
+        self._transport = transport
+        self._repo_info: Optional[Dict[str, str]] = None
+        self._viewer_login: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _resolve_repo_from_git_config(self) -> Optional[Dict[str, str]]:
+        """
+        `.git/config`의 remote 중 GitHub 저장소를 찾는다.
+
+        GH_HOST(기본값 github.com) 이외의 호스트(GitLab, Bitbucket 등)를 가리키는 remote는
+        제외하며, 남는 remote가 없으면 None을 반환하여 `gh repo view`로 넘어간다.
+        """
+        config_path = find_git_config(self.repo_dir)
+        if not config_path:
+            return None
+
+        with open(config_path, encoding="utf-8") as f:
+            remotes = parse_remote_urls(f.read())
+
+        github_host = os.environ.get("GH_HOST", "github.com").lower()
+        candidates = []
+        for index, (remote_name, url) in enumerate(remotes):
+            parsed = parse_github_url(url)
+            if not parsed:
+                continue
+            host, owner, name = parsed
+            if host != github_host:
+                continue
+            priority = (
+                REMOTE_PRIORITY.index(remote_name)
+                if remote_name in REMOTE_PRIORITY else len(REMOTE_PRIORITY)
+            )
+            candidates.append(((priority, index), owner, name))
+
+        if not candidates:
+            return None
+
+        _, owner, name = min(candidates)
+        return {"owner": owner, "name": name}
+
+    @staticmethod
+    def _resolve_repo_from_env() -> Optional[Dict[str, str]]:
+        """GH_REPO 환경 변수([HOST/]OWNER/REPO)에서 저장소를 찾는다."""
+        value = os.environ.get("GH_REPO", "").strip()
+        parts = [part for part in value.split("/") if part]
+        if len(parts) < 2:
+            return None
+        return {"owner": parts[-2], "name": parts[-1]}
+
+    @staticmethod
+    def _resolve_repo_from_gh() -> Dict[str, str]:
+        """gh CLI로 저장소를 조회한다 (remote 파싱 실패 시 대체 수단)."""
+        raw = gh_transport.run_gh(["repo", "view", "--json", "owner,name"])
+        data = json.loads(raw)
+        return {"owner": data["owner"]["login"], "name": data["name"]}
+
+    def get_repo_info(self) -> Dict[str, str]:
+        """
+        저장소 owner/name 조회 (프로세스당 한 번만 계산)
+
+        Returns:
+            저장소 정보 딕셔너리 (owner, name)
+
+        Raises:
+            GitHubAPIError: GitHub 저장소를 찾을 수 없는 경우
+        """
+        if self._repo_info is None:
+            with self._lock:
+                if self._repo_info is None:
+                    self._repo_info = (
+                        self._resolve_repo_from_env()
+                        or self._resolve_repo_from_git_config()
+                        or self._resolve_repo_from_gh()
+                    )
+        return dict(self._repo_info)
+
+    def get_viewer_login(self) -> str:
+        """
+        인증된 사용자 로그인 조회 (프로세스당 한 번만 호출)
+
+        Returns:
+            사용자 로그인 이름
+
+        Raises:
+            GitHubAPIError: 사용자 정보를 조회할 수 없는 경우
+        """
+        if self._viewer_login is None:
+            with self._lock:
+                if self._viewer_login is None:
+                    transport = self._transport or gh_transport.get_transport()
+                    data = execute_graphql(transport, "query { viewer { login } }", {})
+                    login = ((data.get("data") or {}).get("viewer") or {}).get("login")
+                    if not login:
+                        raise GitHubAPIError("viewer 로그인을 조회할 수 없습니다.")
+                    self._viewer_login = login
+        return self._viewer_login
+
+
+# 프로세스 전역 식별 정보 조회 객체
+_resolver: Optional[IdentityResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_identity_resolver() -> IdentityResolver:
+    """프로세스 전역 IdentityResolver 조회 (최초 호출 시 생성)"""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = IdentityResolver()
+    return _resolver
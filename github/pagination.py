@@ -0,0 +1,115 @@
+"""GraphQL 커서 페이지네이션
+
+GraphQL connection(`nodes` + `pageInfo`)을 `endCursor`를 따라가며 노드 단위로
+스트리밍하는 제너레이터와, 노드 수 예산에 맞춰 중첩 connection의 페이지 크기를
+정하는 도우미를 제공합니다.
+"""
+
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from app.exceptions import GitHubAPIError
+
+# GitHub GraphQL connection의 first/last 최대값
+MAX_PAGE_SIZE = 100
+
+# 페이지가 너무 커서 실패했을 때 나타나는 에러 메시지 조각 (GraphQL 에러 type 포함)
+# 상태 코드(502/504)만으로는 판단하지 않음: 없는 PR, 권한 오류, 잘못된 쿼리도 같은 상태로 올 수 있음
+_COST_ERROR_MARKERS = (
+    "timeout",
+    "timed out",
+    "something went wrong",
+    "max_node_limit_exceeded",
+    "exceeds the maximum",
+    "resource limits",
+)
+
+FetchPage = Callable[[Optional[str], int], Dict[str, Any]]
+
+
+def is_cost_error(error: GitHubAPIError) -> bool:
+    """페이지 크기를 줄이면 성공할 수 있는 에러(타임아웃, 노드 제한 초과)인지 메시지로 판단"""
+    message = str(error).lower()
+    return any(marker in message for marker in _COST_ERROR_MARKERS)
+
+
+def plan_page_sizes(
+    node_budget: int,
+    outer_max: int = MAX_PAGE_SIZE,
+    inner_max: int = MAX_PAGE_SIZE
+) -> Tuple[int, int]:
+    """
+    중첩 connection(예: reviewThreads > comments)의 페이지 크기를 노드 예산에 맞춰 정한다.
+
+    한 페이지가 요청하는 노드 수는 outer * (1 + inner)이므로, 예산을 넘는 동안
+    더 큰 쪽을 절반으로 줄인다.
+
+    Args:
+        node_budget: 한 번의 쿼리에서 허용할 최대 노드 수
+        outer_max: 바깥 connection 페이지 크기 상한
+        inner_max: 안쪽 connection 페이지 크기 상한
+
+    Returns:
+        (outer, inner) 페이지 크기
+    """
+    outer = max(1, min(outer_max, MAX_PAGE_SIZE))
+    inner = max(1, min(inner_max, MAX_PAGE_SIZE))
+
+    while outer * (1 + inner) > node_budget and (outer > 1 or inner > 1):
+        if inner >= outer:
+            inner = max(1, inner // 2)
+        else:
+            outer = max(1, outer // 2)
+
+    return outer, inner
+
+
+def paginate(
+    fetch_page: FetchPage,
+    page_size: int,
+    first_connection: Optional[Dict[str, Any]] = None,
+    limit: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    connection을 endCursor를 따라가며 노드 단위로 yield한다.
+
+    페이지 요청이 타임아웃/노드 제한으로 실패하면 페이지 크기를 절반으로 줄여 재시도한다.
+
+    Args:
+        fetch_page: (after 커서, 페이지 크기)를 받아 connection 딕셔너리를 반환하는 함수
+        page_size: 페이지 크기
+        first_connection: 이미 받아온 첫 페이지 (있으면 그 다음 커서부터 요청)
+        limit: 최대 노드 수 (None이면 끝까지)
+
+    Yields:
+        connection의 각 노드
+    """
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    connection = first_connection
+    cursor = None
+    count = 0
+
+    while True:
+        if connection is None:
+            request_size = page_size if limit is None else min(page_size, limit - count)
+            try:
+                connection = fetch_page(cursor, request_size) or {}
+            except GitHubAPIError as e:
+                if page_size > 1 and is_cost_error(e):
+                    page_size = max(1, page_size // 2)
+                    continue
+                raise
+
+        for node in connection.get("nodes") or []:
+            if node is None:
+                continue
+            yield node
+            count += 1
+            if limit is not None and count >= limit:
+                return
+
+        page_info = connection.get("pageInfo") or {}
+        if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+            return
+
+        cursor = page_info["endCursor"]
+        connection = None
@@ -0,0 +1,333 @@
+"""GraphQL 사용량(rate limit) 집계와 적응형 조절
+
+모든 GraphQL 쿼리에 `rateLimit { cost remaining resetAt limit }`을 붙여 응답마다
+비용과 남은 예산을 프로세스 전역 RateLimitGovernor에 기록합니다.
+
+요청은 두 가지 우선순위로 나뉩니다.
+
+- interactive: 화면을 보고 있는 사용자의 요청 (기본값, 조절하지 않음)
+- bulk: 캐시 예열, 백그라운드 갱신, 실시간 갱신 poller 등 ("내가 리뷰한 PR" 스캔도 예열에서 호출되면 bulk)
+
+bulk 요청은 실행 중인 interactive 요청이 끝날 때까지 잠시 양보하고, 남은 예산이
+예비분(GITHUB_RATE_RESERVE) 아래로 내려가면 초기화 시각까지 남은 예산을 나눠 쓰도록
+간격을 벌리며, 하한(GITHUB_RATE_FLOOR) 아래에서는 초기화 시각까지 미룹니다(429 에러).
+"""
+
+import contextvars
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, ContextManager, Dict, Iterator, Optional
+
+from flask import current_app
+
+from app.exceptions import GitHubAPIError
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+RATE_LIMIT_FIELDS = """
+  rateLimit {
+    cost
+    remaining
+    resetAt
+    limit
+  }
+"""
+
+# 사용량 제한 에러로 보는 HTTP 상태 코드와 메시지 조각
+_RATE_LIMIT_STATUS = (429,)
+_RATE_LIMIT_MARKERS = ("rate limit", "rate_limited", "사용량 제한")
+
+# 초기화 시각을 모르는 상태에서 사용량 제한에 걸렸을 때 가정할 대기 시간 (초)
+_DEFAULT_COOLDOWN = 60
+
+_OPERATION_RE = re.compile(r"^\s*(query\b[^{]*)?\{")
+
+_priority: contextvars.ContextVar[str] = contextvars.ContextVar("github_priority", default=INTERACTIVE)
+
+
+def _config(key: str, default: Any) -> Any:
+    """애플리케이션 설정값 조회 (애플리케이션 컨텍스트 밖에서는 기본값 사용)"""
+    try:
+        if current_app:
+            return current_app.config.get(key, default)
+    except RuntimeError:
+        pass
+    return default
+
+
+def is_rate_limit_error(error: GitHubAPIError) -> bool:
+    """GitHub API 사용량 제한에 걸린 에러인지 판단"""
+    if error.status_code in _RATE_LIMIT_STATUS:
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in _RATE_LIMIT_MARKERS)
+
+
+def with_rate_limit(query: str) -> str:
+    """
+    쿼리의 최상위 선택에 rateLimit 필드 추가
+
+    mutation이나 이미 rateLimit을 요청하는 쿼리는 그대로 반환합니다.
+
+    Args:
+        query: GraphQL 쿼리
+
+    Returns:
+        rateLimit 필드가 추가된 쿼리
+    """
+    if "rateLimit" in query:
+        return query
+    match = _OPERATION_RE.match(query)
+    if match is None:
+        return query
+    return f"{query[:match.end()]}{RATE_LIMIT_FIELDS}{query[match.end():]}"
+
+
+def current_priority() -> str:
+    """현재 실행 중인 GitHub 요청의 우선순위"""
+    return _priority.get()
+
+
+@contextmanager
+def priority(value: str) -> Iterator[None]:
+    """
+    블록 안의 GitHub 요청 우선순위 지정
+
+    새 스레드는 우선순위를 물려받지 않으므로(기본값 interactive)
+    백그라운드 스레드는 작업 시작 시 직접 지정해야 합니다.
+
+    Args:
+        value: INTERACTIVE 또는 BULK
+    """
+    token = _priority.set(value)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def bulk() -> ContextManager[None]:
+    """블록 안의 GitHub 요청을 bulk 우선순위로 실행 (`with bulk():`)"""
+    return priority(BULK)
+
+
+def _parse_reset_at(value: Optional[str]) -> Optional[float]:
+    """resetAt(ISO 8601) → epoch 초"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class RateLimitGovernor:
+    """GraphQL 사용량을 집계하고 bulk 요청의 속도를 조절하는 클래스"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+        self._last_cost: Optional[int] = None
+        self._total_cost = 0
+        self._queries = 0
+        self._interactive_in_flight = 0
+        self._throttled = 0
+        self._deferred = 0
+        self._waited = 0.0
+        self._exhausted_at: Optional[float] = None
+
+    def _budget(self, now: float) -> Optional[tuple]:
+        """(limit, remaining, 초기화까지 남은 초) - 모르거나 초기화 시각이 지났으면 None (잠금 안에서 호출)"""
+        if self._remaining is None or self._reset_at is None or now >= self._reset_at:
+            return None
+        return self._limit or self._remaining, self._remaining, self._reset_at - now
+
+    def _bulk_delay(self, now: float) -> float:
+        """
+        bulk 요청 전 대기할 시간 (잠금 안에서 호출)
+
+        Returns:
+            대기 시간 (초)
+
+        Raises:
+            GitHubAPIError: 남은 예산이 하한 아래라 초기화 시각까지 미뤄야 하는 경우 (429)
+        """
+        budget = self._budget(now)
+        if budget is None:
+            return 0.0
+
+        limit, remaining, until_reset = budget
+        floor = limit * float(_config("GITHUB_RATE_FLOOR", 0.05))
+        reserve = limit * float(_config("GITHUB_RATE_RESERVE", 0.2))
+
+        if remaining <= floor:
+            self._deferred += 1
+            raise GitHubAPIError(
+                f"GitHub API 사용량 제한에 가까워 {int(until_reset)}초 뒤까지 백그라운드 조회를 미룹니다 "
+                f"(남은 예산 {remaining}/{limit})",
+                status_code=429
+            )
+
+        if remaining >= reserve:
+            return 0.0
+
+        # 초기화까지 하한 위의 예산을 고르게 나눠 씀
+        calls_left = max(1.0, (remaining - floor) / max(1, self._last_cost or 1))
+        return min(until_reset / calls_left, float(_config("GITHUB_RATE_MAX_DELAY", 10)))
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """
+        GraphQL 요청 한 건을 감싸서 우선순위에 따라 대기/연기하고 사용량 제한 에러를 기록
+
+        Raises:
+            GitHubAPIError: bulk 요청을 미뤄야 하는 경우 (429)
+        """
+        interactive = current_priority() != BULK
+        delay = 0.0
+
+        with self._lock:
+            if interactive:
+                self._interactive_in_flight += 1
+            else:
+                # 실행 중인 interactive 요청에 잠시 양보
+                self._idle.wait_for(
+                    lambda: self._interactive_in_flight == 0,
+                    timeout=float(_config("GITHUB_RATE_YIELD_TIMEOUT", 2))
+                )
+                delay = self._bulk_delay(time.time())
+                if delay > 0:
+                    self._throttled += 1
+                    self._waited += delay
+
+        if delay > 0:
+            time.sleep(delay)
+
+        try:
+            yield
+        except GitHubAPIError as e:
+            if is_rate_limit_error(e):
+                self.record_exhausted()
+            raise
+        finally:
+            if interactive:
+                with self._lock:
+                    self._interactive_in_flight -= 1
+                    self._idle.notify_all()
+
+    def record(self, rate_limit: Optional[Dict[str, Any]]) -> None:
+        """
+        응답의 rateLimit 필드 기록
+
+        Args:
+            rate_limit: {"cost", "remaining", "resetAt", "limit"} (없으면 무시)
+        """
+        if not rate_limit:
+            return
+
+        with self._lock:
+            self._queries += 1
+            cost = rate_limit.get("cost")
+            if cost is not None:
+                self._last_cost = cost
+                self._total_cost += cost
+            if rate_limit.get("limit") is not None:
+                self._limit = rate_limit["limit"]
+            if rate_limit.get("remaining") is not None:
+                self._remaining = rate_limit["remaining"]
+            reset_at = _parse_reset_at(rate_limit.get("resetAt"))
+            if reset_at is not None:
+                self._reset_at = reset_at
+
+    def record_exhausted(self) -> None:
+        """사용량 제한 에러 기록 (초기화 시각까지 남은 예산을 0으로 간주)"""
+        now = time.time()
+        with self._lock:
+            self._exhausted_at = now
+            self._remaining = 0
+            if self._reset_at is None or self._reset_at <= now:
+                self._reset_at = now + _DEFAULT_COOLDOWN
+
+    @property
+    def status(self) -> Dict[str, Any]:
+        """헬스체크용 상태"""
+        now = time.time()
+        with self._lock:
+            budget = self._budget(now)
+            if budget is None:
+                mode = "normal"
+            else:
+                limit, remaining, _ = budget
+                if remaining <= limit * float(_config("GITHUB_RATE_FLOOR", 0.05)):
+                    mode = "deferring"
+                elif remaining < limit * float(_config("GITHUB_RATE_RESERVE", 0.2)):
+                    mode = "throttled"
+                else:
+                    mode = "normal"
+
+            return {
+                "mode": mode,
+                "limit": self._limit,
+                "remaining": self._remaining,
+                "reset_at": self._reset_at,
+                "last_cost": self._last_cost,
+                "total_cost": self._total_cost,
+                "queries": self._queries,
+                "interactive_in_flight": self._interactive_in_flight,
+                "throttled": self._throttled,
+                "deferred": self._deferred,
+                "waited": round(self._waited, 2),
+                "exhausted_at": self._exhausted_at,
+            }
+
+
+# 프로세스 전역 인스턴스 (모든 GitHubAPI 인스턴스가 공유)
+_governor: Optional[RateLimitGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> RateLimitGovernor:
+    """프로세스 전역 RateLimitGovernor 인스턴스 반환"""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = RateLimitGovernor()
+        return _governor
+
+
+def execute_graphql(transport: Any, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    rateLimit 필드를 붙여 GraphQL 쿼리를 실행하고 비용과 남은 예산을 governor에 기록
+
+    현재 우선순위가 bulk이면 남은 예산에 따라 늦추거나 미룹니다.
+
+    Args:
+        transport: GraphQL 요청을 보낼 transport
+        query: GraphQL 쿼리
+        variables: 쿼리 변수
+
+    Returns:
+        응답 JSON (data.rateLimit은 제거됨)
+
+    Raises:
+        GitHubAPIError: 호출 실패 (사용량 제한이면 status_code 429)
+    """
+    governor = get_governor()
+    try:
+        with governor.track():
+            result = transport.graphql(with_rate_limit(query), variables)
+    except GitHubAPIError as e:
+        # 사용량 제한은 페이지 크기 축소 대상(is_cost_error)이 아니므로 429로 통일
+        if e.status_code != 429 and is_rate_limit_error(e):
+            raise GitHubAPIError(e.message, status_code=429) from e
+        raise
+
+    governor.record((result.get("data") or {}).pop("rateLimit", None))
+    return result
@@ -0,0 +1,385 @@
+"""GitHub API 전송 계층
+
+GitHubAPI의 GraphQL/REST 호출을 실제로 수행하는 전송 계층입니다.
+
+- GhCliTransport: 호출마다 `gh api` 프로세스를 실행 (기존 방식)
+- HttpTransport: 토큰을 한 번만 읽고 keep-alive HTTP 연결 풀을 재사용
+
+프로세스당 하나의 전송 객체를 공유하며(get_transport), 기본 URL을 설정으로
+바꿀 수 있어 테스트용 로컬 서버를 사용할 수 있습니다.
+"""
+
+import gzip
+import http.client
+import json
+import os
+import queue
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode, urlsplit
+
+from flask import current_app
+
+from app.exceptions import GitHubAPIError
+
+DEFAULT_API_URL = "https://api.github.com"
+
+# GraphQL 에러 type → HTTP 상태 코드 (없는 type은 gh CLI 전송과 같은 기본값 500)
+GRAPHQL_ERROR_STATUS = {
+    "NOT_FOUND": 404,
+    "FORBIDDEN": 403,
+    "RATE_LIMITED": 429,
+}
+
+
+def run_gh(args: List[str]) -> str:
+    """gh CLI를 호출하고 stdout을 문자열로 반환한다."""
+    try:
+        result = subprocess.run(
+            ["gh"] + args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except FileNotFoundError as e:
+        raise GitHubAPIError("gh CLI를 찾을 수 없습니다. GitHub CLI를 설치하세요.") from e
+
+    if result.returncode != 0:
+        error_msg = result.stderr.strip()
+        raise GitHubAPIError(f"gh CLI 오류: {error_msg}")
+
+    return result.stdout.strip()
+
+
+def resolve_token() -> Optional[str]:
+    """
+    GitHub 토큰 조회 (환경 변수 → `gh auth token` 순서)
+
+    Returns:
+        토큰 문자열 (찾지 못하면 None)
+    """
+    for env_name in ("GITHUB_TOKEN", "GH_TOKEN"):
+        token = os.environ.get(env_name, "").strip()
+        if token:
+            return token
+
+    try:
+        return run_gh(["auth", "token"]) or None
+    except GitHubAPIError:
+        return None
+
+
+class GhCliTransport:
+    """gh CLI 프로세스를 실행하는 전송 계층"""
+
+    name = "gh"
+
+    @staticmethod
+    def _field_args(fields: Dict[str, Any]) -> List[str]:
+        """필드 딕셔너리를 gh api의 -f/-F 인자로 변환 (문자열은 -f, 그 외는 -F)"""
+        args = []
+        for key, value in fields.items():
+            if isinstance(value, bool):
+                args.extend(["-F", f"{key}={str(value).lower()}"])
+            elif isinstance(value, (int, float)):
+                args.extend(["-F", f"{key}={value}"])
+            else:
+                args.extend(["-f", f"{key}={value}"])
+        return args
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """GraphQL 쿼리 실행"""
+        args = ["api", "graphql"]
+        args.extend(self._field_args(variables or {}))
+        args.extend(["-f", f"query={query}"])
+
+        raw = run_gh(args)
+        return json.loads(raw) if raw else {}
+
+    def rest(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """REST API 호출"""
+        if params:
+            path = f"{path}?{urlencode(params)}"
+
+        args = ["api", path, "-X", method.upper()]
+        for key, value in (headers or {}).items():
+            args.extend(["-H", f"{key}: {value}"])
+        args.extend(self._field_args(body or {}))
+
+        raw = run_gh(args)
+        return json.loads(raw) if raw else None
+
+    def close(self) -> None:
+        """정리할 리소스 없음"""
+
+
+class HttpTransport:
+    """keep-alive HTTP 연결 풀을 사용하는 전송 계층"""
+
+    name = "http"
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = DEFAULT_API_URL,
+        graphql_url: Optional[str] = None,
+        pool_size: int = 4,
+        timeout: float = 30.0
+    ):
+        """
+        Args:
+            token: GitHub 토큰
+            base_url: REST API 기본 URL (예: https://api.github.com)
+            graphql_url: GraphQL 엔드포인트 URL (None이면 base_url + "/graphql")
+            pool_size: 호스트당 유지할 유휴 연결 개수
+            timeout: 요청 타임아웃 (초)
+        """
+        self.token = token
+        self.base_url = base_url.rstrip("/")
+        self.graphql_url = graphql_url or f"{self.base_url}/graphql"
+        self.pool_size = max(1, pool_size)
+        self.timeout = timeout
+
+        self._pools: Dict[tuple, queue.LifoQueue] = {}
+        self._pools_lock = threading.Lock()
+
+    def _pool_for(self, scheme: str, netloc: str) -> queue.LifoQueue:
+        """(scheme, host) 별 유휴 연결 풀 조회"""
+        key = (scheme, netloc)
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = queue.LifoQueue(maxsize=self.pool_size)
+                self._pools[key] = pool
+            return pool
+
+    def _new_connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """새 연결 생성"""
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> tuple:
+        """
+        연결 풀에서 연결을 빌려 요청을 보내고 (상태 코드, 헤더, 본문)을 반환한다.
+
+        재사용한 연결이 서버 측에서 이미 닫힌 경우 새 연결로 한 번 재시도한다.
+        """
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        request_headers = {
+            "Authorization": f"bearer {self.token}",
+            "Accept": "application/vnd.github+json",
+            "Accept-Encoding": "gzip",
+            "User-Agent": "view-review",
+        }
+        if payload is not None:
+            request_headers["Content-Type"] = "application/json"
+        request_headers.update(headers or {})
+
+        pool = self._pool_for(parts.scheme, parts.netloc)
+
+        for attempt in range(2):
+            try:
+                conn = pool.get_nowait()
+                reused = True
+            except queue.Empty:
+                conn = self._new_connection(parts.scheme, parts.netloc)
+                reused = False
+
+            try:
+                conn.request(method, target, body=payload, headers=request_headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionError, http.client.BadStatusLine) as e:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise GitHubAPIError(f"GitHub API 연결 오류: {e}", status_code=502) from e
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise GitHubAPIError(f"GitHub API 연결 오류: {e}", status_code=502) from e
+
+            if response.will_close:
+                conn.close()
+            else:
+                try:
+                    pool.put_nowait(conn)
+                except queue.Full:
+                    conn.close()
+
+            if response.getheader("Content-Encoding") == "gzip":
+                data = gzip.decompress(data)
+
+            return response.status, dict(response.getheaders()), data
+
+        raise GitHubAPIError("GitHub API 연결 오류", status_code=502)
+
+    @staticmethod
+    def _decode(status: int, data: bytes) -> Any:
+        """응답 본문을 JSON으로 해석하고 HTTP 에러를 GitHubAPIError로 변환"""
+        try:
+            result = json.loads(data) if data else None
+        except ValueError:
+            result = None
+
+        if status >= 400:
+            message = ""
+            if isinstance(result, dict):
+                message = result.get("message", "")
+            raise GitHubAPIError(
+                f"GitHub API 오류 ({status}): {message or data[:200].decode(errors='replace')}",
+                status_code=status
+            )
+
+        return result
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """GraphQL 쿼리 실행"""
+        payload = json.dumps({"query": query, "variables": variables or {}}).encode()
+        status, _, data = self._request("POST", self.graphql_url, payload)
+        result = self._decode(status, data) or {}
+
+        # gh api graphql과 동일하게 errors가 있으면 실패로 처리
+        errors = result.get("errors")
+        if errors:
+            raise self._graphql_error(errors)
+
+        return result
+
+    @staticmethod
+    def _graphql_error(errors: List[Dict[str, Any]]) -> GitHubAPIError:
+        """
+        GraphQL errors를 GitHubAPIError로 변환
+
+        GraphQL 에러 응답의 HTTP 상태는 200이므로 첫 번째로 알려진 에러 type으로
+        상태 코드를 정하고(GRAPHQL_ERROR_STATUS), type은 메시지에도 남긴다.
+
+        Args:
+            errors: 응답의 errors 목록
+
+        Returns:
+            GitHubAPIError (알 수 없는 type이면 status_code 500)
+        """
+        types = [e.get("type") for e in errors if e.get("type")]
+        messages = "; ".join(e.get("message", "") for e in errors)
+        if types:
+            messages = f"{messages} ({', '.join(types)})"
+
+        status_code = next(
+            (GRAPHQL_ERROR_STATUS[error_type] for error_type in types if error_type in GRAPHQL_ERROR_STATUS),
+            500
+        )
+        return GitHubAPIError(f"GraphQL 오류: {messages}", status_code=status_code)
+
+    def rest(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """REST API 호출"""
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        if params:
+            url = f"{url}?{urlencode(params)}"
+
+        payload = json.dumps(body).encode() if body is not None else None
+        status, _, data = self._request(method.upper(), url, payload, headers)
+        return self._decode(status, data)
+
+    def close(self) -> None:
+        """유휴 연결 모두 닫기"""
+        with self._pools_lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+
+# 프로세스 전역 전송 객체
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def _config(key: str, default: Any) -> Any:
+    """애플리케이션 설정값 조회 (애플리케이션 컨텍스트 밖에서는 기본값 사용)"""
+    try:
+        if current_app:
+            return current_app.config.get(key, default)
+    except RuntimeError:
+        pass
+    return default
+
+
+def create_transport():
+    """
+    설정에 따라 전송 객체 생성
+
+    GITHUB_TRANSPORT:
+        "http": 토큰 기반 HTTP 전송 (토큰이 없으면 에러)
+        "gh": gh CLI 전송
+        "auto": 토큰을 찾으면 HTTP, 아니면 gh CLI (기본값)
+    """
+    mode = str(_config("GITHUB_TRANSPORT", "auto")).lower()
+
+    if mode == "gh":
+        return GhCliTransport()
+
+    token = resolve_token()
+    if not token:
+        if mode == "http":
+            raise GitHubAPIError(
+                "GitHub 토큰을 찾을 수 없습니다. GITHUB_TOKEN을 설정하거나 'gh auth login'을 실행하세요.",
+                status_code=401
+            )
+        return GhCliTransport()
+
+    return HttpTransport(
+        token=token,
+        base_url=_config("GITHUB_API_URL", DEFAULT_API_URL),
+        graphql_url=_config("GITHUB_GRAPHQL_URL", None),
+        pool_size=int(_config("GITHUB_HTTP_POOL_SIZE", 4)),
+        timeout=float(_config("GITHUB_HTTP_TIMEOUT", 30)),
+    )
+
+
+def get_transport():
+    """프로세스 전역 전송 객체 조회 (최초 호출 시 생성)"""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = create_transport()
+    return _transport
+
+
+def reset_transport() -> None:
+    """프로세스 전역 전송 객체 초기화 (설정 변경 후 재생성용)"""
+    global _transport
+    with _transport_lock:
+        if _transport is not None:
+            _transport.close()
+        _transport = None